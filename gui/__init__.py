@@ -2,10 +2,8 @@
 
 """
 Initializes the GUI package.
-"""
 
-# Import all necessary modules for easy access
-from .main_window import MainWindow
-from .circuit_builder import CircuitBuilder
-from .code_generator import CodeGenerator
-from .code_display_dialog import CodeDisplayDialog
+Modules are imported directly (e.g. `from gui.main_window import MainWindow`)
+rather than re-exported here, so that importing one widget does not load the
+others; the Gate Info tab in particular pulls in QtWebEngine.
+"""
@@ -7,22 +7,57 @@ Defines the CircuitBuilder class, which provides the interface for building quan
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QPushButton, QListWidget, QListWidgetItem,
     QMessageBox, QInputDialog, QGraphicsView, QGraphicsScene, QGraphicsPixmapItem,
-    QSplitter, QTextEdit, QSizePolicy
+    QSplitter, QPlainTextEdit, QSizePolicy, QCheckBox
 )
-from PyQt5.QtGui import QPixmap, QFont
-from PyQt5.QtCore import Qt, QRectF, pyqtSignal
+from PyQt5.QtGui import QPixmap, QImage, QFont
+from PyQt5.QtCore import Qt, QRectF, QTimer, QThreadPool, pyqtSignal
 from qiskit_aer import AerSimulator
 from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
-from qiskit.compiler import transpile
-from qiskit.visualization import plot_histogram
 from gui.code_generator import CodeGenerator
 from gui.code_display_dialog import CodeDisplayDialog
-from utils.qiskit_helpers import visualize_circuit, get_gate_matrix
-import matplotlib.pyplot as plt
-import os
+from gui.workers import Worker
+from utils.qiskit_helpers import (
+    standard_gate_matrix, apply_gate_matrix, basis_labels,
+    evolve_instructions, simulate_circuit, counts_to_arrays, format_amplitudes, TRACKING_DTYPE,
+    circuit_key, clear_result_caches, strip_simulator_directives,
+    MAX_UNITARY_QUBITS, MAX_DISPLAY_UNITARY_QUBITS
+)
+from utils.sv_kernels import HAVE_NUMBA, launch_kernel_threads, warm_kernels
+import pyqtgraph as pg
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+import sys
 import numpy as np
-import sympy as sp
-from qiskit.quantum_info import Operator, Statevector
+from collections import OrderedDict
+from qiskit.quantum_info import Operator
+
+# Maximum number of circuits whose statevector/unitary are kept in memory
+MATH_CACHE_SIZE = 64
+
+# Amplitudes below this magnitude are omitted from the state vector display
+# (above single-precision rounding noise, far below the two printed decimals)
+AMPLITUDE_TOLERANCE = 1e-6
+
+# Rows/columns kept at each edge of a truncated unitary
+UNITARY_EDGE_ITEMS = 4
+
+# Larger circuits only list their largest amplitudes
+MAX_FULL_STATE_QUBITS = 8
+STATE_TOP_K = 32
+
+# Width of the figure the circuit diagram is drawn into (inches); its height
+# follows the diagram
+DIAGRAM_WIDTH_INCHES = 12
+
+# Resolution of the diagram at Qiskit's nominal font size (dots per inch)
+DIAGRAM_DPI = 100
+
+# Inches per layout unit at which Qiskit's MPL drawer keeps its nominal font and
+# line sizes when drawing into given axes (see MatplotlibDrawer.draw)
+DIAGRAM_INCHES_PER_UNIT = 0.8361111 ** 2
+
+# Delay used to coalesce rapid edits into a single refresh (milliseconds)
+REFRESH_DELAY_MS = 30
 
 class CircuitBuilder(QWidget):
     """
@@ -32,8 +67,39 @@ class CircuitBuilder(QWidget):
     # Signal emitted when the circuit is updated
     circuit_updated = pyqtSignal()
 
+    # Signal emitted with non-blocking feedback for the status bar
+    status_message = pyqtSignal(str)
+
     def __init__(self):
         super().__init__()
+        # LRU caches keyed by the circuit's instruction list: (statevector, tracking)
+        # pairs, where tracking is False once a measurement froze the statevector,
+        # and unitaries
+        self._sv_cache = OrderedDict()
+        self._u_cache = OrderedDict()
+        # The simulator backend is created once and reused by every run
+        self._dm_backend = AerSimulator(method='density_matrix')
+        # Compile the Numba kernels in the background; tracking uses NumPy until then
+        if HAVE_NUMBA:
+            launch_kernel_threads()
+            QThreadPool.globalInstance().start(Worker(warm_kernels))
+        # Coalesces bursts of edits into a single redraw once the event loop idles
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self.refresh)
+        # Parts of the display that are out of date
+        self._diagram_dirty = True
+        self._math_dirty = True
+        # A diagram render is running in the thread pool / another one was requested
+        self._render_pending = False
+        self._render_again = False
+        # Text blocks of the math panel, combined into a single setPlainText
+        self._sv_text = ""
+        self._u_text = ""
+        self._probs_text = ""
+        # Incremented on every change to the circuit; never reset, so views can
+        # compare it against the version they last rendered
+        self.version = 0
         self.initUI()
         self.init_circuit()
         self.history = []
@@ -109,6 +175,12 @@ class CircuitBuilder(QWidget):
         self.visual_label.setFont(QFont("Arial", 14))
         right_layout.addWidget(self.visual_label)
 
+        # Persistent figure the circuit diagram is redrawn into; the axes fill it
+        # and render_circuit sizes it to each diagram
+        self._figure = Figure(figsize=(DIAGRAM_WIDTH_INCHES, DIAGRAM_WIDTH_INCHES / 3))
+        self._canvas = FigureCanvasAgg(self._figure)
+        self._ax = self._figure.add_axes([0, 0, 1, 1])
+
         # Graphics View for circuit diagram
         self.graphics_view = QGraphicsView()
         self.scene = QGraphicsScene()
@@ -122,22 +194,33 @@ class CircuitBuilder(QWidget):
         right_layout.addWidget(self.math_label)
 
         # Text Edit for mathematical equations
-        self.math_text = QTextEdit()
+        # Plain text skips the rich-text layout engine; matrices are not wrapped
+        self.math_text = QPlainTextEdit()
         self.math_text.setReadOnly(True)
+        self.math_text.setLineWrapMode(QPlainTextEdit.NoWrap)
         self.math_text.setFont(QFont("Courier", 12))
         self.math_text.setMinimumHeight(200)
         right_layout.addWidget(self.math_text)
 
+        # Opt-in for printing unitaries of large circuits
+        self.show_full_unitary_cb = QCheckBox("Show full unitary")
+        self.show_full_unitary_cb.toggled.connect(lambda: self.schedule_refresh(diagram=False))
+        right_layout.addWidget(self.show_full_unitary_cb)
+
         # Simulation Results
         self.sim_results_label = QLabel("Simulation Results:")
         self.sim_results_label.setFont(QFont("Arial", 14))
         right_layout.addWidget(self.sim_results_label)
 
-        # QLabel to display simulation histogram
-        self.results_view = QLabel()
-        self.results_view.setAlignment(Qt.AlignCenter)
+        # Plot widget to display the simulation histogram
+        self.results_view = pg.PlotWidget()
+        self.results_view.setBackground('w')
+        self.results_view.setMouseEnabled(x=False, y=False)
+        self.results_view.setLabel('left', 'Count')
         self.results_view.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         right_layout.addWidget(self.results_view)
+        # Shown (and reused) once the first simulation completes
+        self.results_view.hide()
 
         # Set initial sizes
         splitter.setSizes([300, 1100])
@@ -149,18 +232,66 @@ class CircuitBuilder(QWidget):
         self.qr = QuantumRegister(1, 'q')
         self.cr = ClassicalRegister(1, 'c')
         self.circuit = QuantumCircuit(self.qr, self.cr)
-        self.update_visualization()
+        self.version += 1
+        # Statevector and unitary of the circuit so far, updated gate by gate
+        self._state = np.array([1, 0], dtype=TRACKING_DTYPE)
+        self._unitary = np.eye(2, dtype=TRACKING_DTYPE)
+        # Cleared once a non-unitary instruction (measurement) is appended
+        self._tracking = True
+        self.schedule_refresh()
 
     def add_qubit(self):
         """
         Adds a new qubit to the circuit.
         """
         num_qubits = self.circuit.num_qubits
+        self.append_qubit()
+        self.schedule_refresh()
+        self.push_history(('qubit',))
+        self.show_status(f"Qubit {num_qubits} added to the circuit.")
+
+    def append_qubit(self):
+        """
+        Appends a qubit (and its classical bit) to the circuit without any dialogs.
+        """
+        num_qubits = self.circuit.num_qubits
         self.circuit.add_register(QuantumRegister(1, f'q{num_qubits}'))
         self.circuit.add_register(ClassicalRegister(1, f'c{num_qubits}'))
-        self.update_visualization()
-        self.push_history('Add Qubit')
-        QMessageBox.information(self, "Qubit Added", f"Qubit {num_qubits} added to the circuit.")
+        self.version += 1
+        if self._tracking and self._state is not None:
+            # The new qubit is the most significant one and starts in |0>
+            self._state = np.kron(np.array([1, 0], dtype=TRACKING_DTYPE), self._state)
+            if self._unitary is not None and self.tracks_unitary():
+                self._unitary = np.kron(np.eye(2, dtype=TRACKING_DTYPE), self._unitary)
+            else:
+                self._unitary = None
+
+    def tracks_unitary(self):
+        """
+        Returns whether the circuit is small enough for its unitary to be computed.
+
+        Returns:
+            bool: True if the circuit has at most MAX_UNITARY_QUBITS qubits.
+        """
+        return self.circuit.num_qubits <= MAX_UNITARY_QUBITS
+
+    def tracks_state(self):
+        """
+        Returns whether the statevector of the current circuit is tracked gate by gate.
+
+        Returns:
+            bool: False for measured circuits and while a full recomputation is pending.
+        """
+        return self._tracking and self._state is not None
+
+    def get_tracked_state(self):
+        """
+        Retrieves the tracked statevector of the current circuit.
+
+        Returns:
+            np.ndarray: The statevector, or None if tracks_state() is False.
+        """
+        return self._state if self.tracks_state() else None
 
     def add_gate(self):
         """
@@ -183,34 +314,88 @@ class CircuitBuilder(QWidget):
         if target_qubits is None:
             return
 
-        # Apply gate based on the type
+        # Apply gate based on the type, recording the action for undo/redo
+        start = len(self.circuit.data)
         try:
             if gate in ['H', 'X', 'Y', 'Z', 'S', 'T']:
-                self.apply_single_qubit_gate(gate, target_qubits)
+                record = ('gate', gate, tuple(target_qubits))
             elif gate in ['RX', 'RY', 'RZ']:
                 angle, ok = QInputDialog.getDouble(
                     self, f"{gate} Gate", f"Enter rotation angle for {gate} gate (in radians):", decimals=4
                 )
-                if ok:
-                    self.apply_rotation_gate(gate, target_qubits, angle)
+                if not ok:
+                    return
+                record = ('rot', gate, tuple(target_qubits), angle)
             elif gate in ['CX', 'CY', 'CZ', 'Swap', 'CCX']:
                 control_qubits = self.get_qubits(f"Select control qubit(s) for {gate} gate")
                 if control_qubits is None:
                     return
-                self.apply_multi_qubit_gate(gate, control_qubits, target_qubits)
+                record = ('multi', gate, tuple(control_qubits), tuple(target_qubits))
             elif gate == 'Measure':
-                # Save the state vector before measurement
-                self.circuit.save_statevector()
-                self.circuit.measure_all()
+                record = ('measure', gate)
             else:
                 QMessageBox.warning(self, "Unknown Gate", f"The gate '{gate}' is not recognized.")
+                return
+            self.apply_record(record)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to add gate:\n{e}")
             return
 
-        self.update_visualization()
-        self.push_history(f"Add Gate: {gate}")
-        QMessageBox.information(self, "Gate Added", f"{gate} gate added to the circuit.")
+        if len(self.circuit.data) == start:
+            # Nothing was appended
+            return
+
+        self.schedule_refresh()
+        self.push_history(record)
+        self.show_status(f"{gate} gate added to the circuit.")
+
+    def apply_measurement(self):
+        """
+        Saves the state vector and measures all qubits.
+        """
+        start = len(self.circuit.data)
+        # Save the state vector before measurement
+        self.circuit.save_statevector()
+        self.circuit.measure_all()
+        self.track_instructions(start)
+
+    def apply_record(self, record):
+        """
+        Applies a recorded action to the circuit without prompting the user.
+
+        Args:
+            record (tuple): The action, e.g. ('qubit',), ('gate', 'H', (0,)),
+                ('rot', 'RX', (0,), angle), ('multi', 'CX', (0,), (1,)) or ('measure', 'Measure').
+        """
+        op = record[0]
+        if op == 'qubit':
+            self.append_qubit()
+        elif op == 'gate':
+            self.apply_single_qubit_gate(record[1], record[2])
+        elif op == 'rot':
+            self.apply_rotation_gate(record[1], record[2], record[3])
+        elif op == 'multi':
+            self.apply_multi_qubit_gate(record[1], record[2], record[3])
+        elif op == 'measure':
+            self.apply_measurement()
+
+    @staticmethod
+    def describe_record(record):
+        """
+        Returns a readable description of a recorded action.
+        """
+        if record[0] == 'qubit':
+            return "Add Qubit"
+        return f"Add Gate: {record[1]}"
+
+    def show_status(self, message):
+        """
+        Reports feedback without blocking, via the status_message signal.
+
+        Args:
+            message (str): The message to display.
+        """
+        self.status_message.emit(message)
 
     def get_qubits(self, prompt):
         """
@@ -238,6 +423,7 @@ class CircuitBuilder(QWidget):
             targets (list): List of target qubit indices.
         """
         target = targets[0]
+        start = len(self.circuit.data)
         if gate == 'H':
             self.circuit.h(target)
         elif gate == 'X':
@@ -250,6 +436,7 @@ class CircuitBuilder(QWidget):
             self.circuit.s(target)
         elif gate == 'T':
             self.circuit.t(target)
+        self.track_instructions(start)
 
     def apply_rotation_gate(self, gate, targets, angle):
         """
@@ -261,12 +448,14 @@ class CircuitBuilder(QWidget):
             angle (float): Rotation angle in radians.
         """
         target = targets[0]
+        start = len(self.circuit.data)
         if gate == 'RX':
             self.circuit.rx(angle, target)
         elif gate == 'RY':
             self.circuit.ry(angle, target)
         elif gate == 'RZ':
             self.circuit.rz(angle, target)
+        self.track_instructions(start)
 
     def apply_multi_qubit_gate(self, gate, controls, targets):
         """
@@ -279,6 +468,7 @@ class CircuitBuilder(QWidget):
         """
         control = controls[0]
         target = targets[0]
+        start = len(self.circuit.data)
         if gate == 'CX':
             self.circuit.cx(control, target)
         elif gate == 'CY':
@@ -290,72 +480,237 @@ class CircuitBuilder(QWidget):
         elif gate == 'CCX':
             # For CCX, require two control qubits
             if len(controls) < 2:
-                QMessageBox.warning(self, "Insufficient Controls", "CCX gate requires two control qubits.")
-                return
+                # Raised rather than shown so replays never open dialogs; add_gate reports it
+                raise ValueError("CCX gate requires two control qubits.")
             second_control = controls[1]
             self.circuit.ccx(control, second_control, target)
+        self.track_instructions(start)
+
+    def track_instructions(self, start):
+        """
+        Applies the instructions appended since `start` to the tracked statevector and unitary.
+
+        Only the target qubit axes are contracted, so each gate costs O(2^n) on the
+        statevector instead of re-simulating the whole circuit.
+
+        Args:
+            start (int): Index of the first new instruction in the circuit data.
+        """
+        self.version += 1
+        if not self._tracking or self._state is None:
+            # Measured circuit, or a full recomputation is pending (see resync_math)
+            return
+        self._state, self._unitary, self._tracking = evolve_instructions(
+            self.circuit, self._state, self._unitary, start
+        )
+
+    def resync_math(self):
+        """
+        Recomputes the tracked statevector and unitary for the whole circuit.
+
+        Cached results are restored immediately; otherwise the computation runs
+        in a worker thread and the math panel shows a placeholder until it is done.
+        """
+        key = self.circuit_key()
+        entry = self._cache_get(self._sv_cache, key)
+        unitary = self._cache_get(self._u_cache, key)
+        if entry is not None:
+            state, tracking = entry
+            # Measured circuits have no unitary to wait for
+            if unitary is not None or not tracking or not self.tracks_unitary():
+                self._state, self._unitary, self._tracking = state, unitary, tracking
+                self.schedule_refresh(diagram=False)
+                return
+
+        self._state, self._unitary, self._tracking = None, None, True
+        worker = Worker(self.compute_math, key, self.circuit.copy(), self.tracks_unitary())
+        worker.signals.finished.connect(self.on_math_computed)
+        worker.signals.error.connect(
+            lambda message: self.math_text.setPlainText(f"Error displaying mathematical representations:\n{message}")
+        )
+        QThreadPool.globalInstance().start(worker)
+
+    @staticmethod
+    def compute_math(key, circuit, with_unitary):
+        """
+        Computes the statevector and unitary of a circuit. Called from a worker thread.
+
+        Returns:
+            tuple: (key, state, unitary, complete).
+        """
+        return (key,) + simulate_circuit(circuit, with_unitary)
+
+    def on_math_computed(self, result):
+        """
+        Installs the statevector and unitary computed by a worker.
+
+        Results for a circuit that has changed since are discarded and recomputed.
+
+        Args:
+            result (tuple): (key, state, unitary, complete) from compute_math.
+        """
+        key, state, unitary, complete = result
+        if self._state is not None:
+            # Already restored from the cache by a later resync
+            return
+        if key != self.circuit_key():
+            self.resync_math()
+            return
+        self._state, self._unitary, self._tracking = state, unitary, complete
+        self.schedule_refresh(diagram=False)
+
+    def schedule_refresh(self, diagram=True, math=True):
+        """
+        Schedules a refresh, restarting the delay on each call.
+
+        Args:
+            diagram (bool): Whether the circuit diagram needs redrawing.
+            math (bool): Whether the mathematical representations need updating.
+        """
+        self._diagram_dirty = self._diagram_dirty or diagram
+        self._math_dirty = self._math_dirty or math
+        self._refresh_timer.start(REFRESH_DELAY_MS)
+
+    def refresh(self):
+        """
+        Redraws only the parts marked dirty since the last refresh.
+        """
+        if self._diagram_dirty:
+            self._diagram_dirty = False
+            self.draw_circuit()
+        if self._math_dirty:
+            self._math_dirty = False
+            self.update_math_display()
 
     def update_visualization(self):
         """
-        Updates the circuit visualization and mathematical representations.
+        Updates the circuit visualization and mathematical representations immediately.
+        """
+        self._refresh_timer.stop()
+        self._diagram_dirty = True
+        self._math_dirty = True
+        self.refresh()
+
+    def draw_circuit(self):
+        """
+        Redraws the circuit diagram in a worker thread.
+
+        Only one render runs at a time (they share the persistent figure); a request
+        made while one is in flight is served once it finishes.
+        """
+        if self._render_pending:
+            self._render_again = True
+            return
+        self._render_pending = True
+        worker = Worker(self.render_circuit, self.circuit.copy())
+        worker.signals.finished.connect(self.on_circuit_rendered)
+        worker.signals.error.connect(self.on_circuit_render_failed)
+        QThreadPool.globalInstance().start(worker)
+
+    def render_circuit(self, circuit):
+        """
+        Renders a circuit diagram to an image. Called from a worker thread.
+
+        Args:
+            circuit (QuantumCircuit): A copy of the circuit to draw.
+
+        Returns:
+            QImage: The rendered diagram.
+        """
+        # Use Qiskit's MPL drawer to redraw the circuit into the persistent axes
+        self._ax.clear()
+        circuit.draw(output='mpl', fold=90, ax=self._ax)
+        # The drawer fits the diagram to the width of the axes, scaling its fonts
+        # and lines to match. Crop the figure to the diagram's aspect ratio and
+        # pick the DPI that undoes that scaling, so that wide circuits are not
+        # squeezed and small ones are not blown up
+        (x_min, x_max), (y_min, y_max) = self._ax.get_xlim(), self._ax.get_ylim()
+        width = self._figure.get_figwidth()
+        self._figure.set_size_inches(width, width * (y_max - y_min) / (x_max - x_min))
+        scale = width / ((x_max - x_min) * DIAGRAM_INCHES_PER_UNIT)
+        self._figure.set_dpi(DIAGRAM_DPI / scale)
+        self._canvas.draw()
+
+        # Wrap the rendered RGBA buffer directly, without encoding an image file
+        width, height = self._canvas.get_width_height()
+        buffer = np.asarray(self._canvas.buffer_rgba())
+        return QImage(buffer.data, width, height, 4 * width, QImage.Format_RGBA8888).copy()
+
+    def on_circuit_rendered(self, image):
+        """
+        Displays a diagram rendered by the worker.
+
+        Args:
+            image (QImage): The rendered diagram.
         """
+        self._render_pending = False
+        if self._render_again:
+            # The circuit changed while rendering; this image is already stale
+            self._render_again = False
+            self.draw_circuit()
+            return
+
         # Clear the scene
         self.scene.clear()
 
-        # Use Qiskit's MPL drawer to get the circuit image
-        figure = self.circuit.draw(output='mpl', fold=90)
-        image_path = "circuit_diagram.png"
-        figure.savefig(image_path)
-        plt.close(figure)
-
         # Display the image in the QGraphicsView
-        pixmap = QPixmap(image_path)
+        pixmap = QPixmap.fromImage(image)
         pixmap_item = QGraphicsPixmapItem(pixmap)
         self.scene.addItem(pixmap_item)
         
         # Convert QRect to QRectF to match setSceneRect's expected type
         self.scene.setSceneRect(QRectF(pixmap.rect()))
 
-        # Remove the temporary image file
-        os.remove(image_path)
+    def on_circuit_render_failed(self, message):
+        """
+        Reports a diagram render that raised in the worker thread.
 
-        # Update mathematical representations
-        self.update_math_display()
+        Args:
+            message (str): The error message.
+        """
+        self._render_pending = False
+        self._render_again = False
+        self.show_status(f"Failed to draw the circuit: {message}")
 
     def update_math_display(self):
         """
         Updates the mathematical representations of the quantum circuit.
         """
+        if self._state is None:
+            self.math_text.setPlainText("Computing...")
+            return
         try:
-            # Get the saved state vector
-            backend = AerSimulator(method='statevector')
-            transpiled_circuit = transpile(self.circuit, backend)
-            job = backend.run(transpiled_circuit)
-            result = job.result()
-            # 'statevector' is saved via save_statevector()
-            state_vector = result.data(0).get('statevector')
-
-            if state_vector is None:
-                raise ValueError("No statevector available for the current circuit.")
+            # Statevector tracked gate by gate (the one saved before any measurement)
+            state_vector = self._state
+            # Snapshot the tracked state so undo can restore it without recomputing
+            key = self.circuit_key()
+            self._cache_put(self._sv_cache, key, (state_vector, self._tracking))
+            if self._unitary is not None:
+                self._cache_put(self._u_cache, key, self._unitary)
 
             # Convert state vector to a readable format
             state_vector_str = self.state_vector_to_string(state_vector)
 
-            # Get the overall unitary matrix
-            unitary = self.get_unitary()
-            if unitary is not None:
-                unitary_str = self.unitary_to_string(unitary)
+            # Get the overall unitary matrix, unless it is too large to be readable
+            num_qubits = self.circuit.num_qubits
+            if not self.tracks_unitary():
+                unitary_str = f"(not computed for more than {MAX_UNITARY_QUBITS} qubits)"
             else:
-                unitary_str = "Unitary matrix not available for this circuit."
-
-            # Combine into a comprehensive mathematical display
-            math_content = f"<h3>State Vector:</h3><pre>{state_vector_str}</pre>"
-            math_content += f"<h3>Unitary Matrix:</h3><pre>{unitary_str}</pre>"
-
-            self.math_text.setHtml(math_content)
+                unitary = self.get_unitary()
+                if unitary is not None:
+                    unitary_str = self.unitary_to_string(unitary, self.show_full_unitary_cb.isChecked())
+                else:
+                    unitary_str = "Unitary matrix not available for this circuit."
+
+            # Combine into a comprehensive mathematical display; probabilities of an
+            # earlier simulation no longer apply
+            self._sv_text = f"State Vector:\n{state_vector_str}\n"
+            self._u_text = f"Unitary Matrix:\n{unitary_str}\n"
+            self._probs_text = ""
+            self.render_math_text()
             self.circuit_updated.emit()
         except Exception as e:
-            self.math_text.setText(f"Error displaying mathematical representations:\n{e}")
+            self.math_text.setPlainText(f"Error displaying mathematical representations:\n{e}")
 
     def state_vector_to_string(self, state_vector):
         """
@@ -367,28 +722,48 @@ class CircuitBuilder(QWidget):
         Returns:
             str: Readable string representation of the state vector.
         """
-        num_qubits = self.circuit.num_qubits
-        basis_states = [f"|{i:0{num_qubits}b}>" for i in range(2**num_qubits)]
-        state_str = ""
-        for state, amplitude in zip(basis_states, state_vector):
-            state_str += f"{amplitude:.2f} |{state[1:-1]}>\n"
-        return state_str
-
-    def unitary_to_string(self, unitary_matrix):
+        labels = basis_labels(self.circuit.num_qubits)
+        amplitudes = np.asarray(state_vector)
+        # Only basis states with a non-negligible amplitude are listed
+        magnitudes = np.abs(amplitudes)
+        support = np.flatnonzero(magnitudes > AMPLITUDE_TOLERANCE)
+        omitted = 0
+        if self.circuit.num_qubits > MAX_FULL_STATE_QUBITS and len(support) > STATE_TOP_K:
+            # Keep only the largest amplitudes, still listed in basis order
+            top = np.argpartition(magnitudes[support], -STATE_TOP_K)[-STATE_TOP_K:]
+            omitted = len(support) - STATE_TOP_K
+            support = np.sort(support[top])
+        amplitudes = amplitudes[support]
+        # Format all amplitudes in one vectorized pass ('a+bj |x>' per line)
+        lines = np.char.add(np.char.add(format_amplitudes(amplitudes), " "), labels[support])
+        lines = np.char.add(lines, "\n")
+        text = "".join(lines.tolist())
+        if omitted:
+            text += f"... ({omitted} smaller amplitudes omitted)\n"
+        return text
+
+    def unitary_to_string(self, unitary_matrix, full=False):
         """
         Converts the unitary matrix to a readable string format.
 
         Args:
             unitary_matrix (numpy.ndarray): The unitary matrix of the circuit.
+            full (bool): Whether to print every element; otherwise matrices larger than
+                MAX_DISPLAY_UNITARY_QUBITS qubits only show their corners.
 
         Returns:
             str: Readable string representation of the unitary matrix.
         """
-        unitary_str = ""
-        for row in unitary_matrix:
-            row_str = "  ".join([f"{elem.real:.2f}+{elem.imag:.2f}j" for elem in row])
-            unitary_str += f"{row_str}\n"
-        return unitary_str
+        # Truncated matrices only format the visible corners
+        threshold = sys.maxsize if full else 4**MAX_DISPLAY_UNITARY_QUBITS
+        return np.array2string(
+            np.asarray(unitary_matrix),
+            separator='  ',
+            max_line_width=sys.maxsize,
+            threshold=threshold,
+            edgeitems=UNITARY_EDGE_ITEMS,
+            formatter={'complex_kind': lambda z: f"{z.real:.2f}{z.imag:+.2f}j"},
+        )
 
     def get_unitary(self):
         """
@@ -397,11 +772,59 @@ class CircuitBuilder(QWidget):
         Returns:
             np.ndarray: The unitary matrix.
         """
+        if self._unitary is not None:
+            return self._unitary
+        if not self.tracks_unitary():
+            return None
+        key = self.circuit_key()
+        unitary = self._cache_get(self._u_cache, key)
+        if unitary is not None:
+            return unitary
         try:
             operator = Operator(self.circuit)
-            return operator.data
         except Exception:
             return None
+        unitary = operator.data.astype(TRACKING_DTYPE)
+        self._cache_put(self._u_cache, key, unitary)
+        return unitary
+
+    def circuit_key(self):
+        """
+        Builds a hashable key describing the current circuit's instructions.
+
+        Returns:
+            tuple: The qubit count followed by (name, qubits, params) for each instruction.
+        """
+        return circuit_key(self.circuit)
+
+    @staticmethod
+    def _cache_get(cache, key):
+        """
+        Looks up a key in an LRU cache, marking it as most recently used.
+
+        Returns:
+            The cached value, or None on a miss.
+        """
+        try:
+            value = cache[key]
+        except (KeyError, TypeError):
+            return None
+        cache.move_to_end(key)
+        return value
+
+    @staticmethod
+    def _cache_put(cache, key, value):
+        """
+        Stores a value in an LRU cache, evicting the oldest entry when full.
+        """
+        try:
+            cache[key] = value
+        except TypeError:
+            # Unhashable parameters (should not happen for the built-in gates)
+            return
+        cache.move_to_end(key)
+        if len(cache) > MATH_CACHE_SIZE:
+            cache.popitem(last=False)
 
     def generate_code(self):
         """
@@ -414,78 +837,114 @@ class CircuitBuilder(QWidget):
 
     def run_simulation(self):
         """
-        Runs the simulation of the circuit and displays the results.
+        Runs the simulation of the circuit in a worker thread.
+
+        The results are displayed by on_simulation_finished once the worker is done.
+        """
+        # The builder's gates are all native to Aer, so the circuit is not
+        # transpiled. Measuring inserts save_statevector, which only the
+        # statevector method accepts, so the density-matrix run gets a copy
+        # without it
+        circuit = strip_simulator_directives(self.circuit)
+
+        # Disable the button until the pending simulation reports back
+        self.run_simulation_btn.setEnabled(False)
+        # The bitstring width is taken now, since the circuit may be edited while
+        # the simulation runs
+        worker = Worker(self.simulate, self._dm_backend, circuit, circuit.num_clbits)
+        worker.signals.finished.connect(self.on_simulation_finished)
+        worker.signals.error.connect(self.on_simulation_failed)
+        QThreadPool.globalInstance().start(worker)
+
+    @staticmethod
+    def simulate(simulator_measure, circuit, num_bits):
+        """
+        Runs the measurement simulation of the circuit. Called from a worker thread.
+
+        The statevector shown in the math panel is tracked incrementally, so no
+        separate statevector job is run.
+
+        Returns:
+            tuple: (counts, num_bits), the measurement counts and the number of
+                classical bits of the simulated circuit.
+        """
+        return simulator_measure.run(circuit).result().get_counts(), num_bits
+
+    def on_simulation_finished(self, result):
+        """
+        Displays the results of a finished simulation.
+
+        Args:
+            result (tuple): (counts, num_bits) from simulate.
         """
+        self.run_simulation_btn.setEnabled(True)
         try:
-            # Simulate the circuit to get the state vector
-            simulator = AerSimulator(method='statevector')
-            transpiled_circuit = transpile(self.circuit, simulator)
-            job = simulator.run(transpiled_circuit)
-            result = job.result()
-            state_vector = result.get_statevector()
-
-            # Simulate measurements
-            simulator_measure = AerSimulator(method='density_matrix')
-            transpiled_circuit_measure = transpile(self.circuit, simulator_measure)
-            job_measure = simulator_measure.run(transpiled_circuit_measure)
-            result_measure = job_measure.result()
-            counts = result_measure.get_counts()
-
-            # Plot the histogram
-            figure = plot_histogram(counts)
-            image_path = "simulation_results.png"
-            figure.savefig(image_path)
-            plt.close(figure)
-
-            # Display the image
-            pixmap = QPixmap(image_path)
-            self.results_view.setPixmap(pixmap)
-            self.results_view.setAlignment(Qt.AlignCenter)
-            self.results_view.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-
-            # Remove the temporary image file
-            os.remove(image_path)
+            counts, num_bits = result
+            outcomes, shots = counts_to_arrays(counts)
+            labels = [format(outcome, f'0{num_bits}b') for outcome in outcomes.tolist()]
+
+            # Plot the histogram as bars labelled with the measured bitstrings
+            xs = np.arange(len(labels))
+            ys = shots.astype(float)
+            self.results_view.clear()
+            self.results_view.addItem(pg.BarGraphItem(x=xs, height=ys, width=0.8, brush='#6FA6D6'))
+            self.results_view.getAxis('bottom').setTicks([list(zip(xs.tolist(), labels))])
+            self.results_view.show()
 
             # Update mathematical representations with measurement probabilities
-            self.update_simulation_math(counts)
+            self.update_simulation_math(labels, shots)
 
-            self.push_history('Run Simulation')
-            QMessageBox.information(self, "Simulation Completed", "The simulation has been successfully run.")
+            self.show_status("The simulation has been successfully run.")
         except Exception as e:
             QMessageBox.critical(self, "Simulation Error", f"Failed to run simulation:\n{e}")
 
-    def update_simulation_math(self, counts):
+    def on_simulation_failed(self, message):
+        """
+        Reports a simulation that raised in the worker thread.
+
+        Args:
+            message (str): The error message.
+        """
+        self.run_simulation_btn.setEnabled(True)
+        QMessageBox.critical(self, "Simulation Error", f"Failed to run simulation:\n{message}")
+
+    def update_simulation_math(self, labels, shots):
         """
         Updates the mathematical display with simulation results.
 
         Args:
-            counts (dict): Measurement results.
+            labels (list): Measured bitstrings, sorted by outcome.
+            shots (numpy.ndarray): Number of shots for each outcome.
         """
         try:
-            # Calculate probabilities
-            total_shots = sum(counts.values())
-            probabilities = {k: v / total_shots for k, v in counts.items()}
+            # Calculate probabilities in one vectorized division
+            probabilities = shots / shots.sum()
 
             # Convert probabilities to readable string
-            probs_str = ""
-            for state, prob in probabilities.items():
-                probs_str += f"P({state}) = {prob:.2f}\n"
+            probs_str = "".join(
+                f"P({state}) = {prob:.2f}\n" for state, prob in zip(labels, probabilities.tolist())
+            )
 
             # Update mathematical display
-            math_content = self.math_text.toHtml()
-            math_content += f"<h3>Measurement Probabilities:</h3><pre>{probs_str}</pre>"
-            self.math_text.setHtml(math_content)
+            self._probs_text = f"\nMeasurement Probabilities:\n{probs_str}"
+            self.render_math_text()
         except Exception as e:
-            self.math_text.setText(f"Error updating simulation mathematics:\n{e}")
+            self.math_text.setPlainText(f"Error updating simulation mathematics:\n{e}")
 
-    def push_history(self, action):
+    def render_math_text(self):
+        """
+        Shows the state vector, unitary and probability blocks with a single setPlainText.
+        """
+        self.math_text.setPlainText(self._sv_text + self._u_text + self._probs_text)
+
+    def push_history(self, record):
         """
         Pushes an action to the history stack for undo functionality.
 
         Args:
-            action (str): Description of the action.
+            record (tuple): The structured action (see apply_record).
         """
-        self.history.append(action)
+        self.history.append(record)
         self.redo_stack.clear()
 
     def undo_action(self):
@@ -493,55 +952,103 @@ class CircuitBuilder(QWidget):
         Undoes the last action.
         """
         if not self.history:
-            QMessageBox.information(self, "Undo", "No actions to undo.")
+            self.show_status("No actions to undo.")
             return
 
         last_action = self.history.pop()
         self.redo_stack.append(last_action)
 
-        # For simplicity, clear the circuit and rebuild it without the last action
-        self.rebuild_circuit()
-        QMessageBox.information(self, "Undo", f"Undid action: {last_action}")
+        # Gates can be reverted in place; anything else rebuilds the circuit
+        if not self.revert_last_gate(last_action):
+            self.rebuild_circuit()
+        self.show_status(f"Undid action: {self.describe_record(last_action)}")
+
+    def revert_last_gate(self, record):
+        """
+        Removes the last gate from the circuit and reverts the tracked state.
+
+        The previous statevector/unitary are taken from the cache when available,
+        otherwise the inverse of the gate is applied.
+
+        Args:
+            record (tuple): The action being undone.
+
+        Returns:
+            bool: True if the gate was reverted, False if a rebuild is needed.
+        """
+        if record[0] not in ('gate', 'rot', 'multi') or not self._tracking or self._state is None:
+            return False
+        if not self.circuit.data:
+            return False
+
+        instr = self.circuit.data[-1]
+        qubits = [self.circuit.find_bit(q).index for q in instr.qubits]
+        matrix = standard_gate_matrix(instr.operation.name, tuple(instr.operation.params))
+        del self.circuit.data[-1]
+        self.version += 1
+
+        key = self.circuit_key()
+        # Removing a gate from a tracked circuit leaves a tracked circuit, so the
+        # cached flag is True here
+        entry = self._cache_get(self._sv_cache, key)
+        state = entry[0] if entry is not None else None
+        unitary = self._cache_get(self._u_cache, key)
+        if state is None or (unitary is None and self._unitary is not None):
+            num_qubits = self.circuit.num_qubits
+            inverse = matrix.conj().T
+            state = apply_gate_matrix(self._state, inverse, qubits, num_qubits)
+            if self._unitary is not None:
+                unitary = apply_gate_matrix(self._unitary, inverse, qubits, num_qubits)
+        self._state = state
+        self._unitary = unitary
+        self.schedule_refresh()
+        return True
 
     def redo_action(self):
         """
         Redoes the last undone action.
         """
         if not self.redo_stack:
-            QMessageBox.information(self, "Redo", "No actions to redo.")
+            self.show_status("No actions to redo.")
             return
 
         action = self.redo_stack.pop()
         self.history.append(action)
 
         # Reapply the action
-        # Note: Implementing redo functionality requires tracking detailed actions
-        # For simplicity, this example does not implement it fully
-        QMessageBox.information(self, "Redo", f"Redid action: {action}")
-        self.rebuild_circuit()
+        self.apply_record(action)
+        self.schedule_refresh()
+        self.show_status(f"Redid action: {self.describe_record(action)}")
 
     def rebuild_circuit(self):
         """
         Rebuilds the circuit based on the current history.
         """
-        self.init_circuit()
-        for action in self.history:
-            if action.startswith("Add Qubit"):
-                self.add_qubit()
-            elif action.startswith("Add Gate:"):
-                gate = action.split(": ")[1]
-                # Re-select the gate and add it
-                index = self.gate_list.findItems(gate, Qt.MatchExactly)
-                if index:
-                    self.gate_list.setCurrentRow(index[0].row())
-                    self.add_gate()
-        self.update_visualization()
+        # Hold back repaints of the math panel until the rebuilt circuit is shown
+        self.math_text.setUpdatesEnabled(False)
+        try:
+            self.init_circuit()
+            # Replay the circuit only; its statevector/unitary are computed once at the end
+            self._state = None
+            for record in self.history:
+                self.apply_record(record)
+            self.resync_math()
+            # Drop the refreshes scheduled while replaying and draw once
+            self.update_visualization()
+        finally:
+            self.math_text.setUpdatesEnabled(True)
 
     def clear_circuit(self):
         """
         Clears the current circuit and resets it.
         """
         self.init_circuit()
-        self.update_visualization()
+        self.history.clear()
+        self.redo_stack.clear()
+        # Snapshots of the previous circuit are no longer reachable by undo
+        self._sv_cache.clear()
+        self._u_cache.clear()
+        clear_result_caches()
+        self._sv_text = self._u_text = self._probs_text = ""
         self.math_text.clear()
-        QMessageBox.information(self, "Circuit Cleared", "The circuit has been cleared.")
+        self.show_status("The circuit has been cleared.")
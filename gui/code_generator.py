@@ -4,7 +4,10 @@
 Defines the CodeGenerator class, which generates Qiskit code from a QuantumCircuit object.
 """
 
-from qiskit import QuantumCircuit
+import base64
+import io
+from qiskit import QuantumCircuit, qpy
+from utils.qiskit_helpers import strip_simulator_directives
 
 class CodeGenerator:
     """
@@ -21,25 +24,30 @@ class CodeGenerator:
         Returns:
             str: The generated Qiskit code.
         """
-        qasm_str = self.circuit.qasm()
+        qpy_blob = self.serialize_circuit()
         code = f"""# Generated Qiskit Code
 
-from qiskit import QuantumCircuit, AerSimulator, transpile
+import base64
+import io
+from qiskit import QuantumCircuit, qpy, transpile
+from qiskit_aer import AerSimulator
 from qiskit.quantum_info import Statevector, Operator
 from qiskit.visualization import plot_histogram, plot_state_city
 import matplotlib.pyplot as plt
 
-# Reconstruct the circuit from QASM
-qasm_str = \"\"\"{qasm_str}\"\"\"
-qc = QuantumCircuit.from_qasm_str(qasm_str)
+# Reconstruct the circuit from its QPY serialization (no text parsing involved)
+qpy_blob = "{qpy_blob}"
+qc = qpy.load(io.BytesIO(base64.b64decode(qpy_blob)))[0]
 
 # Draw the circuit
 qc.draw(output='mpl', fold=90)
 plt.show()
 
-# Simulate the circuit to get the state vector
+# Simulate the circuit to get the state vector (saved before any measurement)
 simulator = AerSimulator(method='statevector')
-transpiled_circuit = transpile(qc, simulator)
+statevector_circuit = qc.remove_final_measurements(inplace=False)
+statevector_circuit.save_statevector()
+transpiled_circuit = transpile(statevector_circuit, simulator)
 job = simulator.run(transpiled_circuit)
 result = job.result()
 state_vector = result.get_statevector()
@@ -68,3 +76,16 @@ plot_histogram(counts)
 plt.show()
 """
         return code
+
+    def serialize_circuit(self):
+        """
+        Serializes the circuit to base64-encoded QPY, leaving out simulator directives.
+
+        Returns:
+            str: The base64-encoded QPY data.
+        """
+        # QPY cannot restore Aer's directives as runnable instructions
+        circuit = strip_simulator_directives(self.circuit)
+        buffer = io.BytesIO()
+        qpy.dump(circuit, buffer)
+        return base64.b64encode(buffer.getvalue()).decode('ascii')
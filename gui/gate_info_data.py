@@ -3,6 +3,8 @@
 # The dictionary GATE_INFO maps each gate to its properties such as description, matrix representation, and examples.
 # For learning purposes, we've added additional gates and some comments explaining how each gate functions in quantum mechanics.
 
+import types
+
 GATE_INFO = {
     'H': {
         'description': 'Hadamard Gate creates superposition.',
@@ -145,3 +147,17 @@ GATE_INFO = {
         ]
     }
 }
+
+# The table is fixed after import, so the display parts are precomputed once:
+# GATE_RENDER maps each gate to (description, matrix LaTeX, examples as <li> HTML)
+GATE_RENDER = types.MappingProxyType({
+    gate: (
+        info['description'],
+        info['matrix'],
+        "".join(f"<li>$$ {ex} $$</li>" for ex in info['examples']),
+    )
+    for gate, info in GATE_INFO.items()
+})
+
+# Gate names in display order
+GATE_ORDER = tuple(GATE_INFO)
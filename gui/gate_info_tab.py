@@ -1,13 +1,40 @@
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QListWidget, QPushButton, QHBoxLayout, QSplitter
-from PyQt5.QtWebEngineWidgets import QWebEngineView
-from PyQt5.QtCore import Qt
+from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEngineSettings, QWebEngineProfile
+from PyQt5.QtCore import Qt, QUrl, QStandardPaths
 from PyQt5.QtGui import QColor, QPalette
-from gui.gate_info_data import GATE_INFO
-import numpy as np
+from gui.gate_info_data import GATE_ORDER
+from gui.gate_pages import build_gate_html
+import os
+
+# Pages pre-rendered by tools/build_gate_pages.py, served from qrc:/gates/
+try:
+    import resources.gates_rc
+    HAVE_GATE_PAGES = True
+except ImportError:
+    HAVE_GATE_PAGES = False
+
+# Style of the navigation buttons
+_BUTTON_QSS = """
+    QPushButton {
+        background-color: #6FA6D6;
+        color: white;
+        font-size: 16px;
+        padding: 8px;
+        border-radius: 8px;
+    }
+    QPushButton:hover {
+        background-color: #50799B;
+    }
+"""
+
+# Size of the persistent web cache holding KaTeX scripts and fonts (bytes)
+WEB_CACHE_MAX_BYTES = 200 * 1024 * 1024
 
 class GateInfoTab(QWidget):
     def __init__(self):
         super().__init__()
+        # Rendered pages keyed by gate name; the gate table does not change at runtime
+        self._html_cache = {}
         self.initUI()
 
     def initUI(self):
@@ -50,7 +77,7 @@ class GateInfoTab(QWidget):
             }
         """)
 
-        for gate in GATE_INFO.keys():
+        for gate in GATE_ORDER:
             self.gate_list.addItem(gate)
 
         left_layout.addWidget(self.gate_list)
@@ -61,30 +88,8 @@ class GateInfoTab(QWidget):
         self.next_button = QPushButton("Next")
 
         # Style buttons to make them more prominent
-        self.prev_button.setStyleSheet("""
-            QPushButton {
-                background-color: #6FA6D6;
-                color: white;
-                font-size: 16px;
-                padding: 8px;
-                border-radius: 8px;
-            }
-            QPushButton:hover {
-                background-color: #50799B;
-            }
-        """)
-        self.next_button.setStyleSheet("""
-            QPushButton {
-                background-color: #6FA6D6;
-                color: white;
-                font-size: 16px;
-                padding: 8px;
-                border-radius: 8px;
-            }
-            QPushButton:hover {
-                background-color: #50799B;
-            }
-        """)
+        for button in (self.prev_button, self.next_button):
+            button.setStyleSheet(_BUTTON_QSS)
 
         button_layout.addWidget(self.prev_button)
         button_layout.addWidget(self.next_button)
@@ -92,11 +97,11 @@ class GateInfoTab(QWidget):
 
         splitter.addWidget(left_widget)
 
-        # Right side: Web view for displaying gate information
-        self.info_display = QWebEngineView()
-
-        # Add right widget to splitter
-        splitter.addWidget(self.info_display)
+        # Right side: placeholder until the web view is created on first show,
+        # so the Chromium renderer is not started for users who never open the tab
+        self.info_display = None
+        self._splitter = splitter
+        splitter.addWidget(QWidget())
 
         # Set initial sizes for splitter sections
         splitter.setSizes([200, 600])
@@ -106,6 +111,29 @@ class GateInfoTab(QWidget):
         self.prev_button.clicked.connect(self.show_previous_gate)
         self.next_button.clicked.connect(self.show_next_gate)
 
+    def showEvent(self, event):
+        """Create the web view the first time the tab is shown."""
+        if self.info_display is None:
+            self.info_display = self.create_info_display()
+            placeholder = self._splitter.replaceWidget(1, self.info_display)
+            placeholder.deleteLater()
+            self.display_info(self.gate_list.currentItem(), None)
+        super().showEvent(event)
+
+    def create_info_display(self):
+        """Create the web view for displaying gate information."""
+        view = QWebEngineView()
+        # The pre-rendered qrc pages load KaTeX from its CDN
+        view.settings().setAttribute(QWebEngineSettings.LocalContentCanAccessRemoteUrls, True)
+        # Keep CDN assets on disk so they are not downloaded again on each launch
+        profile = view.page().profile()
+        profile.setHttpCacheType(QWebEngineProfile.DiskHttpCache)
+        profile.setCachePath(
+            os.path.join(QStandardPaths.writableLocation(QStandardPaths.CacheLocation), "ezqubit_web")
+        )
+        profile.setHttpCacheMaximumSize(WEB_CACHE_MAX_BYTES)
+        return view
+
     def show_previous_gate(self):
         """Show the previous gate in the list."""
         current_row = self.gate_list.currentRow()
@@ -120,71 +148,17 @@ class GateInfoTab(QWidget):
 
     def display_info(self, current, previous):
         """Display information about the selected gate."""
+        if self.info_display is None:
+            # Shown once the web view is created in showEvent
+            return
         if current:
             gate = current.text()
-            info = GATE_INFO.get(gate, {})
-            description = info.get('description', '')
-            matrix_latex = info.get('matrix', '')
-            examples = info.get('examples', [])
-
-            # Enhanced HTML styling for display
-            html = f"""
-            <html>
-            <head>
-                <script type="text/javascript">
-                    MathJax = {{
-                        tex: {{
-                            inlineMath: [['$', '$'], ['\\(', '\\)']],
-                            displayMath: [['$$', '$$'], ['\\[', '\\]']]
-                        }},
-                        svg: {{fontCache: 'global'}}
-                    }};
-                </script>
-                <script src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js"></script>
-                <style>
-                    body {{
-                        font-family: 'Segoe UI', Arial, sans-serif;
-                        background-color: #FAFAFA;
-                        color: #333333;
-                        font-size: 18px;
-                        line-height: 1.6;
-                    }}
-                    h2 {{
-                        color: #2B5D81;
-                        font-size: 28px;
-                        border-bottom: 2px solid #2B5D81;
-                        padding-bottom: 10px;
-                    }}
-                    h3 {{
-                        color: #4682B4;
-                        font-size: 24px;
-                        margin-top: 20px;
-                    }}
-                    ol {{
-                        font-size: 18px;
-                        color: #444444;
-                    }}
-                    .matrix {{
-                        background-color: #EDF5FA;
-                        padding: 10px;
-                        border-radius: 8px;
-                        border: 1px solid #6FA6D6;
-                    }}
-                </style>
-            </head>
-            <body>
-                <h2>{gate} Gate</h2>
-                <p>{description}</p>
-                <h3>Matrix Representation:</h3>
-                <div class="matrix">$$ {matrix_latex} $$</div>
-                <h3>Examples:</h3>
-                <ol>
-            """
-            for ex in examples:
-                html += f"<li>$$ {ex} $$</li>"
-            html += """
-                </ol>
-            </body>
-            </html>
-            """
+            if HAVE_GATE_PAGES:
+                # A real URL lets QtWebEngine reuse its cache for the page
+                self.info_display.load(QUrl(f"qrc:/gates/{gate}.html"))
+                return
+            html = self._html_cache.get(gate)
+            if html is None:
+                html = build_gate_html(gate)
+                self._html_cache[gate] = html
             self.info_display.setHtml(html)
@@ -0,0 +1,85 @@
+# gui/gate_pages.py
+
+"""
+Builds the HTML pages shown in the Gate Info tab.
+
+The pages are pre-rendered by tools/build_gate_pages.py into Qt resources; the
+tab falls back to building them at runtime when the resources are missing.
+"""
+
+from gui.gate_info_data import GATE_RENDER
+
+# Static <head> of every gate page (KaTeX loader and styles). The backslashes of
+# the \[ and \( delimiters are doubled, since a lone one is dropped by JavaScript
+# and would leave plain brackets and parentheses in the prose delimiting math
+_HTML_HEAD = r"""
+<html>
+<head>
+    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/katex@0.16/dist/katex.min.css">
+    <script defer src="https://cdn.jsdelivr.net/npm/katex@0.16/dist/katex.min.js"></script>
+    <script defer src="https://cdn.jsdelivr.net/npm/katex@0.16/dist/contrib/auto-render.min.js"
+        onload="renderMathInElement(document.body, {
+            delimiters: [
+                {left: '$$', right: '$$', display: true},
+                {left: '\\[', right: '\\]', display: true},
+                {left: '$', right: '$', display: false},
+                {left: '\\(', right: '\\)', display: false}
+            ]
+        });"></script>
+    <style>
+        body {
+            font-family: 'Segoe UI', Arial, sans-serif;
+            background-color: #FAFAFA;
+            color: #333333;
+            font-size: 18px;
+            line-height: 1.6;
+        }
+        h2 {
+            color: #2B5D81;
+            font-size: 28px;
+            border-bottom: 2px solid #2B5D81;
+            padding-bottom: 10px;
+        }
+        h3 {
+            color: #4682B4;
+            font-size: 24px;
+            margin-top: 20px;
+        }
+        ol {
+            font-size: 18px;
+            color: #444444;
+        }
+        .matrix {
+            background-color: #EDF5FA;
+            padding: 10px;
+            border-radius: 8px;
+            border: 1px solid #6FA6D6;
+        }
+    </style>
+</head>
+"""
+
+# Static pieces between and after the gate-specific parts of a page
+_HTML_EXAMPLES_HEADER = "<h3>Examples:</h3><ol>"
+_HTML_TAIL = "</ol></body></html>"
+
+def build_gate_html(gate):
+    """
+    Builds the HTML page describing a gate.
+
+    Args:
+        gate (str): The gate name, a key of GATE_RENDER.
+
+    Returns:
+        str: The complete HTML document.
+    """
+    description, matrix_latex, examples_html = GATE_RENDER[gate]
+    # Only the gate-specific parts are formatted; the static skeleton is hoisted
+    return "".join((
+        _HTML_HEAD,
+        f"<body><h2>{gate} Gate</h2><p>{description}</p>",
+        f"<h3>Matrix Representation:</h3><div class=\"matrix\">$$ {matrix_latex} $$</div>",
+        _HTML_EXAMPLES_HEADER,
+        examples_html,
+        _HTML_TAIL,
+    ))
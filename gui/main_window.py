@@ -2,22 +2,81 @@
 
 from PyQt5.QtWidgets import (
     QMainWindow, QAction, QFileDialog, QMessageBox, QTabWidget, QWidget, QVBoxLayout,
-    QLabel
+    QLabel, QPushButton, QScrollArea
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer, QThreadPool
 from gui.circuit_builder import CircuitBuilder
 from gui.gate_info_tab import GateInfoTab
-from gui.latex_renderer import render_latex_to_pixmap
-from PyQt5.QtWebEngineWidgets import QWebEngineView
-from PyQt5.QtGui import QFont
-from utils.qiskit_helpers import get_full_unitary, get_state_vector, matrix_to_latex, statevector_to_latex
-import sys
+from gui.workers import Worker
+from collections import OrderedDict
+import html
+from utils.qiskit_helpers import (
+    get_full_unitary, get_state_vector, matrix_to_html, statevector_to_html,
+    matrix_to_latex, statevector_to_latex, MATH_MAX_QUBITS
+)
+
+# How long transient status bar messages stay visible (milliseconds)
+STATUS_MESSAGE_TIMEOUT_MS = 2000
+
+# Quiet period after the last circuit update before the math tab refreshes;
+# long enough to span the updates of a drag-and-drop burst (milliseconds)
+MATH_UPDATE_DELAY_MS = 150
+
+# Number of circuits whose rendered tables are kept for undo/redo
+MATH_PAGE_CACHE_SIZE = 32
+
+# Shown when the circuit has no unitary (e.g. it measures) or no state vector
+UNITARY_UNAVAILABLE = "Unitary matrix not available for the current circuit."
+STATE_VECTOR_UNAVAILABLE = "State vector not available for the current circuit."
+
+# Shown while a worker computes the tables
+MATH_COMPUTING = "Computing..."
+
+# Document written by Export LaTeX; only the two formulas vary
+LATEX_EXPORT_TEMPLATE = (
+    "\\documentclass{{article}}\n"
+    "\\usepackage{{amsmath}}\n"
+    "\\begin{{document}}\n\n"
+    "## Unitary Matrix of the Circuit\n\n"
+    "\\[\n{unitary}\n\\]\n\n"
+    "## State Vector\n\n"
+    "\\[\n{state_vector}\n\\]\n"
+    "\n\\end{{document}}"
+)
+
+# Exported in place of a unitary or state vector the circuit does not have
+LATEX_UNAVAILABLE = "\\text{Not available for this circuit}"
+
+# Shown instead of the tables of circuits above MATH_MAX_QUBITS
+MATH_TOO_LARGE = (
+    f"The circuit has more than {MATH_MAX_QUBITS} qubits; "
+    "press \"Render anyway\" to compute its mathematics."
+)
+
+# Asked before exporting the LaTeX of a circuit above MATH_MAX_QUBITS
+LATEX_EXPORT_TOO_LARGE = (
+    f"The circuit has more than {MATH_MAX_QUBITS} qubits, so computing its "
+    "mathematics may take a while. Export it anyway?"
+)
 
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Qiskit GUI Builder")
         self.setGeometry(100, 100, 1400, 900)
+        # Restarted on every circuit update; only the last one in a burst renders
+        self._math_timer = QTimer(self)
+        self._math_timer.setSingleShot(True)
+        self._math_timer.setInterval(MATH_UPDATE_DELAY_MS)
+        self._math_timer.timeout.connect(self.render_math_display)
+        # Circuit version shown in the math tab, and HTML of both views keyed by circuit
+        self._rendered_version = None
+        self._math_pages = OrderedDict()
+        # Whether a worker is computing math tables
+        self._math_pending = False
+        # Set by "Render anyway"; kept while a computation is in flight, so the
+        # render that follows it still skips the size check
+        self._math_force_next = False
         self.initUI()
 
     def initUI(self):
@@ -47,6 +106,8 @@ class MainWindow(QMainWindow):
 
         # Connect signals
         self.circuit_builder.circuit_updated.connect(self.update_math_display)
+        self.tabs.currentChanged.connect(self.on_tab_changed)
+        self.circuit_builder.status_message.connect(self.show_status_message)
 
         # Set the status bar
         self.statusBar().showMessage("Ready")
@@ -101,80 +162,173 @@ class MainWindow(QMainWindow):
         help_menu.addAction(about_action)
 
     def add_math_widgets(self):
-        # Web view for Unitary Matrix
-        self.unitary_view = QWebEngineView()
+        # Rich-text labels render the tables natively, without a browser engine
+        self.unitary_view, unitary_scroll = self.create_math_view()
         self.math_layout.addWidget(QLabel("<h3>Unitary Matrix of the Circuit:</h3>"))
-        self.math_layout.addWidget(self.unitary_view)
+        self.math_layout.addWidget(unitary_scroll)
 
-        # Web view for State Vector
-        self.state_vector_view = QWebEngineView()
+        self.state_vector_view, state_vector_scroll = self.create_math_view()
         self.math_layout.addWidget(QLabel("<h3>State Vector:</h3>"))
-        self.math_layout.addWidget(self.state_vector_view)
+        self.math_layout.addWidget(state_vector_scroll)
+
+        # Shown while a large circuit's math is skipped
+        self.render_anyway_button = QPushButton("Render anyway")
+        self.render_anyway_button.setVisible(False)
+        self.render_anyway_button.clicked.connect(self.force_math_display)
+        self.math_layout.addWidget(self.render_anyway_button)
+
+    @staticmethod
+    def create_math_view():
+        """Create a rich-text label for a matrix or vector, and the scroll area holding it."""
+        label = QLabel()
+        label.setTextFormat(Qt.RichText)
+        label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        label.setMargin(20)
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setWidget(label)
+        return label, scroll
 
     def update_math_display(self):
-        # Fetch unitary matrix
-        unitary = get_full_unitary(self.circuit_builder.circuit)
+        # Only the visible math tab is refreshed; a hidden one is brought up to
+        # date by on_tab_changed, since its rendered version no longer matches
+        if self.tabs.currentWidget() is not self.math_display:
+            return
+        # Schedule a refresh, restarting the delay on each call
+        self._math_timer.start()
+
+    def on_tab_changed(self, index):
+        # Render changes made while the math tab was hidden
+        if self.tabs.widget(index) is self.math_display:
+            self.render_math_display()
+
+    def force_math_display(self):
+        # Render the current circuit regardless of its size
+        self._rendered_version = None
+        self._math_force_next = True
+        self.render_math_display()
+
+    def render_math_display(self):
+        version = self.circuit_builder.version
+        if version == self._rendered_version:
+            # The circuit is unchanged since the last render
+            return
+        if self._math_pending:
+            # Rendered by on_math_computed once the computation in flight is done
+            return
+        self._rendered_version = version
+        force, self._math_force_next = self._math_force_next, False
+
+        # Tables of circuits seen before (e.g. after undo/redo) are reused
+        key = self.circuit_builder.circuit_key()
+        pages = self._math_pages.get(key)
+        too_large = (
+            pages is None and not force
+            and self.circuit_builder.circuit.num_qubits > MATH_MAX_QUBITS
+        )
+        self.render_anyway_button.setVisible(too_large)
+        if too_large:
+            self.show_math_pages((MATH_TOO_LARGE, MATH_TOO_LARGE))
+            return
+        if pages is not None:
+            self._math_pages.move_to_end(key)
+            self.show_math_pages(pages)
+            return
+
+        # Compute off the GUI thread; only one computation runs at a time
+        self._math_pending = True
+        self.show_math_pages((MATH_COMPUTING, MATH_COMPUTING))
+        worker = Worker(
+            self.compute_math_pages, key, version, self.circuit_builder.circuit.copy(),
+            self.circuit_builder.get_tracked_state()
+        )
+        worker.signals.finished.connect(self.on_math_computed)
+        worker.signals.error.connect(self.on_math_failed)
+        QThreadPool.globalInstance().start(worker)
+
+    @staticmethod
+    def compute_math_pages(key, version, circuit, state_vector=None):
+        """
+        Builds the unitary and state vector tables of a circuit. Called from a worker thread.
+
+        The LaTeX of both is built alongside, so Export LaTeX can reuse it.
+
+        Args:
+            state_vector (np.ndarray): The builder's tracked statevector, or None
+                to compute it from the circuit.
+
+        Returns:
+            tuple: (key, version, (unitary_html, state_vector_html,
+                unitary_latex, state_vector_latex)); the LaTeX is None where
+                the HTML is an "unavailable" message.
+        """
+        return key, version, MainWindow.build_math_pages(circuit, state_vector)
+
+    @staticmethod
+    def build_math_pages(circuit, state_vector=None):
+        """
+        Computes the tables and LaTeX shown and exported for a circuit.
+
+        Args:
+            circuit (QuantumCircuit): The circuit.
+            state_vector (np.ndarray): The builder's tracked statevector, or None
+                to compute it from the circuit.
+
+        Returns:
+            tuple: (unitary_html, state_vector_html, unitary_latex, state_vector_latex).
+        """
+        unitary = get_full_unitary(circuit)
+        if state_vector is None:
+            # Not tracked (measured circuit, or a recomputation in flight)
+            state_vector = get_state_vector(circuit)
         if unitary is not None:
-            unitary_latex = matrix_to_latex(unitary)
-            unitary_html = f"""
-            <html>
-            <head>
-                <script src="https://polyfill.io/v3/polyfill.min.js?features=es6"></script>
-                <script id="MathJax-script" async
-                    src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js">
-                </script>
-                <style>
-                    body {{
-                        font-family: Arial, sans-serif;
-                        padding: 20px;
-                    }}
-                    pre {{
-                        background-color: #f0f0f0;
-                        padding: 10px;
-                        border-radius: 5px;
-                    }}
-                </style>
-            </head>
-            <body>
-                $$ {unitary_latex} $$
-            </body>
-            </html>
-            """
-            self.unitary_view.setHtml(unitary_html)
+            unitary_html, unitary_latex = matrix_to_html(unitary), matrix_to_latex(unitary)
         else:
-            self.unitary_view.setHtml("<p>Unitary matrix not available for the current circuit.</p>")
-
-        # Fetch state vector
-        state_vector = get_state_vector(self.circuit_builder.circuit)
+            unitary_html, unitary_latex = UNITARY_UNAVAILABLE, None
         if state_vector is not None:
+            state_vector_html = statevector_to_html(state_vector)
             state_vector_latex = statevector_to_latex(state_vector)
-            state_vector_html = f"""
-            <html>
-            <head>
-                <script src="https://polyfill.io/v3/polyfill.min.js?features=es6"></script>
-                <script id="MathJax-script" async
-                    src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js">
-                </script>
-                <style>
-                    body {{
-                        font-family: Arial, sans-serif;
-                        padding: 20px;
-                    }}
-                    pre {{
-                        background-color: #f0f0f0;
-                        padding: 10px;
-                        border-radius: 5px;
-                    }}
-                </style>
-            </head>
-            <body>
-                $$ {state_vector_latex} $$
-            </body>
-            </html>
-            """
-            self.state_vector_view.setHtml(state_vector_html)
         else:
-            self.state_vector_view.setHtml("<p>State vector not available for the current circuit.</p>")
+            state_vector_html, state_vector_latex = STATE_VECTOR_UNAVAILABLE, None
+        return unitary_html, state_vector_html, unitary_latex, state_vector_latex
+
+    def on_math_computed(self, result):
+        """
+        Caches the tables computed by a worker and shows them if still current.
+
+        Args:
+            result (tuple): (key, version, pages) from compute_math_pages.
+        """
+        key, version, pages = result
+        self._math_pending = False
+        self.cache_math_pages(key, pages)
+        if version == self.circuit_builder.version:
+            self._math_force_next = False
+            self.show_math_pages(pages)
+        else:
+            # The circuit changed while computing; render the latest one
+            self.update_math_display()
+
+    def cache_math_pages(self, key, pages):
+        self._math_pages[key] = pages
+        if len(self._math_pages) > MATH_PAGE_CACHE_SIZE:
+            self._math_pages.popitem(last=False)
+
+    def on_math_failed(self, message):
+        self._math_pending = False
+        # Allow the same circuit to be retried
+        self._rendered_version = None
+        error = f"Error computing mathematical representations:<br>{html.escape(message)}"
+        self.show_math_pages((error, error))
+
+    def show_math_pages(self, pages):
+        unitary_html, state_vector_html = pages[:2]
+        self.unitary_view.setText(unitary_html)
+        self.state_vector_view.setText(state_vector_html)
+
+    def show_status_message(self, message):
+        self.statusBar().showMessage(message, STATUS_MESSAGE_TIMEOUT_MS)
 
     def export_latex(self):
         options = QFileDialog.Options()
@@ -182,20 +336,78 @@ class MainWindow(QMainWindow):
             self, "Export LaTeX", "",
             "LaTeX Files (*.tex);;All Files (*)", options=options
         )
-        if file_name:
-            try:
-                with open(file_name, 'w') as f:
-                    f.write("\\documentclass{article}\n")
-                    f.write("\\usepackage{amsmath}\n")
-                    f.write("\\begin{document}\n\n")
-                    f.write("## Unitary Matrix of the Circuit\n\n")
-                    f.write(f"\\[\n{self.circuit_builder.get_unitary_latex()}\n\\]\n\n")
-                    f.write("## State Vector\n\n")
-                    f.write(f"\\[\n{self.circuit_builder.get_statevector_latex()}\n\\]\n")
-                    f.write("\n\\end{document}")
-                QMessageBox.information(self, "Export Successful", f"LaTeX file saved to {file_name}")
-            except Exception as e:
-                QMessageBox.critical(self, "Export Failed", f"Failed to export LaTeX file:\n{e}")
+        if not file_name:
+            return
+        # Reuse the LaTeX built for the math tab; compute it only if the tab
+        # has not shown this circuit
+        key = self.circuit_builder.circuit_key()
+        pages = self._math_pages.get(key)
+        if pages is not None:
+            self.write_latex(file_name, pages)
+            return
+        circuit = self.circuit_builder.circuit
+        if circuit.num_qubits > MATH_MAX_QUBITS and not self.confirm_render_anyway():
+            return
+        self.statusBar().showMessage("Computing LaTeX...")
+        worker = Worker(
+            self.compute_latex_export, file_name, key, circuit.copy(),
+            self.circuit_builder.get_tracked_state()
+        )
+        worker.signals.finished.connect(self.on_latex_computed)
+        worker.signals.error.connect(self.on_latex_failed)
+        QThreadPool.globalInstance().start(worker)
+
+    def confirm_render_anyway(self):
+        """
+        Asks whether to compute the mathematics of a circuit above MATH_MAX_QUBITS.
+
+        Returns:
+            bool: True if the user chose "Render anyway".
+        """
+        box = QMessageBox(QMessageBox.Question, "Export LaTeX", LATEX_EXPORT_TOO_LARGE,
+                          QMessageBox.Cancel, self)
+        render_anyway = box.addButton("Render anyway", QMessageBox.AcceptRole)
+        box.exec_()
+        return box.clickedButton() is render_anyway
+
+    @staticmethod
+    def compute_latex_export(file_name, key, circuit, state_vector=None):
+        """
+        Builds the math pages of a circuit for Export LaTeX. Called from a worker thread.
+
+        Returns:
+            tuple: (file_name, key, pages), pages as returned by build_math_pages.
+        """
+        return file_name, key, MainWindow.build_math_pages(circuit, state_vector)
+
+    def on_latex_computed(self, result):
+        """
+        Caches the pages computed for an export and writes the LaTeX file.
+
+        Args:
+            result (tuple): (file_name, key, pages) from compute_latex_export.
+        """
+        file_name, key, pages = result
+        self.statusBar().clearMessage()
+        self.cache_math_pages(key, pages)
+        self.write_latex(file_name, pages)
+
+    def on_latex_failed(self, message):
+        self.statusBar().clearMessage()
+        QMessageBox.critical(self, "Export Failed", f"Failed to export LaTeX file:\n{message}")
+
+    def write_latex(self, file_name, pages):
+        unitary_latex, state_vector_latex = pages[2:]
+        document = LATEX_EXPORT_TEMPLATE.format(
+            unitary=unitary_latex or LATEX_UNAVAILABLE,
+            state_vector=state_vector_latex or LATEX_UNAVAILABLE,
+        )
+        try:
+            with open(file_name, 'w') as f:
+                f.write(document)
+            QMessageBox.information(self, "Export Successful", f"LaTeX file saved to {file_name}")
+        except Exception as e:
+            QMessageBox.critical(self, "Export Failed", f"Failed to export LaTeX file:\n{e}")
 
     def new_circuit(self):
         response = QMessageBox.question(
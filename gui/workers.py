@@ -0,0 +1,60 @@
+# gui/workers.py
+
+"""
+Defines QRunnable workers used to run heavy computations off the GUI thread.
+"""
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+class WorkerSignals(QObject):
+    """
+    Signals emitted by a Worker, delivered to slots on the GUI thread.
+    """
+
+    # Emitted with the return value of the task
+    finished = pyqtSignal(object)
+
+    # Emitted with the error message if the task raised
+    error = pyqtSignal(str)
+
+class Worker(QRunnable):
+    """
+    Runs a callable in a QThreadPool thread and reports the outcome through signals.
+
+    The callable must not touch any widgets; results are handled by the slots
+    connected to `signals`.
+    """
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self):
+        """
+        Executes the callable and emits either `finished` or `error`.
+        """
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.emit('error', str(e))
+        else:
+            self.emit('finished', result)
+
+    def emit(self, name, value):
+        """
+        Emits one of the signals, unless the application has already quit.
+
+        Args:
+            name (str): The signal, 'finished' or 'error'.
+            value: The value to emit.
+        """
+        try:
+            getattr(self.signals, name).emit(value)
+        except RuntimeError:
+            # The signals object was deleted because the application quit while
+            # the task ran (e.g. the kernel warm-up started at launch); nobody
+            # is left to receive the outcome
+            pass
@@ -6,20 +6,46 @@ Main entry point for the Qiskit GUI Application.
 This script initializes the application and displays the main window.
 """
 
+import os
 import sys
-from PyQt5.QtWidgets import QApplication
-from gui.main_window import MainWindow
+from PyQt5.QtWidgets import QApplication, QSplashScreen
+from PyQt5.QtGui import QPixmap, QColor
+from PyQt5.QtCore import Qt
+# QtWebEngine must be loaded before the QApplication is created; everything
+# else in the GUI is imported once the splash screen is up
+from PyQt5 import QtWebEngineWidgets  # noqa: F401
+
+# Size of the startup splash screen (pixels)
+SPLASH_SIZE = (420, 200)
 
 def main():
     """
     Initializes the QApplication and displays the main window.
     """
+    # QtWebEngine often falls back to software rasterization on Windows; the
+    # flags must be set before the application is created (users may override)
+    if sys.platform == "win32":
+        os.environ.setdefault(
+            "QTWEBENGINE_CHROMIUM_FLAGS", "--enable-gpu-rasterization --ignore-gpu-blocklist"
+        )
+
     # Create the application instance
     app = QApplication(sys.argv)
 
+    # Show a splash screen while Qiskit and the GUI modules load
+    pixmap = QPixmap(*SPLASH_SIZE)
+    pixmap.fill(QColor("#6FA6D6"))
+    splash = QSplashScreen(pixmap)
+    splash.showMessage("Loading Qiskit GUI Builder...", Qt.AlignCenter, Qt.white)
+    splash.show()
+    app.processEvents()
+
+    from gui.main_window import MainWindow
+
     # Create and show the main window
     window = MainWindow()
     window.show()
+    splash.finish(window)
 
     # Execute the application's main loop
     sys.exit(app.exec_())
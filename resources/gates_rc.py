@@ -0,0 +1,1851 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x07\xc9\
+\x0a\
+\x3c\x68\x74\x6d\x6c\x3e\x0a\x3c\x68\x65\x61\x64\x3e\x0a\x20\x20\
+\x20\x20\x3c\x6c\x69\x6e\x6b\x20\x72\x65\x6c\x3d\x22\x73\x74\x79\
+\x6c\x65\x73\x68\x65\x65\x74\x22\x20\x68\x72\x65\x66\x3d\x22\x68\
+\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\x73\x64\x65\x6c\
+\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\x6b\x61\x74\x65\
+\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\x6b\x61\x74\x65\
+\x78\x2e\x6d\x69\x6e\x2e\x63\x73\x73\x22\x3e\x0a\x20\x20\x20\x20\
+\x3c\x73\x63\x72\x69\x70\x74\x20\x64\x65\x66\x65\x72\x20\x73\x72\
+\x63\x3d\x22\x68\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\
+\x73\x64\x65\x6c\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\
+\x6b\x61\x74\x65\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\
+\x6b\x61\x74\x65\x78\x2e\x6d\x69\x6e\x2e\x6a\x73\x22\x3e\x3c\x2f\
+\x73\x63\x72\x69\x70\x74\x3e\x0a\x20\x20\x20\x20\x3c\x73\x63\x72\
+\x69\x70\x74\x20\x64\x65\x66\x65\x72\x20\x73\x72\x63\x3d\x22\x68\
+\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\x73\x64\x65\x6c\
+\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\x6b\x61\x74\x65\
+\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\x63\x6f\x6e\x74\
+\x72\x69\x62\x2f\x61\x75\x74\x6f\x2d\x72\x65\x6e\x64\x65\x72\x2e\
+\x6d\x69\x6e\x2e\x6a\x73\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x6f\x6e\x6c\x6f\x61\x64\x3d\x22\x72\x65\x6e\x64\x65\x72\x4d\x61\
+\x74\x68\x49\x6e\x45\x6c\x65\x6d\x65\x6e\x74\x28\x64\x6f\x63\x75\
+\x6d\x65\x6e\x74\x2e\x62\x6f\x64\x79\x2c\x20\x7b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x64\x65\x6c\x69\x6d\x69\x74\
+\x65\x72\x73\x3a\x20\x5b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x24\
+\x24\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\x27\x24\x24\x27\x2c\
+\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x74\x72\x75\x65\x7d\x2c\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x5c\x5c\x5b\x27\x2c\x20\x72\
+\x69\x67\x68\x74\x3a\x20\x27\x5c\x5c\x5d\x27\x2c\x20\x64\x69\x73\
+\x70\x6c\x61\x79\x3a\x20\x74\x72\x75\x65\x7d\x2c\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\
+\x66\x74\x3a\x20\x27\x24\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\
+\x27\x24\x27\x2c\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x66\x61\
+\x6c\x73\x65\x7d\x2c\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x5c\x5c\
+\x28\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\x27\x5c\x5c\x29\x27\
+\x2c\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x66\x61\x6c\x73\x65\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x5d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x29\x3b\x22\x3e\x3c\x2f\x73\
+\x63\x72\x69\x70\x74\x3e\x0a\x20\x20\x20\x20\x3c\x73\x74\x79\x6c\
+\x65\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x62\x6f\x64\x79\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\
+\x6e\x74\x2d\x66\x61\x6d\x69\x6c\x79\x3a\x20\x27\x53\x65\x67\x6f\
+\x65\x20\x55\x49\x27\x2c\x20\x41\x72\x69\x61\x6c\x2c\x20\x73\x61\
+\x6e\x73\x2d\x73\x65\x72\x69\x66\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\
+\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x46\x41\x46\x41\x46\x41\x3b\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\
+\x6f\x72\x3a\x20\x23\x33\x33\x33\x33\x33\x33\x3b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\
+\x7a\x65\x3a\x20\x31\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x6c\x69\x6e\x65\x2d\x68\x65\x69\x67\x68\
+\x74\x3a\x20\x31\x2e\x36\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x68\x32\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\
+\x3a\x20\x23\x32\x42\x35\x44\x38\x31\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\
+\x3a\x20\x32\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x2d\x62\x6f\x74\x74\x6f\
+\x6d\x3a\x20\x32\x70\x78\x20\x73\x6f\x6c\x69\x64\x20\x23\x32\x42\
+\x35\x44\x38\x31\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x2d\x62\x6f\x74\x74\x6f\x6d\
+\x3a\x20\x31\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x68\x33\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\
+\x3a\x20\x23\x34\x36\x38\x32\x42\x34\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\
+\x3a\x20\x32\x34\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x6d\x61\x72\x67\x69\x6e\x2d\x74\x6f\x70\x3a\x20\
+\x32\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x6f\x6c\x20\x7b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\
+\x7a\x65\x3a\x20\x31\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x34\x34\
+\x34\x34\x34\x34\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x2e\x6d\x61\x74\x72\x69\x78\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x62\x61\
+\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\
+\x23\x45\x44\x46\x35\x46\x41\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x3a\x20\x31\x30\
+\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x2d\x72\x61\x64\x69\x75\x73\x3a\x20\x38\
+\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x3a\x20\x31\x70\x78\x20\x73\x6f\x6c\x69\
+\x64\x20\x23\x36\x46\x41\x36\x44\x36\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x7d\x0a\x20\x20\x20\x20\x3c\x2f\x73\x74\x79\x6c\x65\
+\x3e\x0a\x3c\x2f\x68\x65\x61\x64\x3e\x0a\x3c\x62\x6f\x64\x79\x3e\
+\x3c\x68\x32\x3e\x48\x20\x47\x61\x74\x65\x3c\x2f\x68\x32\x3e\x3c\
+\x70\x3e\x48\x61\x64\x61\x6d\x61\x72\x64\x20\x47\x61\x74\x65\x20\
+\x63\x72\x65\x61\x74\x65\x73\x20\x73\x75\x70\x65\x72\x70\x6f\x73\
+\x69\x74\x69\x6f\x6e\x2e\x3c\x2f\x70\x3e\x3c\x68\x33\x3e\x4d\x61\
+\x74\x72\x69\x78\x20\x52\x65\x70\x72\x65\x73\x65\x6e\x74\x61\x74\
+\x69\x6f\x6e\x3a\x3c\x2f\x68\x33\x3e\x3c\x64\x69\x76\x20\x63\x6c\
+\x61\x73\x73\x3d\x22\x6d\x61\x74\x72\x69\x78\x22\x3e\x24\x24\x20\
+\x5c\x66\x72\x61\x63\x7b\x31\x7d\x7b\x5c\x73\x71\x72\x74\x7b\x32\
+\x7d\x7d\x5c\x62\x65\x67\x69\x6e\x7b\x70\x6d\x61\x74\x72\x69\x78\
+\x7d\x31\x20\x26\x20\x31\x5c\x5c\x31\x20\x26\x20\x2d\x31\x5c\x65\
+\x6e\x64\x7b\x70\x6d\x61\x74\x72\x69\x78\x7d\x20\x24\x24\x3c\x2f\
+\x64\x69\x76\x3e\x3c\x68\x33\x3e\x45\x78\x61\x6d\x70\x6c\x65\x73\
+\x3a\x3c\x2f\x68\x33\x3e\x3c\x6f\x6c\x3e\x3c\x6c\x69\x3e\x24\x24\
+\x20\x41\x70\x70\x6c\x79\x69\x6e\x67\x20\x48\x20\x74\x6f\x20\x24\
+\x7c\x30\x5c\x72\x61\x6e\x67\x6c\x65\x24\x20\x72\x65\x73\x75\x6c\
+\x74\x73\x20\x69\x6e\x20\x24\x5c\x66\x72\x61\x63\x7b\x31\x7d\x7b\
+\x5c\x73\x71\x72\x74\x7b\x32\x7d\x7d\x28\x7c\x30\x5c\x72\x61\x6e\
+\x67\x6c\x65\x20\x2b\x20\x7c\x31\x5c\x72\x61\x6e\x67\x6c\x65\x29\
+\x24\x2e\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x6c\x69\x3e\x24\x24\
+\x20\x41\x70\x70\x6c\x79\x69\x6e\x67\x20\x48\x20\x74\x6f\x20\x24\
+\x7c\x31\x5c\x72\x61\x6e\x67\x6c\x65\x24\x20\x72\x65\x73\x75\x6c\
+\x74\x73\x20\x69\x6e\x20\x24\x5c\x66\x72\x61\x63\x7b\x31\x7d\x7b\
+\x5c\x73\x71\x72\x74\x7b\x32\x7d\x7d\x28\x7c\x30\x5c\x72\x61\x6e\
+\x67\x6c\x65\x20\x2d\x20\x7c\x31\x5c\x72\x61\x6e\x67\x6c\x65\x29\
+\x24\x2e\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x6c\x69\x3e\x24\x24\
+\x20\x41\x70\x70\x6c\x79\x69\x6e\x67\x20\x48\x20\x74\x77\x69\x63\
+\x65\x20\x72\x65\x74\x75\x72\x6e\x73\x20\x74\x68\x65\x20\x71\x75\
+\x62\x69\x74\x20\x74\x6f\x20\x69\x74\x73\x20\x6f\x72\x69\x67\x69\
+\x6e\x61\x6c\x20\x73\x74\x61\x74\x65\x2e\x20\x24\x24\x3c\x2f\x6c\
+\x69\x3e\x3c\x6c\x69\x3e\x24\x24\x20\x48\x20\x67\x61\x74\x65\x20\
+\x69\x73\x20\x75\x73\x65\x64\x20\x74\x6f\x20\x63\x72\x65\x61\x74\
+\x65\x20\x65\x71\x75\x61\x6c\x20\x73\x75\x70\x65\x72\x70\x6f\x73\
+\x69\x74\x69\x6f\x6e\x2c\x20\x65\x73\x73\x65\x6e\x74\x69\x61\x6c\
+\x20\x66\x6f\x72\x20\x6d\x61\x6e\x79\x20\x71\x75\x61\x6e\x74\x75\
+\x6d\x20\x61\x6c\x67\x6f\x72\x69\x74\x68\x6d\x73\x2e\x20\x24\x24\
+\x3c\x2f\x6c\x69\x3e\x3c\x2f\x6f\x6c\x3e\x3c\x2f\x62\x6f\x64\x79\
+\x3e\x3c\x2f\x68\x74\x6d\x6c\x3e\
+\x00\x00\x07\x46\
+\x0a\
+\x3c\x68\x74\x6d\x6c\x3e\x0a\x3c\x68\x65\x61\x64\x3e\x0a\x20\x20\
+\x20\x20\x3c\x6c\x69\x6e\x6b\x20\x72\x65\x6c\x3d\x22\x73\x74\x79\
+\x6c\x65\x73\x68\x65\x65\x74\x22\x20\x68\x72\x65\x66\x3d\x22\x68\
+\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\x73\x64\x65\x6c\
+\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\x6b\x61\x74\x65\
+\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\x6b\x61\x74\x65\
+\x78\x2e\x6d\x69\x6e\x2e\x63\x73\x73\x22\x3e\x0a\x20\x20\x20\x20\
+\x3c\x73\x63\x72\x69\x70\x74\x20\x64\x65\x66\x65\x72\x20\x73\x72\
+\x63\x3d\x22\x68\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\
+\x73\x64\x65\x6c\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\
+\x6b\x61\x74\x65\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\
+\x6b\x61\x74\x65\x78\x2e\x6d\x69\x6e\x2e\x6a\x73\x22\x3e\x3c\x2f\
+\x73\x63\x72\x69\x70\x74\x3e\x0a\x20\x20\x20\x20\x3c\x73\x63\x72\
+\x69\x70\x74\x20\x64\x65\x66\x65\x72\x20\x73\x72\x63\x3d\x22\x68\
+\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\x73\x64\x65\x6c\
+\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\x6b\x61\x74\x65\
+\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\x63\x6f\x6e\x74\
+\x72\x69\x62\x2f\x61\x75\x74\x6f\x2d\x72\x65\x6e\x64\x65\x72\x2e\
+\x6d\x69\x6e\x2e\x6a\x73\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x6f\x6e\x6c\x6f\x61\x64\x3d\x22\x72\x65\x6e\x64\x65\x72\x4d\x61\
+\x74\x68\x49\x6e\x45\x6c\x65\x6d\x65\x6e\x74\x28\x64\x6f\x63\x75\
+\x6d\x65\x6e\x74\x2e\x62\x6f\x64\x79\x2c\x20\x7b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x64\x65\x6c\x69\x6d\x69\x74\
+\x65\x72\x73\x3a\x20\x5b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x24\
+\x24\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\x27\x24\x24\x27\x2c\
+\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x74\x72\x75\x65\x7d\x2c\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x5c\x5c\x5b\x27\x2c\x20\x72\
+\x69\x67\x68\x74\x3a\x20\x27\x5c\x5c\x5d\x27\x2c\x20\x64\x69\x73\
+\x70\x6c\x61\x79\x3a\x20\x74\x72\x75\x65\x7d\x2c\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\
+\x66\x74\x3a\x20\x27\x24\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\
+\x27\x24\x27\x2c\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x66\x61\
+\x6c\x73\x65\x7d\x2c\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x5c\x5c\
+\x28\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\x27\x5c\x5c\x29\x27\
+\x2c\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x66\x61\x6c\x73\x65\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x5d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x29\x3b\x22\x3e\x3c\x2f\x73\
+\x63\x72\x69\x70\x74\x3e\x0a\x20\x20\x20\x20\x3c\x73\x74\x79\x6c\
+\x65\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x62\x6f\x64\x79\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\
+\x6e\x74\x2d\x66\x61\x6d\x69\x6c\x79\x3a\x20\x27\x53\x65\x67\x6f\
+\x65\x20\x55\x49\x27\x2c\x20\x41\x72\x69\x61\x6c\x2c\x20\x73\x61\
+\x6e\x73\x2d\x73\x65\x72\x69\x66\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\
+\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x46\x41\x46\x41\x46\x41\x3b\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\
+\x6f\x72\x3a\x20\x23\x33\x33\x33\x33\x33\x33\x3b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\
+\x7a\x65\x3a\x20\x31\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x6c\x69\x6e\x65\x2d\x68\x65\x69\x67\x68\
+\x74\x3a\x20\x31\x2e\x36\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x68\x32\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\
+\x3a\x20\x23\x32\x42\x35\x44\x38\x31\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\
+\x3a\x20\x32\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x2d\x62\x6f\x74\x74\x6f\
+\x6d\x3a\x20\x32\x70\x78\x20\x73\x6f\x6c\x69\x64\x20\x23\x32\x42\
+\x35\x44\x38\x31\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x2d\x62\x6f\x74\x74\x6f\x6d\
+\x3a\x20\x31\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x68\x33\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\
+\x3a\x20\x23\x34\x36\x38\x32\x42\x34\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\
+\x3a\x20\x32\x34\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x6d\x61\x72\x67\x69\x6e\x2d\x74\x6f\x70\x3a\x20\
+\x32\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x6f\x6c\x20\x7b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\
+\x7a\x65\x3a\x20\x31\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x34\x34\
+\x34\x34\x34\x34\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x2e\x6d\x61\x74\x72\x69\x78\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x62\x61\
+\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\
+\x23\x45\x44\x46\x35\x46\x41\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x3a\x20\x31\x30\
+\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x2d\x72\x61\x64\x69\x75\x73\x3a\x20\x38\
+\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x3a\x20\x31\x70\x78\x20\x73\x6f\x6c\x69\
+\x64\x20\x23\x36\x46\x41\x36\x44\x36\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x7d\x0a\x20\x20\x20\x20\x3c\x2f\x73\x74\x79\x6c\x65\
+\x3e\x0a\x3c\x2f\x68\x65\x61\x64\x3e\x0a\x3c\x62\x6f\x64\x79\x3e\
+\x3c\x68\x32\x3e\x53\x20\x47\x61\x74\x65\x3c\x2f\x68\x32\x3e\x3c\
+\x70\x3e\x54\x68\x65\x20\x53\x20\x6f\x72\x20\x50\x68\x61\x73\x65\
+\x20\x47\x61\x74\x65\x20\x61\x70\x70\x6c\x69\x65\x73\x20\x61\x20\
+\x71\x75\x61\x72\x74\x65\x72\x20\x74\x75\x72\x6e\x20\x69\x6e\x20\
+\x70\x68\x61\x73\x65\x20\x73\x70\x61\x63\x65\x2e\x3c\x2f\x70\x3e\
+\x3c\x68\x33\x3e\x4d\x61\x74\x72\x69\x78\x20\x52\x65\x70\x72\x65\
+\x73\x65\x6e\x74\x61\x74\x69\x6f\x6e\x3a\x3c\x2f\x68\x33\x3e\x3c\
+\x64\x69\x76\x20\x63\x6c\x61\x73\x73\x3d\x22\x6d\x61\x74\x72\x69\
+\x78\x22\x3e\x24\x24\x20\x5c\x62\x65\x67\x69\x6e\x7b\x70\x6d\x61\
+\x74\x72\x69\x78\x7d\x31\x20\x26\x20\x30\x5c\x5c\x30\x20\x26\x20\
+\x69\x5c\x65\x6e\x64\x7b\x70\x6d\x61\x74\x72\x69\x78\x7d\x20\x24\
+\x24\x3c\x2f\x64\x69\x76\x3e\x3c\x68\x33\x3e\x45\x78\x61\x6d\x70\
+\x6c\x65\x73\x3a\x3c\x2f\x68\x33\x3e\x3c\x6f\x6c\x3e\x3c\x6c\x69\
+\x3e\x24\x24\x20\x24\x53\x7c\x30\x5c\x72\x61\x6e\x67\x6c\x65\x20\
+\x3d\x20\x7c\x30\x5c\x72\x61\x6e\x67\x6c\x65\x24\x20\x24\x24\x3c\
+\x2f\x6c\x69\x3e\x3c\x6c\x69\x3e\x24\x24\x20\x24\x53\x7c\x31\x5c\
+\x72\x61\x6e\x67\x6c\x65\x20\x3d\x20\x69\x7c\x31\x5c\x72\x61\x6e\
+\x67\x6c\x65\x24\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x6c\x69\x3e\
+\x24\x24\x20\x24\x53\x24\x20\x61\x70\x70\x6c\x69\x65\x64\x20\x74\
+\x77\x69\x63\x65\x20\x69\x73\x20\x65\x71\x75\x69\x76\x61\x6c\x65\
+\x6e\x74\x20\x74\x6f\x20\x24\x5a\x24\x2e\x20\x24\x24\x3c\x2f\x6c\
+\x69\x3e\x3c\x6c\x69\x3e\x24\x24\x20\x53\x20\x67\x61\x74\x65\x20\
+\x69\x73\x20\x75\x73\x65\x64\x20\x69\x6e\x20\x74\x68\x65\x20\x69\
+\x6d\x70\x6c\x65\x6d\x65\x6e\x74\x61\x74\x69\x6f\x6e\x20\x6f\x66\
+\x20\x54\x20\x67\x61\x74\x65\x73\x20\x61\x6e\x64\x20\x69\x6e\x20\
+\x71\x75\x61\x6e\x74\x75\x6d\x20\x46\x6f\x75\x72\x69\x65\x72\x20\
+\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x2e\x20\x24\x24\x3c\x2f\x6c\
+\x69\x3e\x3c\x2f\x6f\x6c\x3e\x3c\x2f\x62\x6f\x64\x79\x3e\x3c\x2f\
+\x68\x74\x6d\x6c\x3e\
+\x00\x00\x07\xb1\
+\x0a\
+\x3c\x68\x74\x6d\x6c\x3e\x0a\x3c\x68\x65\x61\x64\x3e\x0a\x20\x20\
+\x20\x20\x3c\x6c\x69\x6e\x6b\x20\x72\x65\x6c\x3d\x22\x73\x74\x79\
+\x6c\x65\x73\x68\x65\x65\x74\x22\x20\x68\x72\x65\x66\x3d\x22\x68\
+\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\x73\x64\x65\x6c\
+\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\x6b\x61\x74\x65\
+\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\x6b\x61\x74\x65\
+\x78\x2e\x6d\x69\x6e\x2e\x63\x73\x73\x22\x3e\x0a\x20\x20\x20\x20\
+\x3c\x73\x63\x72\x69\x70\x74\x20\x64\x65\x66\x65\x72\x20\x73\x72\
+\x63\x3d\x22\x68\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\
+\x73\x64\x65\x6c\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\
+\x6b\x61\x74\x65\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\
+\x6b\x61\x74\x65\x78\x2e\x6d\x69\x6e\x2e\x6a\x73\x22\x3e\x3c\x2f\
+\x73\x63\x72\x69\x70\x74\x3e\x0a\x20\x20\x20\x20\x3c\x73\x63\x72\
+\x69\x70\x74\x20\x64\x65\x66\x65\x72\x20\x73\x72\x63\x3d\x22\x68\
+\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\x73\x64\x65\x6c\
+\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\x6b\x61\x74\x65\
+\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\x63\x6f\x6e\x74\
+\x72\x69\x62\x2f\x61\x75\x74\x6f\x2d\x72\x65\x6e\x64\x65\x72\x2e\
+\x6d\x69\x6e\x2e\x6a\x73\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x6f\x6e\x6c\x6f\x61\x64\x3d\x22\x72\x65\x6e\x64\x65\x72\x4d\x61\
+\x74\x68\x49\x6e\x45\x6c\x65\x6d\x65\x6e\x74\x28\x64\x6f\x63\x75\
+\x6d\x65\x6e\x74\x2e\x62\x6f\x64\x79\x2c\x20\x7b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x64\x65\x6c\x69\x6d\x69\x74\
+\x65\x72\x73\x3a\x20\x5b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x24\
+\x24\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\x27\x24\x24\x27\x2c\
+\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x74\x72\x75\x65\x7d\x2c\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x5c\x5c\x5b\x27\x2c\x20\x72\
+\x69\x67\x68\x74\x3a\x20\x27\x5c\x5c\x5d\x27\x2c\x20\x64\x69\x73\
+\x70\x6c\x61\x79\x3a\x20\x74\x72\x75\x65\x7d\x2c\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\
+\x66\x74\x3a\x20\x27\x24\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\
+\x27\x24\x27\x2c\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x66\x61\
+\x6c\x73\x65\x7d\x2c\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x5c\x5c\
+\x28\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\x27\x5c\x5c\x29\x27\
+\x2c\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x66\x61\x6c\x73\x65\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x5d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x29\x3b\x22\x3e\x3c\x2f\x73\
+\x63\x72\x69\x70\x74\x3e\x0a\x20\x20\x20\x20\x3c\x73\x74\x79\x6c\
+\x65\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x62\x6f\x64\x79\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\
+\x6e\x74\x2d\x66\x61\x6d\x69\x6c\x79\x3a\x20\x27\x53\x65\x67\x6f\
+\x65\x20\x55\x49\x27\x2c\x20\x41\x72\x69\x61\x6c\x2c\x20\x73\x61\
+\x6e\x73\x2d\x73\x65\x72\x69\x66\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\
+\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x46\x41\x46\x41\x46\x41\x3b\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\
+\x6f\x72\x3a\x20\x23\x33\x33\x33\x33\x33\x33\x3b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\
+\x7a\x65\x3a\x20\x31\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x6c\x69\x6e\x65\x2d\x68\x65\x69\x67\x68\
+\x74\x3a\x20\x31\x2e\x36\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x68\x32\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\
+\x3a\x20\x23\x32\x42\x35\x44\x38\x31\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\
+\x3a\x20\x32\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x2d\x62\x6f\x74\x74\x6f\
+\x6d\x3a\x20\x32\x70\x78\x20\x73\x6f\x6c\x69\x64\x20\x23\x32\x42\
+\x35\x44\x38\x31\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x2d\x62\x6f\x74\x74\x6f\x6d\
+\x3a\x20\x31\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x68\x33\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\
+\x3a\x20\x23\x34\x36\x38\x32\x42\x34\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\
+\x3a\x20\x32\x34\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x6d\x61\x72\x67\x69\x6e\x2d\x74\x6f\x70\x3a\x20\
+\x32\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x6f\x6c\x20\x7b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\
+\x7a\x65\x3a\x20\x31\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x34\x34\
+\x34\x34\x34\x34\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x2e\x6d\x61\x74\x72\x69\x78\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x62\x61\
+\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\
+\x23\x45\x44\x46\x35\x46\x41\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x3a\x20\x31\x30\
+\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x2d\x72\x61\x64\x69\x75\x73\x3a\x20\x38\
+\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x3a\x20\x31\x70\x78\x20\x73\x6f\x6c\x69\
+\x64\x20\x23\x36\x46\x41\x36\x44\x36\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x7d\x0a\x20\x20\x20\x20\x3c\x2f\x73\x74\x79\x6c\x65\
+\x3e\x0a\x3c\x2f\x68\x65\x61\x64\x3e\x0a\x3c\x62\x6f\x64\x79\x3e\
+\x3c\x68\x32\x3e\x54\x20\x47\x61\x74\x65\x3c\x2f\x68\x32\x3e\x3c\
+\x70\x3e\x54\x20\x47\x61\x74\x65\x3a\x20\x41\x6c\x73\x6f\x20\x6b\
+\x6e\x6f\x77\x6e\x20\x61\x73\x20\x74\x68\x65\x20\x24\x5c\x70\x69\
+\x2f\x38\x24\x20\x67\x61\x74\x65\x2e\x20\x49\x74\x20\x61\x70\x70\
+\x6c\x69\x65\x73\x20\x61\x6e\x20\x65\x69\x67\x68\x74\x68\x20\x74\
+\x75\x72\x6e\x20\x69\x6e\x20\x70\x68\x61\x73\x65\x20\x73\x70\x61\
+\x63\x65\x2e\x3c\x2f\x70\x3e\x3c\x68\x33\x3e\x4d\x61\x74\x72\x69\
+\x78\x20\x52\x65\x70\x72\x65\x73\x65\x6e\x74\x61\x74\x69\x6f\x6e\
+\x3a\x3c\x2f\x68\x33\x3e\x3c\x64\x69\x76\x20\x63\x6c\x61\x73\x73\
+\x3d\x22\x6d\x61\x74\x72\x69\x78\x22\x3e\x24\x24\x20\x5c\x62\x65\
+\x67\x69\x6e\x7b\x70\x6d\x61\x74\x72\x69\x78\x7d\x31\x20\x26\x20\
+\x30\x5c\x5c\x30\x20\x26\x20\x5c\x66\x72\x61\x63\x7b\x31\x7d\x7b\
+\x5c\x73\x71\x72\x74\x7b\x32\x7d\x7d\x20\x2b\x20\x5c\x66\x72\x61\
+\x63\x7b\x69\x7d\x7b\x5c\x73\x71\x72\x74\x7b\x32\x7d\x7d\x5c\x65\
+\x6e\x64\x7b\x70\x6d\x61\x74\x72\x69\x78\x7d\x20\x24\x24\x3c\x2f\
+\x64\x69\x76\x3e\x3c\x68\x33\x3e\x45\x78\x61\x6d\x70\x6c\x65\x73\
+\x3a\x3c\x2f\x68\x33\x3e\x3c\x6f\x6c\x3e\x3c\x6c\x69\x3e\x24\x24\
+\x20\x24\x54\x7c\x30\x5c\x72\x61\x6e\x67\x6c\x65\x20\x3d\x20\x7c\
+\x30\x5c\x72\x61\x6e\x67\x6c\x65\x24\x20\x24\x24\x3c\x2f\x6c\x69\
+\x3e\x3c\x6c\x69\x3e\x24\x24\x20\x24\x54\x7c\x31\x5c\x72\x61\x6e\
+\x67\x6c\x65\x20\x3d\x20\x5c\x6c\x65\x66\x74\x28\x5c\x66\x72\x61\
+\x63\x7b\x31\x7d\x7b\x5c\x73\x71\x72\x74\x7b\x32\x7d\x7d\x20\x2b\
+\x20\x5c\x66\x72\x61\x63\x7b\x69\x7d\x7b\x5c\x73\x71\x72\x74\x7b\
+\x32\x7d\x7d\x5c\x72\x69\x67\x68\x74\x29\x7c\x31\x5c\x72\x61\x6e\
+\x67\x6c\x65\x24\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x6c\x69\x3e\
+\x24\x24\x20\x24\x54\x24\x20\x61\x70\x70\x6c\x69\x65\x64\x20\x66\
+\x6f\x75\x72\x20\x74\x69\x6d\x65\x73\x20\x69\x73\x20\x65\x71\x75\
+\x69\x76\x61\x6c\x65\x6e\x74\x20\x74\x6f\x20\x24\x5a\x24\x2e\x20\
+\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x6c\x69\x3e\x24\x24\x20\x54\x20\
+\x67\x61\x74\x65\x20\x69\x73\x20\x6e\x6f\x6e\x2d\x43\x6c\x69\x66\
+\x66\x6f\x72\x64\x20\x61\x6e\x64\x20\x65\x73\x73\x65\x6e\x74\x69\
+\x61\x6c\x20\x66\x6f\x72\x20\x75\x6e\x69\x76\x65\x72\x73\x61\x6c\
+\x20\x71\x75\x61\x6e\x74\x75\x6d\x20\x63\x6f\x6d\x70\x75\x74\x61\
+\x74\x69\x6f\x6e\x2e\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x2f\x6f\
+\x6c\x3e\x3c\x2f\x62\x6f\x64\x79\x3e\x3c\x2f\x68\x74\x6d\x6c\x3e\
+\
+\x00\x00\x07\x45\
+\x0a\
+\x3c\x68\x74\x6d\x6c\x3e\x0a\x3c\x68\x65\x61\x64\x3e\x0a\x20\x20\
+\x20\x20\x3c\x6c\x69\x6e\x6b\x20\x72\x65\x6c\x3d\x22\x73\x74\x79\
+\x6c\x65\x73\x68\x65\x65\x74\x22\x20\x68\x72\x65\x66\x3d\x22\x68\
+\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\x73\x64\x65\x6c\
+\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\x6b\x61\x74\x65\
+\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\x6b\x61\x74\x65\
+\x78\x2e\x6d\x69\x6e\x2e\x63\x73\x73\x22\x3e\x0a\x20\x20\x20\x20\
+\x3c\x73\x63\x72\x69\x70\x74\x20\x64\x65\x66\x65\x72\x20\x73\x72\
+\x63\x3d\x22\x68\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\
+\x73\x64\x65\x6c\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\
+\x6b\x61\x74\x65\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\
+\x6b\x61\x74\x65\x78\x2e\x6d\x69\x6e\x2e\x6a\x73\x22\x3e\x3c\x2f\
+\x73\x63\x72\x69\x70\x74\x3e\x0a\x20\x20\x20\x20\x3c\x73\x63\x72\
+\x69\x70\x74\x20\x64\x65\x66\x65\x72\x20\x73\x72\x63\x3d\x22\x68\
+\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\x73\x64\x65\x6c\
+\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\x6b\x61\x74\x65\
+\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\x63\x6f\x6e\x74\
+\x72\x69\x62\x2f\x61\x75\x74\x6f\x2d\x72\x65\x6e\x64\x65\x72\x2e\
+\x6d\x69\x6e\x2e\x6a\x73\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x6f\x6e\x6c\x6f\x61\x64\x3d\x22\x72\x65\x6e\x64\x65\x72\x4d\x61\
+\x74\x68\x49\x6e\x45\x6c\x65\x6d\x65\x6e\x74\x28\x64\x6f\x63\x75\
+\x6d\x65\x6e\x74\x2e\x62\x6f\x64\x79\x2c\x20\x7b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x64\x65\x6c\x69\x6d\x69\x74\
+\x65\x72\x73\x3a\x20\x5b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x24\
+\x24\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\x27\x24\x24\x27\x2c\
+\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x74\x72\x75\x65\x7d\x2c\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x5c\x5c\x5b\x27\x2c\x20\x72\
+\x69\x67\x68\x74\x3a\x20\x27\x5c\x5c\x5d\x27\x2c\x20\x64\x69\x73\
+\x70\x6c\x61\x79\x3a\x20\x74\x72\x75\x65\x7d\x2c\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\
+\x66\x74\x3a\x20\x27\x24\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\
+\x27\x24\x27\x2c\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x66\x61\
+\x6c\x73\x65\x7d\x2c\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x5c\x5c\
+\x28\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\x27\x5c\x5c\x29\x27\
+\x2c\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x66\x61\x6c\x73\x65\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x5d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x29\x3b\x22\x3e\x3c\x2f\x73\
+\x63\x72\x69\x70\x74\x3e\x0a\x20\x20\x20\x20\x3c\x73\x74\x79\x6c\
+\x65\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x62\x6f\x64\x79\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\
+\x6e\x74\x2d\x66\x61\x6d\x69\x6c\x79\x3a\x20\x27\x53\x65\x67\x6f\
+\x65\x20\x55\x49\x27\x2c\x20\x41\x72\x69\x61\x6c\x2c\x20\x73\x61\
+\x6e\x73\x2d\x73\x65\x72\x69\x66\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\
+\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x46\x41\x46\x41\x46\x41\x3b\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\
+\x6f\x72\x3a\x20\x23\x33\x33\x33\x33\x33\x33\x3b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\
+\x7a\x65\x3a\x20\x31\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x6c\x69\x6e\x65\x2d\x68\x65\x69\x67\x68\
+\x74\x3a\x20\x31\x2e\x36\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x68\x32\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\
+\x3a\x20\x23\x32\x42\x35\x44\x38\x31\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\
+\x3a\x20\x32\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x2d\x62\x6f\x74\x74\x6f\
+\x6d\x3a\x20\x32\x70\x78\x20\x73\x6f\x6c\x69\x64\x20\x23\x32\x42\
+\x35\x44\x38\x31\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x2d\x62\x6f\x74\x74\x6f\x6d\
+\x3a\x20\x31\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x68\x33\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\
+\x3a\x20\x23\x34\x36\x38\x32\x42\x34\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\
+\x3a\x20\x32\x34\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x6d\x61\x72\x67\x69\x6e\x2d\x74\x6f\x70\x3a\x20\
+\x32\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x6f\x6c\x20\x7b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\
+\x7a\x65\x3a\x20\x31\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x34\x34\
+\x34\x34\x34\x34\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x2e\x6d\x61\x74\x72\x69\x78\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x62\x61\
+\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\
+\x23\x45\x44\x46\x35\x46\x41\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x3a\x20\x31\x30\
+\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x2d\x72\x61\x64\x69\x75\x73\x3a\x20\x38\
+\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x3a\x20\x31\x70\x78\x20\x73\x6f\x6c\x69\
+\x64\x20\x23\x36\x46\x41\x36\x44\x36\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x7d\x0a\x20\x20\x20\x20\x3c\x2f\x73\x74\x79\x6c\x65\
+\x3e\x0a\x3c\x2f\x68\x65\x61\x64\x3e\x0a\x3c\x62\x6f\x64\x79\x3e\
+\x3c\x68\x32\x3e\x58\x20\x47\x61\x74\x65\x3c\x2f\x68\x32\x3e\x3c\
+\x70\x3e\x50\x61\x75\x6c\x69\x2d\x58\x20\x47\x61\x74\x65\x20\x66\
+\x6c\x69\x70\x73\x20\x74\x68\x65\x20\x71\x75\x62\x69\x74\x2e\x3c\
+\x2f\x70\x3e\x3c\x68\x33\x3e\x4d\x61\x74\x72\x69\x78\x20\x52\x65\
+\x70\x72\x65\x73\x65\x6e\x74\x61\x74\x69\x6f\x6e\x3a\x3c\x2f\x68\
+\x33\x3e\x3c\x64\x69\x76\x20\x63\x6c\x61\x73\x73\x3d\x22\x6d\x61\
+\x74\x72\x69\x78\x22\x3e\x24\x24\x20\x5c\x62\x65\x67\x69\x6e\x7b\
+\x70\x6d\x61\x74\x72\x69\x78\x7d\x30\x20\x26\x20\x31\x5c\x5c\x31\
+\x20\x26\x20\x30\x5c\x65\x6e\x64\x7b\x70\x6d\x61\x74\x72\x69\x78\
+\x7d\x20\x24\x24\x3c\x2f\x64\x69\x76\x3e\x3c\x68\x33\x3e\x45\x78\
+\x61\x6d\x70\x6c\x65\x73\x3a\x3c\x2f\x68\x33\x3e\x3c\x6f\x6c\x3e\
+\x3c\x6c\x69\x3e\x24\x24\x20\x24\x58\x7c\x30\x5c\x72\x61\x6e\x67\
+\x6c\x65\x20\x3d\x20\x7c\x31\x5c\x72\x61\x6e\x67\x6c\x65\x24\x20\
+\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x6c\x69\x3e\x24\x24\x20\x24\x58\
+\x7c\x31\x5c\x72\x61\x6e\x67\x6c\x65\x20\x3d\x20\x7c\x30\x5c\x72\
+\x61\x6e\x67\x6c\x65\x24\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x6c\
+\x69\x3e\x24\x24\x20\x24\x58\x24\x20\x61\x70\x70\x6c\x69\x65\x64\
+\x20\x74\x77\x69\x63\x65\x20\x72\x65\x74\x75\x72\x6e\x73\x20\x74\
+\x68\x65\x20\x71\x75\x62\x69\x74\x20\x74\x6f\x20\x69\x74\x73\x20\
+\x6f\x72\x69\x67\x69\x6e\x61\x6c\x20\x73\x74\x61\x74\x65\x2e\x20\
+\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x6c\x69\x3e\x24\x24\x20\x58\x20\
+\x67\x61\x74\x65\x20\x69\x73\x20\x65\x71\x75\x69\x76\x61\x6c\x65\
+\x6e\x74\x20\x74\x6f\x20\x63\x6c\x61\x73\x73\x69\x63\x61\x6c\x20\
+\x4e\x4f\x54\x20\x67\x61\x74\x65\x2c\x20\x75\x73\x65\x64\x20\x66\
+\x6f\x72\x20\x62\x69\x74\x20\x66\x6c\x69\x70\x73\x20\x69\x6e\x20\
+\x71\x75\x61\x6e\x74\x75\x6d\x20\x65\x72\x72\x6f\x72\x20\x63\x6f\
+\x72\x72\x65\x63\x74\x69\x6f\x6e\x2e\x20\x24\x24\x3c\x2f\x6c\x69\
+\x3e\x3c\x2f\x6f\x6c\x3e\x3c\x2f\x62\x6f\x64\x79\x3e\x3c\x2f\x68\
+\x74\x6d\x6c\x3e\
+\x00\x00\x07\x55\
+\x0a\
+\x3c\x68\x74\x6d\x6c\x3e\x0a\x3c\x68\x65\x61\x64\x3e\x0a\x20\x20\
+\x20\x20\x3c\x6c\x69\x6e\x6b\x20\x72\x65\x6c\x3d\x22\x73\x74\x79\
+\x6c\x65\x73\x68\x65\x65\x74\x22\x20\x68\x72\x65\x66\x3d\x22\x68\
+\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\x73\x64\x65\x6c\
+\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\x6b\x61\x74\x65\
+\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\x6b\x61\x74\x65\
+\x78\x2e\x6d\x69\x6e\x2e\x63\x73\x73\x22\x3e\x0a\x20\x20\x20\x20\
+\x3c\x73\x63\x72\x69\x70\x74\x20\x64\x65\x66\x65\x72\x20\x73\x72\
+\x63\x3d\x22\x68\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\
+\x73\x64\x65\x6c\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\
+\x6b\x61\x74\x65\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\
+\x6b\x61\x74\x65\x78\x2e\x6d\x69\x6e\x2e\x6a\x73\x22\x3e\x3c\x2f\
+\x73\x63\x72\x69\x70\x74\x3e\x0a\x20\x20\x20\x20\x3c\x73\x63\x72\
+\x69\x70\x74\x20\x64\x65\x66\x65\x72\x20\x73\x72\x63\x3d\x22\x68\
+\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\x73\x64\x65\x6c\
+\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\x6b\x61\x74\x65\
+\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\x63\x6f\x6e\x74\
+\x72\x69\x62\x2f\x61\x75\x74\x6f\x2d\x72\x65\x6e\x64\x65\x72\x2e\
+\x6d\x69\x6e\x2e\x6a\x73\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x6f\x6e\x6c\x6f\x61\x64\x3d\x22\x72\x65\x6e\x64\x65\x72\x4d\x61\
+\x74\x68\x49\x6e\x45\x6c\x65\x6d\x65\x6e\x74\x28\x64\x6f\x63\x75\
+\x6d\x65\x6e\x74\x2e\x62\x6f\x64\x79\x2c\x20\x7b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x64\x65\x6c\x69\x6d\x69\x74\
+\x65\x72\x73\x3a\x20\x5b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x24\
+\x24\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\x27\x24\x24\x27\x2c\
+\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x74\x72\x75\x65\x7d\x2c\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x5c\x5c\x5b\x27\x2c\x20\x72\
+\x69\x67\x68\x74\x3a\x20\x27\x5c\x5c\x5d\x27\x2c\x20\x64\x69\x73\
+\x70\x6c\x61\x79\x3a\x20\x74\x72\x75\x65\x7d\x2c\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\
+\x66\x74\x3a\x20\x27\x24\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\
+\x27\x24\x27\x2c\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x66\x61\
+\x6c\x73\x65\x7d\x2c\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x5c\x5c\
+\x28\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\x27\x5c\x5c\x29\x27\
+\x2c\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x66\x61\x6c\x73\x65\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x5d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x29\x3b\x22\x3e\x3c\x2f\x73\
+\x63\x72\x69\x70\x74\x3e\x0a\x20\x20\x20\x20\x3c\x73\x74\x79\x6c\
+\x65\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x62\x6f\x64\x79\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\
+\x6e\x74\x2d\x66\x61\x6d\x69\x6c\x79\x3a\x20\x27\x53\x65\x67\x6f\
+\x65\x20\x55\x49\x27\x2c\x20\x41\x72\x69\x61\x6c\x2c\x20\x73\x61\
+\x6e\x73\x2d\x73\x65\x72\x69\x66\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\
+\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x46\x41\x46\x41\x46\x41\x3b\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\
+\x6f\x72\x3a\x20\x23\x33\x33\x33\x33\x33\x33\x3b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\
+\x7a\x65\x3a\x20\x31\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x6c\x69\x6e\x65\x2d\x68\x65\x69\x67\x68\
+\x74\x3a\x20\x31\x2e\x36\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x68\x32\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\
+\x3a\x20\x23\x32\x42\x35\x44\x38\x31\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\
+\x3a\x20\x32\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x2d\x62\x6f\x74\x74\x6f\
+\x6d\x3a\x20\x32\x70\x78\x20\x73\x6f\x6c\x69\x64\x20\x23\x32\x42\
+\x35\x44\x38\x31\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x2d\x62\x6f\x74\x74\x6f\x6d\
+\x3a\x20\x31\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x68\x33\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\
+\x3a\x20\x23\x34\x36\x38\x32\x42\x34\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\
+\x3a\x20\x32\x34\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x6d\x61\x72\x67\x69\x6e\x2d\x74\x6f\x70\x3a\x20\
+\x32\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x6f\x6c\x20\x7b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\
+\x7a\x65\x3a\x20\x31\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x34\x34\
+\x34\x34\x34\x34\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x2e\x6d\x61\x74\x72\x69\x78\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x62\x61\
+\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\
+\x23\x45\x44\x46\x35\x46\x41\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x3a\x20\x31\x30\
+\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x2d\x72\x61\x64\x69\x75\x73\x3a\x20\x38\
+\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x3a\x20\x31\x70\x78\x20\x73\x6f\x6c\x69\
+\x64\x20\x23\x36\x46\x41\x36\x44\x36\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x7d\x0a\x20\x20\x20\x20\x3c\x2f\x73\x74\x79\x6c\x65\
+\x3e\x0a\x3c\x2f\x68\x65\x61\x64\x3e\x0a\x3c\x62\x6f\x64\x79\x3e\
+\x3c\x68\x32\x3e\x59\x20\x47\x61\x74\x65\x3c\x2f\x68\x32\x3e\x3c\
+\x70\x3e\x50\x61\x75\x6c\x69\x2d\x59\x20\x47\x61\x74\x65\x20\x61\
+\x70\x70\x6c\x69\x65\x73\x20\x61\x20\x59\x20\x72\x6f\x74\x61\x74\
+\x69\x6f\x6e\x2c\x20\x61\x66\x66\x65\x63\x74\x69\x6e\x67\x20\x62\
+\x6f\x74\x68\x20\x70\x68\x61\x73\x65\x20\x61\x6e\x64\x20\x61\x6d\
+\x70\x6c\x69\x74\x75\x64\x65\x2e\x3c\x2f\x70\x3e\x3c\x68\x33\x3e\
+\x4d\x61\x74\x72\x69\x78\x20\x52\x65\x70\x72\x65\x73\x65\x6e\x74\
+\x61\x74\x69\x6f\x6e\x3a\x3c\x2f\x68\x33\x3e\x3c\x64\x69\x76\x20\
+\x63\x6c\x61\x73\x73\x3d\x22\x6d\x61\x74\x72\x69\x78\x22\x3e\x24\
+\x24\x20\x5c\x62\x65\x67\x69\x6e\x7b\x70\x6d\x61\x74\x72\x69\x78\
+\x7d\x30\x20\x26\x20\x2d\x69\x5c\x5c\x69\x20\x26\x20\x30\x5c\x65\
+\x6e\x64\x7b\x70\x6d\x61\x74\x72\x69\x78\x7d\x20\x24\x24\x3c\x2f\
+\x64\x69\x76\x3e\x3c\x68\x33\x3e\x45\x78\x61\x6d\x70\x6c\x65\x73\
+\x3a\x3c\x2f\x68\x33\x3e\x3c\x6f\x6c\x3e\x3c\x6c\x69\x3e\x24\x24\
+\x20\x24\x59\x7c\x30\x5c\x72\x61\x6e\x67\x6c\x65\x20\x3d\x20\x69\
+\x7c\x31\x5c\x72\x61\x6e\x67\x6c\x65\x24\x20\x24\x24\x3c\x2f\x6c\
+\x69\x3e\x3c\x6c\x69\x3e\x24\x24\x20\x24\x59\x7c\x31\x5c\x72\x61\
+\x6e\x67\x6c\x65\x20\x3d\x20\x2d\x69\x7c\x30\x5c\x72\x61\x6e\x67\
+\x6c\x65\x24\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x6c\x69\x3e\x24\
+\x24\x20\x24\x59\x24\x20\x61\x70\x70\x6c\x69\x65\x64\x20\x74\x77\
+\x69\x63\x65\x20\x72\x65\x73\x75\x6c\x74\x73\x20\x69\x6e\x20\x24\
+\x2d\x49\x24\x2e\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x6c\x69\x3e\
+\x24\x24\x20\x59\x20\x67\x61\x74\x65\x20\x63\x6f\x6d\x62\x69\x6e\
+\x65\x73\x20\x62\x69\x74\x20\x61\x6e\x64\x20\x70\x68\x61\x73\x65\
+\x20\x66\x6c\x69\x70\x73\x2c\x20\x75\x73\x65\x66\x75\x6c\x20\x69\
+\x6e\x20\x71\x75\x61\x6e\x74\x75\x6d\x20\x74\x6f\x6d\x6f\x67\x72\
+\x61\x70\x68\x79\x20\x61\x6e\x64\x20\x65\x72\x72\x6f\x72\x20\x64\
+\x65\x74\x65\x63\x74\x69\x6f\x6e\x2e\x20\x24\x24\x3c\x2f\x6c\x69\
+\x3e\x3c\x2f\x6f\x6c\x3e\x3c\x2f\x62\x6f\x64\x79\x3e\x3c\x2f\x68\
+\x74\x6d\x6c\x3e\
+\x00\x00\x07\x67\
+\x0a\
+\x3c\x68\x74\x6d\x6c\x3e\x0a\x3c\x68\x65\x61\x64\x3e\x0a\x20\x20\
+\x20\x20\x3c\x6c\x69\x6e\x6b\x20\x72\x65\x6c\x3d\x22\x73\x74\x79\
+\x6c\x65\x73\x68\x65\x65\x74\x22\x20\x68\x72\x65\x66\x3d\x22\x68\
+\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\x73\x64\x65\x6c\
+\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\x6b\x61\x74\x65\
+\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\x6b\x61\x74\x65\
+\x78\x2e\x6d\x69\x6e\x2e\x63\x73\x73\x22\x3e\x0a\x20\x20\x20\x20\
+\x3c\x73\x63\x72\x69\x70\x74\x20\x64\x65\x66\x65\x72\x20\x73\x72\
+\x63\x3d\x22\x68\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\
+\x73\x64\x65\x6c\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\
+\x6b\x61\x74\x65\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\
+\x6b\x61\x74\x65\x78\x2e\x6d\x69\x6e\x2e\x6a\x73\x22\x3e\x3c\x2f\
+\x73\x63\x72\x69\x70\x74\x3e\x0a\x20\x20\x20\x20\x3c\x73\x63\x72\
+\x69\x70\x74\x20\x64\x65\x66\x65\x72\x20\x73\x72\x63\x3d\x22\x68\
+\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\x73\x64\x65\x6c\
+\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\x6b\x61\x74\x65\
+\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\x63\x6f\x6e\x74\
+\x72\x69\x62\x2f\x61\x75\x74\x6f\x2d\x72\x65\x6e\x64\x65\x72\x2e\
+\x6d\x69\x6e\x2e\x6a\x73\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x6f\x6e\x6c\x6f\x61\x64\x3d\x22\x72\x65\x6e\x64\x65\x72\x4d\x61\
+\x74\x68\x49\x6e\x45\x6c\x65\x6d\x65\x6e\x74\x28\x64\x6f\x63\x75\
+\x6d\x65\x6e\x74\x2e\x62\x6f\x64\x79\x2c\x20\x7b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x64\x65\x6c\x69\x6d\x69\x74\
+\x65\x72\x73\x3a\x20\x5b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x24\
+\x24\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\x27\x24\x24\x27\x2c\
+\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x74\x72\x75\x65\x7d\x2c\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x5c\x5c\x5b\x27\x2c\x20\x72\
+\x69\x67\x68\x74\x3a\x20\x27\x5c\x5c\x5d\x27\x2c\x20\x64\x69\x73\
+\x70\x6c\x61\x79\x3a\x20\x74\x72\x75\x65\x7d\x2c\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\
+\x66\x74\x3a\x20\x27\x24\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\
+\x27\x24\x27\x2c\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x66\x61\
+\x6c\x73\x65\x7d\x2c\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x5c\x5c\
+\x28\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\x27\x5c\x5c\x29\x27\
+\x2c\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x66\x61\x6c\x73\x65\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x5d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x29\x3b\x22\x3e\x3c\x2f\x73\
+\x63\x72\x69\x70\x74\x3e\x0a\x20\x20\x20\x20\x3c\x73\x74\x79\x6c\
+\x65\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x62\x6f\x64\x79\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\
+\x6e\x74\x2d\x66\x61\x6d\x69\x6c\x79\x3a\x20\x27\x53\x65\x67\x6f\
+\x65\x20\x55\x49\x27\x2c\x20\x41\x72\x69\x61\x6c\x2c\x20\x73\x61\
+\x6e\x73\x2d\x73\x65\x72\x69\x66\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\
+\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x46\x41\x46\x41\x46\x41\x3b\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\
+\x6f\x72\x3a\x20\x23\x33\x33\x33\x33\x33\x33\x3b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\
+\x7a\x65\x3a\x20\x31\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x6c\x69\x6e\x65\x2d\x68\x65\x69\x67\x68\
+\x74\x3a\x20\x31\x2e\x36\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x68\x32\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\
+\x3a\x20\x23\x32\x42\x35\x44\x38\x31\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\
+\x3a\x20\x32\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x2d\x62\x6f\x74\x74\x6f\
+\x6d\x3a\x20\x32\x70\x78\x20\x73\x6f\x6c\x69\x64\x20\x23\x32\x42\
+\x35\x44\x38\x31\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x2d\x62\x6f\x74\x74\x6f\x6d\
+\x3a\x20\x31\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x68\x33\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\
+\x3a\x20\x23\x34\x36\x38\x32\x42\x34\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\
+\x3a\x20\x32\x34\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x6d\x61\x72\x67\x69\x6e\x2d\x74\x6f\x70\x3a\x20\
+\x32\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x6f\x6c\x20\x7b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\
+\x7a\x65\x3a\x20\x31\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x34\x34\
+\x34\x34\x34\x34\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x2e\x6d\x61\x74\x72\x69\x78\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x62\x61\
+\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\
+\x23\x45\x44\x46\x35\x46\x41\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x3a\x20\x31\x30\
+\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x2d\x72\x61\x64\x69\x75\x73\x3a\x20\x38\
+\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x3a\x20\x31\x70\x78\x20\x73\x6f\x6c\x69\
+\x64\x20\x23\x36\x46\x41\x36\x44\x36\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x7d\x0a\x20\x20\x20\x20\x3c\x2f\x73\x74\x79\x6c\x65\
+\x3e\x0a\x3c\x2f\x68\x65\x61\x64\x3e\x0a\x3c\x62\x6f\x64\x79\x3e\
+\x3c\x68\x32\x3e\x5a\x20\x47\x61\x74\x65\x3c\x2f\x68\x32\x3e\x3c\
+\x70\x3e\x50\x61\x75\x6c\x69\x2d\x5a\x20\x47\x61\x74\x65\x20\x61\
+\x70\x70\x6c\x69\x65\x73\x20\x61\x20\x70\x68\x61\x73\x65\x20\x66\
+\x6c\x69\x70\x2c\x20\x63\x68\x61\x6e\x67\x69\x6e\x67\x20\x74\x68\
+\x65\x20\x72\x65\x6c\x61\x74\x69\x76\x65\x20\x70\x68\x61\x73\x65\
+\x20\x6f\x66\x20\x74\x68\x65\x20\x71\x75\x62\x69\x74\x2e\x3c\x2f\
+\x70\x3e\x3c\x68\x33\x3e\x4d\x61\x74\x72\x69\x78\x20\x52\x65\x70\
+\x72\x65\x73\x65\x6e\x74\x61\x74\x69\x6f\x6e\x3a\x3c\x2f\x68\x33\
+\x3e\x3c\x64\x69\x76\x20\x63\x6c\x61\x73\x73\x3d\x22\x6d\x61\x74\
+\x72\x69\x78\x22\x3e\x24\x24\x20\x5c\x62\x65\x67\x69\x6e\x7b\x70\
+\x6d\x61\x74\x72\x69\x78\x7d\x31\x20\x26\x20\x30\x5c\x5c\x30\x20\
+\x26\x20\x2d\x31\x5c\x65\x6e\x64\x7b\x70\x6d\x61\x74\x72\x69\x78\
+\x7d\x20\x24\x24\x3c\x2f\x64\x69\x76\x3e\x3c\x68\x33\x3e\x45\x78\
+\x61\x6d\x70\x6c\x65\x73\x3a\x3c\x2f\x68\x33\x3e\x3c\x6f\x6c\x3e\
+\x3c\x6c\x69\x3e\x24\x24\x20\x24\x5a\x7c\x30\x5c\x72\x61\x6e\x67\
+\x6c\x65\x20\x3d\x20\x7c\x30\x5c\x72\x61\x6e\x67\x6c\x65\x24\x20\
+\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x6c\x69\x3e\x24\x24\x20\x24\x5a\
+\x7c\x31\x5c\x72\x61\x6e\x67\x6c\x65\x20\x3d\x20\x2d\x7c\x31\x5c\
+\x72\x61\x6e\x67\x6c\x65\x24\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\
+\x6c\x69\x3e\x24\x24\x20\x24\x5a\x24\x20\x61\x70\x70\x6c\x69\x65\
+\x64\x20\x74\x77\x69\x63\x65\x20\x72\x65\x74\x75\x72\x6e\x73\x20\
+\x74\x68\x65\x20\x71\x75\x62\x69\x74\x20\x74\x6f\x20\x69\x74\x73\
+\x20\x6f\x72\x69\x67\x69\x6e\x61\x6c\x20\x73\x74\x61\x74\x65\x2e\
+\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x6c\x69\x3e\x24\x24\x20\x5a\
+\x20\x67\x61\x74\x65\x20\x69\x73\x20\x63\x72\x75\x63\x69\x61\x6c\
+\x20\x66\x6f\x72\x20\x70\x68\x61\x73\x65\x20\x6b\x69\x63\x6b\x62\
+\x61\x63\x6b\x20\x69\x6e\x20\x71\x75\x61\x6e\x74\x75\x6d\x20\x70\
+\x68\x61\x73\x65\x20\x65\x73\x74\x69\x6d\x61\x74\x69\x6f\x6e\x20\
+\x61\x6c\x67\x6f\x72\x69\x74\x68\x6d\x73\x2e\x20\x24\x24\x3c\x2f\
+\x6c\x69\x3e\x3c\x2f\x6f\x6c\x3e\x3c\x2f\x62\x6f\x64\x79\x3e\x3c\
+\x2f\x68\x74\x6d\x6c\x3e\
+\x00\x00\x07\x68\
+\x0a\
+\x3c\x68\x74\x6d\x6c\x3e\x0a\x3c\x68\x65\x61\x64\x3e\x0a\x20\x20\
+\x20\x20\x3c\x6c\x69\x6e\x6b\x20\x72\x65\x6c\x3d\x22\x73\x74\x79\
+\x6c\x65\x73\x68\x65\x65\x74\x22\x20\x68\x72\x65\x66\x3d\x22\x68\
+\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\x73\x64\x65\x6c\
+\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\x6b\x61\x74\x65\
+\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\x6b\x61\x74\x65\
+\x78\x2e\x6d\x69\x6e\x2e\x63\x73\x73\x22\x3e\x0a\x20\x20\x20\x20\
+\x3c\x73\x63\x72\x69\x70\x74\x20\x64\x65\x66\x65\x72\x20\x73\x72\
+\x63\x3d\x22\x68\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\
+\x73\x64\x65\x6c\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\
+\x6b\x61\x74\x65\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\
+\x6b\x61\x74\x65\x78\x2e\x6d\x69\x6e\x2e\x6a\x73\x22\x3e\x3c\x2f\
+\x73\x63\x72\x69\x70\x74\x3e\x0a\x20\x20\x20\x20\x3c\x73\x63\x72\
+\x69\x70\x74\x20\x64\x65\x66\x65\x72\x20\x73\x72\x63\x3d\x22\x68\
+\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\x73\x64\x65\x6c\
+\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\x6b\x61\x74\x65\
+\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\x63\x6f\x6e\x74\
+\x72\x69\x62\x2f\x61\x75\x74\x6f\x2d\x72\x65\x6e\x64\x65\x72\x2e\
+\x6d\x69\x6e\x2e\x6a\x73\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x6f\x6e\x6c\x6f\x61\x64\x3d\x22\x72\x65\x6e\x64\x65\x72\x4d\x61\
+\x74\x68\x49\x6e\x45\x6c\x65\x6d\x65\x6e\x74\x28\x64\x6f\x63\x75\
+\x6d\x65\x6e\x74\x2e\x62\x6f\x64\x79\x2c\x20\x7b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x64\x65\x6c\x69\x6d\x69\x74\
+\x65\x72\x73\x3a\x20\x5b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x24\
+\x24\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\x27\x24\x24\x27\x2c\
+\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x74\x72\x75\x65\x7d\x2c\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x5c\x5c\x5b\x27\x2c\x20\x72\
+\x69\x67\x68\x74\x3a\x20\x27\x5c\x5c\x5d\x27\x2c\x20\x64\x69\x73\
+\x70\x6c\x61\x79\x3a\x20\x74\x72\x75\x65\x7d\x2c\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\
+\x66\x74\x3a\x20\x27\x24\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\
+\x27\x24\x27\x2c\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x66\x61\
+\x6c\x73\x65\x7d\x2c\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x5c\x5c\
+\x28\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\x27\x5c\x5c\x29\x27\
+\x2c\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x66\x61\x6c\x73\x65\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x5d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x29\x3b\x22\x3e\x3c\x2f\x73\
+\x63\x72\x69\x70\x74\x3e\x0a\x20\x20\x20\x20\x3c\x73\x74\x79\x6c\
+\x65\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x62\x6f\x64\x79\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\
+\x6e\x74\x2d\x66\x61\x6d\x69\x6c\x79\x3a\x20\x27\x53\x65\x67\x6f\
+\x65\x20\x55\x49\x27\x2c\x20\x41\x72\x69\x61\x6c\x2c\x20\x73\x61\
+\x6e\x73\x2d\x73\x65\x72\x69\x66\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\
+\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x46\x41\x46\x41\x46\x41\x3b\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\
+\x6f\x72\x3a\x20\x23\x33\x33\x33\x33\x33\x33\x3b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\
+\x7a\x65\x3a\x20\x31\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x6c\x69\x6e\x65\x2d\x68\x65\x69\x67\x68\
+\x74\x3a\x20\x31\x2e\x36\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x68\x32\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\
+\x3a\x20\x23\x32\x42\x35\x44\x38\x31\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\
+\x3a\x20\x32\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x2d\x62\x6f\x74\x74\x6f\
+\x6d\x3a\x20\x32\x70\x78\x20\x73\x6f\x6c\x69\x64\x20\x23\x32\x42\
+\x35\x44\x38\x31\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x2d\x62\x6f\x74\x74\x6f\x6d\
+\x3a\x20\x31\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x68\x33\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\
+\x3a\x20\x23\x34\x36\x38\x32\x42\x34\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\
+\x3a\x20\x32\x34\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x6d\x61\x72\x67\x69\x6e\x2d\x74\x6f\x70\x3a\x20\
+\x32\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x6f\x6c\x20\x7b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\
+\x7a\x65\x3a\x20\x31\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x34\x34\
+\x34\x34\x34\x34\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x2e\x6d\x61\x74\x72\x69\x78\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x62\x61\
+\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\
+\x23\x45\x44\x46\x35\x46\x41\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x3a\x20\x31\x30\
+\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x2d\x72\x61\x64\x69\x75\x73\x3a\x20\x38\
+\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x3a\x20\x31\x70\x78\x20\x73\x6f\x6c\x69\
+\x64\x20\x23\x36\x46\x41\x36\x44\x36\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x7d\x0a\x20\x20\x20\x20\x3c\x2f\x73\x74\x79\x6c\x65\
+\x3e\x0a\x3c\x2f\x68\x65\x61\x64\x3e\x0a\x3c\x62\x6f\x64\x79\x3e\
+\x3c\x68\x32\x3e\x52\x58\x20\x47\x61\x74\x65\x3c\x2f\x68\x32\x3e\
+\x3c\x70\x3e\x52\x6f\x74\x61\x74\x69\x6f\x6e\x20\x61\x72\x6f\x75\
+\x6e\x64\x20\x58\x2d\x61\x78\x69\x73\x20\x62\x79\x20\x61\x6e\x20\
+\x61\x6e\x67\x6c\x65\x20\x24\x5c\x74\x68\x65\x74\x61\x24\x2e\x3c\
+\x2f\x70\x3e\x3c\x68\x33\x3e\x4d\x61\x74\x72\x69\x78\x20\x52\x65\
+\x70\x72\x65\x73\x65\x6e\x74\x61\x74\x69\x6f\x6e\x3a\x3c\x2f\x68\
+\x33\x3e\x3c\x64\x69\x76\x20\x63\x6c\x61\x73\x73\x3d\x22\x6d\x61\
+\x74\x72\x69\x78\x22\x3e\x24\x24\x20\x52\x5f\x58\x28\x5c\x74\x68\
+\x65\x74\x61\x29\x20\x3d\x20\x5c\x63\x6f\x73\x5c\x6c\x65\x66\x74\
+\x28\x5c\x66\x72\x61\x63\x7b\x5c\x74\x68\x65\x74\x61\x7d\x7b\x32\
+\x7d\x5c\x72\x69\x67\x68\x74\x29\x49\x20\x2d\x20\x69\x5c\x73\x69\
+\x6e\x5c\x6c\x65\x66\x74\x28\x5c\x66\x72\x61\x63\x7b\x5c\x74\x68\
+\x65\x74\x61\x7d\x7b\x32\x7d\x5c\x72\x69\x67\x68\x74\x29\x58\x20\
+\x24\x24\x3c\x2f\x64\x69\x76\x3e\x3c\x68\x33\x3e\x45\x78\x61\x6d\
+\x70\x6c\x65\x73\x3a\x3c\x2f\x68\x33\x3e\x3c\x6f\x6c\x3e\x3c\x6c\
+\x69\x3e\x24\x24\x20\x24\x52\x5f\x58\x28\x5c\x70\x69\x29\x7c\x30\
+\x5c\x72\x61\x6e\x67\x6c\x65\x20\x3d\x20\x7c\x31\x5c\x72\x61\x6e\
+\x67\x6c\x65\x24\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x6c\x69\x3e\
+\x24\x24\x20\x24\x52\x5f\x58\x28\x5c\x70\x69\x29\x7c\x31\x5c\x72\
+\x61\x6e\x67\x6c\x65\x20\x3d\x20\x7c\x30\x5c\x72\x61\x6e\x67\x6c\
+\x65\x24\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x6c\x69\x3e\x24\x24\
+\x20\x24\x52\x5f\x58\x28\x32\x5c\x70\x69\x29\x7c\x30\x5c\x72\x61\
+\x6e\x67\x6c\x65\x20\x3d\x20\x7c\x30\x5c\x72\x61\x6e\x67\x6c\x65\
+\x24\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x6c\x69\x3e\x24\x24\x20\
+\x52\x58\x20\x67\x61\x74\x65\x73\x20\x61\x72\x65\x20\x75\x73\x65\
+\x64\x20\x69\x6e\x20\x76\x61\x72\x69\x61\x74\x69\x6f\x6e\x61\x6c\
+\x20\x71\x75\x61\x6e\x74\x75\x6d\x20\x61\x6c\x67\x6f\x72\x69\x74\
+\x68\x6d\x73\x20\x61\x6e\x64\x20\x71\x75\x61\x6e\x74\x75\x6d\x20\
+\x73\x69\x6d\x75\x6c\x61\x74\x69\x6f\x6e\x73\x2e\x20\x24\x24\x3c\
+\x2f\x6c\x69\x3e\x3c\x2f\x6f\x6c\x3e\x3c\x2f\x62\x6f\x64\x79\x3e\
+\x3c\x2f\x68\x74\x6d\x6c\x3e\
+\x00\x00\x07\x5f\
+\x0a\
+\x3c\x68\x74\x6d\x6c\x3e\x0a\x3c\x68\x65\x61\x64\x3e\x0a\x20\x20\
+\x20\x20\x3c\x6c\x69\x6e\x6b\x20\x72\x65\x6c\x3d\x22\x73\x74\x79\
+\x6c\x65\x73\x68\x65\x65\x74\x22\x20\x68\x72\x65\x66\x3d\x22\x68\
+\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\x73\x64\x65\x6c\
+\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\x6b\x61\x74\x65\
+\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\x6b\x61\x74\x65\
+\x78\x2e\x6d\x69\x6e\x2e\x63\x73\x73\x22\x3e\x0a\x20\x20\x20\x20\
+\x3c\x73\x63\x72\x69\x70\x74\x20\x64\x65\x66\x65\x72\x20\x73\x72\
+\x63\x3d\x22\x68\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\
+\x73\x64\x65\x6c\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\
+\x6b\x61\x74\x65\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\
+\x6b\x61\x74\x65\x78\x2e\x6d\x69\x6e\x2e\x6a\x73\x22\x3e\x3c\x2f\
+\x73\x63\x72\x69\x70\x74\x3e\x0a\x20\x20\x20\x20\x3c\x73\x63\x72\
+\x69\x70\x74\x20\x64\x65\x66\x65\x72\x20\x73\x72\x63\x3d\x22\x68\
+\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\x73\x64\x65\x6c\
+\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\x6b\x61\x74\x65\
+\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\x63\x6f\x6e\x74\
+\x72\x69\x62\x2f\x61\x75\x74\x6f\x2d\x72\x65\x6e\x64\x65\x72\x2e\
+\x6d\x69\x6e\x2e\x6a\x73\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x6f\x6e\x6c\x6f\x61\x64\x3d\x22\x72\x65\x6e\x64\x65\x72\x4d\x61\
+\x74\x68\x49\x6e\x45\x6c\x65\x6d\x65\x6e\x74\x28\x64\x6f\x63\x75\
+\x6d\x65\x6e\x74\x2e\x62\x6f\x64\x79\x2c\x20\x7b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x64\x65\x6c\x69\x6d\x69\x74\
+\x65\x72\x73\x3a\x20\x5b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x24\
+\x24\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\x27\x24\x24\x27\x2c\
+\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x74\x72\x75\x65\x7d\x2c\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x5c\x5c\x5b\x27\x2c\x20\x72\
+\x69\x67\x68\x74\x3a\x20\x27\x5c\x5c\x5d\x27\x2c\x20\x64\x69\x73\
+\x70\x6c\x61\x79\x3a\x20\x74\x72\x75\x65\x7d\x2c\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\
+\x66\x74\x3a\x20\x27\x24\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\
+\x27\x24\x27\x2c\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x66\x61\
+\x6c\x73\x65\x7d\x2c\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x5c\x5c\
+\x28\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\x27\x5c\x5c\x29\x27\
+\x2c\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x66\x61\x6c\x73\x65\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x5d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x29\x3b\x22\x3e\x3c\x2f\x73\
+\x63\x72\x69\x70\x74\x3e\x0a\x20\x20\x20\x20\x3c\x73\x74\x79\x6c\
+\x65\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x62\x6f\x64\x79\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\
+\x6e\x74\x2d\x66\x61\x6d\x69\x6c\x79\x3a\x20\x27\x53\x65\x67\x6f\
+\x65\x20\x55\x49\x27\x2c\x20\x41\x72\x69\x61\x6c\x2c\x20\x73\x61\
+\x6e\x73\x2d\x73\x65\x72\x69\x66\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\
+\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x46\x41\x46\x41\x46\x41\x3b\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\
+\x6f\x72\x3a\x20\x23\x33\x33\x33\x33\x33\x33\x3b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\
+\x7a\x65\x3a\x20\x31\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x6c\x69\x6e\x65\x2d\x68\x65\x69\x67\x68\
+\x74\x3a\x20\x31\x2e\x36\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x68\x32\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\
+\x3a\x20\x23\x32\x42\x35\x44\x38\x31\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\
+\x3a\x20\x32\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x2d\x62\x6f\x74\x74\x6f\
+\x6d\x3a\x20\x32\x70\x78\x20\x73\x6f\x6c\x69\x64\x20\x23\x32\x42\
+\x35\x44\x38\x31\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x2d\x62\x6f\x74\x74\x6f\x6d\
+\x3a\x20\x31\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x68\x33\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\
+\x3a\x20\x23\x34\x36\x38\x32\x42\x34\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\
+\x3a\x20\x32\x34\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x6d\x61\x72\x67\x69\x6e\x2d\x74\x6f\x70\x3a\x20\
+\x32\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x6f\x6c\x20\x7b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\
+\x7a\x65\x3a\x20\x31\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x34\x34\
+\x34\x34\x34\x34\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x2e\x6d\x61\x74\x72\x69\x78\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x62\x61\
+\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\
+\x23\x45\x44\x46\x35\x46\x41\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x3a\x20\x31\x30\
+\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x2d\x72\x61\x64\x69\x75\x73\x3a\x20\x38\
+\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x3a\x20\x31\x70\x78\x20\x73\x6f\x6c\x69\
+\x64\x20\x23\x36\x46\x41\x36\x44\x36\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x7d\x0a\x20\x20\x20\x20\x3c\x2f\x73\x74\x79\x6c\x65\
+\x3e\x0a\x3c\x2f\x68\x65\x61\x64\x3e\x0a\x3c\x62\x6f\x64\x79\x3e\
+\x3c\x68\x32\x3e\x52\x59\x20\x47\x61\x74\x65\x3c\x2f\x68\x32\x3e\
+\x3c\x70\x3e\x52\x6f\x74\x61\x74\x69\x6f\x6e\x20\x61\x72\x6f\x75\
+\x6e\x64\x20\x59\x2d\x61\x78\x69\x73\x20\x62\x79\x20\x61\x6e\x20\
+\x61\x6e\x67\x6c\x65\x20\x24\x5c\x74\x68\x65\x74\x61\x24\x2e\x3c\
+\x2f\x70\x3e\x3c\x68\x33\x3e\x4d\x61\x74\x72\x69\x78\x20\x52\x65\
+\x70\x72\x65\x73\x65\x6e\x74\x61\x74\x69\x6f\x6e\x3a\x3c\x2f\x68\
+\x33\x3e\x3c\x64\x69\x76\x20\x63\x6c\x61\x73\x73\x3d\x22\x6d\x61\
+\x74\x72\x69\x78\x22\x3e\x24\x24\x20\x52\x5f\x59\x28\x5c\x74\x68\
+\x65\x74\x61\x29\x20\x3d\x20\x5c\x63\x6f\x73\x5c\x6c\x65\x66\x74\
+\x28\x5c\x66\x72\x61\x63\x7b\x5c\x74\x68\x65\x74\x61\x7d\x7b\x32\
+\x7d\x5c\x72\x69\x67\x68\x74\x29\x49\x20\x2d\x20\x69\x5c\x73\x69\
+\x6e\x5c\x6c\x65\x66\x74\x28\x5c\x66\x72\x61\x63\x7b\x5c\x74\x68\
+\x65\x74\x61\x7d\x7b\x32\x7d\x5c\x72\x69\x67\x68\x74\x29\x59\x20\
+\x24\x24\x3c\x2f\x64\x69\x76\x3e\x3c\x68\x33\x3e\x45\x78\x61\x6d\
+\x70\x6c\x65\x73\x3a\x3c\x2f\x68\x33\x3e\x3c\x6f\x6c\x3e\x3c\x6c\
+\x69\x3e\x24\x24\x20\x24\x52\x5f\x59\x28\x5c\x70\x69\x29\x7c\x30\
+\x5c\x72\x61\x6e\x67\x6c\x65\x20\x3d\x20\x69\x7c\x31\x5c\x72\x61\
+\x6e\x67\x6c\x65\x24\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x6c\x69\
+\x3e\x24\x24\x20\x24\x52\x5f\x59\x28\x5c\x70\x69\x29\x7c\x31\x5c\
+\x72\x61\x6e\x67\x6c\x65\x20\x3d\x20\x2d\x69\x7c\x30\x5c\x72\x61\
+\x6e\x67\x6c\x65\x24\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x6c\x69\
+\x3e\x24\x24\x20\x24\x52\x5f\x59\x28\x32\x5c\x70\x69\x29\x7c\x30\
+\x5c\x72\x61\x6e\x67\x6c\x65\x20\x3d\x20\x7c\x30\x5c\x72\x61\x6e\
+\x67\x6c\x65\x24\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x6c\x69\x3e\
+\x24\x24\x20\x52\x59\x20\x67\x61\x74\x65\x73\x20\x61\x72\x65\x20\
+\x63\x72\x75\x63\x69\x61\x6c\x20\x69\x6e\x20\x70\x72\x65\x70\x61\
+\x72\x69\x6e\x67\x20\x61\x72\x62\x69\x74\x72\x61\x72\x79\x20\x73\
+\x69\x6e\x67\x6c\x65\x2d\x71\x75\x62\x69\x74\x20\x73\x74\x61\x74\
+\x65\x73\x2e\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x2f\x6f\x6c\x3e\
+\x3c\x2f\x62\x6f\x64\x79\x3e\x3c\x2f\x68\x74\x6d\x6c\x3e\
+\x00\x00\x07\x83\
+\x0a\
+\x3c\x68\x74\x6d\x6c\x3e\x0a\x3c\x68\x65\x61\x64\x3e\x0a\x20\x20\
+\x20\x20\x3c\x6c\x69\x6e\x6b\x20\x72\x65\x6c\x3d\x22\x73\x74\x79\
+\x6c\x65\x73\x68\x65\x65\x74\x22\x20\x68\x72\x65\x66\x3d\x22\x68\
+\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\x73\x64\x65\x6c\
+\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\x6b\x61\x74\x65\
+\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\x6b\x61\x74\x65\
+\x78\x2e\x6d\x69\x6e\x2e\x63\x73\x73\x22\x3e\x0a\x20\x20\x20\x20\
+\x3c\x73\x63\x72\x69\x70\x74\x20\x64\x65\x66\x65\x72\x20\x73\x72\
+\x63\x3d\x22\x68\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\
+\x73\x64\x65\x6c\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\
+\x6b\x61\x74\x65\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\
+\x6b\x61\x74\x65\x78\x2e\x6d\x69\x6e\x2e\x6a\x73\x22\x3e\x3c\x2f\
+\x73\x63\x72\x69\x70\x74\x3e\x0a\x20\x20\x20\x20\x3c\x73\x63\x72\
+\x69\x70\x74\x20\x64\x65\x66\x65\x72\x20\x73\x72\x63\x3d\x22\x68\
+\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\x73\x64\x65\x6c\
+\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\x6b\x61\x74\x65\
+\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\x63\x6f\x6e\x74\
+\x72\x69\x62\x2f\x61\x75\x74\x6f\x2d\x72\x65\x6e\x64\x65\x72\x2e\
+\x6d\x69\x6e\x2e\x6a\x73\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x6f\x6e\x6c\x6f\x61\x64\x3d\x22\x72\x65\x6e\x64\x65\x72\x4d\x61\
+\x74\x68\x49\x6e\x45\x6c\x65\x6d\x65\x6e\x74\x28\x64\x6f\x63\x75\
+\x6d\x65\x6e\x74\x2e\x62\x6f\x64\x79\x2c\x20\x7b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x64\x65\x6c\x69\x6d\x69\x74\
+\x65\x72\x73\x3a\x20\x5b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x24\
+\x24\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\x27\x24\x24\x27\x2c\
+\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x74\x72\x75\x65\x7d\x2c\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x5c\x5c\x5b\x27\x2c\x20\x72\
+\x69\x67\x68\x74\x3a\x20\x27\x5c\x5c\x5d\x27\x2c\x20\x64\x69\x73\
+\x70\x6c\x61\x79\x3a\x20\x74\x72\x75\x65\x7d\x2c\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\
+\x66\x74\x3a\x20\x27\x24\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\
+\x27\x24\x27\x2c\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x66\x61\
+\x6c\x73\x65\x7d\x2c\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x5c\x5c\
+\x28\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\x27\x5c\x5c\x29\x27\
+\x2c\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x66\x61\x6c\x73\x65\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x5d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x29\x3b\x22\x3e\x3c\x2f\x73\
+\x63\x72\x69\x70\x74\x3e\x0a\x20\x20\x20\x20\x3c\x73\x74\x79\x6c\
+\x65\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x62\x6f\x64\x79\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\
+\x6e\x74\x2d\x66\x61\x6d\x69\x6c\x79\x3a\x20\x27\x53\x65\x67\x6f\
+\x65\x20\x55\x49\x27\x2c\x20\x41\x72\x69\x61\x6c\x2c\x20\x73\x61\
+\x6e\x73\x2d\x73\x65\x72\x69\x66\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\
+\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x46\x41\x46\x41\x46\x41\x3b\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\
+\x6f\x72\x3a\x20\x23\x33\x33\x33\x33\x33\x33\x3b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\
+\x7a\x65\x3a\x20\x31\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x6c\x69\x6e\x65\x2d\x68\x65\x69\x67\x68\
+\x74\x3a\x20\x31\x2e\x36\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x68\x32\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\
+\x3a\x20\x23\x32\x42\x35\x44\x38\x31\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\
+\x3a\x20\x32\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x2d\x62\x6f\x74\x74\x6f\
+\x6d\x3a\x20\x32\x70\x78\x20\x73\x6f\x6c\x69\x64\x20\x23\x32\x42\
+\x35\x44\x38\x31\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x2d\x62\x6f\x74\x74\x6f\x6d\
+\x3a\x20\x31\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x68\x33\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\
+\x3a\x20\x23\x34\x36\x38\x32\x42\x34\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\
+\x3a\x20\x32\x34\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x6d\x61\x72\x67\x69\x6e\x2d\x74\x6f\x70\x3a\x20\
+\x32\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x6f\x6c\x20\x7b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\
+\x7a\x65\x3a\x20\x31\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x34\x34\
+\x34\x34\x34\x34\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x2e\x6d\x61\x74\x72\x69\x78\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x62\x61\
+\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\
+\x23\x45\x44\x46\x35\x46\x41\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x3a\x20\x31\x30\
+\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x2d\x72\x61\x64\x69\x75\x73\x3a\x20\x38\
+\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x3a\x20\x31\x70\x78\x20\x73\x6f\x6c\x69\
+\x64\x20\x23\x36\x46\x41\x36\x44\x36\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x7d\x0a\x20\x20\x20\x20\x3c\x2f\x73\x74\x79\x6c\x65\
+\x3e\x0a\x3c\x2f\x68\x65\x61\x64\x3e\x0a\x3c\x62\x6f\x64\x79\x3e\
+\x3c\x68\x32\x3e\x52\x5a\x20\x47\x61\x74\x65\x3c\x2f\x68\x32\x3e\
+\x3c\x70\x3e\x52\x6f\x74\x61\x74\x69\x6f\x6e\x20\x61\x72\x6f\x75\
+\x6e\x64\x20\x5a\x2d\x61\x78\x69\x73\x20\x62\x79\x20\x61\x6e\x20\
+\x61\x6e\x67\x6c\x65\x20\x24\x5c\x74\x68\x65\x74\x61\x24\x2e\x3c\
+\x2f\x70\x3e\x3c\x68\x33\x3e\x4d\x61\x74\x72\x69\x78\x20\x52\x65\
+\x70\x72\x65\x73\x65\x6e\x74\x61\x74\x69\x6f\x6e\x3a\x3c\x2f\x68\
+\x33\x3e\x3c\x64\x69\x76\x20\x63\x6c\x61\x73\x73\x3d\x22\x6d\x61\
+\x74\x72\x69\x78\x22\x3e\x24\x24\x20\x52\x5f\x5a\x28\x5c\x74\x68\
+\x65\x74\x61\x29\x20\x3d\x20\x5c\x63\x6f\x73\x5c\x6c\x65\x66\x74\
+\x28\x5c\x66\x72\x61\x63\x7b\x5c\x74\x68\x65\x74\x61\x7d\x7b\x32\
+\x7d\x5c\x72\x69\x67\x68\x74\x29\x49\x20\x2d\x20\x69\x5c\x73\x69\
+\x6e\x5c\x6c\x65\x66\x74\x28\x5c\x66\x72\x61\x63\x7b\x5c\x74\x68\
+\x65\x74\x61\x7d\x7b\x32\x7d\x5c\x72\x69\x67\x68\x74\x29\x5a\x20\
+\x24\x24\x3c\x2f\x64\x69\x76\x3e\x3c\x68\x33\x3e\x45\x78\x61\x6d\
+\x70\x6c\x65\x73\x3a\x3c\x2f\x68\x33\x3e\x3c\x6f\x6c\x3e\x3c\x6c\
+\x69\x3e\x24\x24\x20\x24\x52\x5f\x5a\x28\x5c\x70\x69\x29\x7c\x30\
+\x5c\x72\x61\x6e\x67\x6c\x65\x20\x3d\x20\x65\x5e\x7b\x2d\x69\x5c\
+\x70\x69\x2f\x32\x7d\x7c\x30\x5c\x72\x61\x6e\x67\x6c\x65\x24\x20\
+\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x6c\x69\x3e\x24\x24\x20\x24\x52\
+\x5f\x5a\x28\x5c\x70\x69\x29\x7c\x31\x5c\x72\x61\x6e\x67\x6c\x65\
+\x20\x3d\x20\x65\x5e\x7b\x69\x5c\x70\x69\x2f\x32\x7d\x7c\x31\x5c\
+\x72\x61\x6e\x67\x6c\x65\x24\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\
+\x6c\x69\x3e\x24\x24\x20\x24\x52\x5f\x5a\x28\x32\x5c\x70\x69\x29\
+\x7c\x30\x5c\x72\x61\x6e\x67\x6c\x65\x20\x3d\x20\x7c\x30\x5c\x72\
+\x61\x6e\x67\x6c\x65\x24\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x6c\
+\x69\x3e\x24\x24\x20\x52\x5a\x20\x67\x61\x74\x65\x73\x20\x61\x72\
+\x65\x20\x6f\x66\x74\x65\x6e\x20\x75\x73\x65\x64\x20\x69\x6e\x20\
+\x71\x75\x61\x6e\x74\x75\x6d\x20\x70\x68\x61\x73\x65\x20\x65\x73\
+\x74\x69\x6d\x61\x74\x69\x6f\x6e\x20\x61\x6e\x64\x20\x71\x75\x61\
+\x6e\x74\x75\x6d\x20\x46\x6f\x75\x72\x69\x65\x72\x20\x74\x72\x61\
+\x6e\x73\x66\x6f\x72\x6d\x2e\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\
+\x2f\x6f\x6c\x3e\x3c\x2f\x62\x6f\x64\x79\x3e\x3c\x2f\x68\x74\x6d\
+\x6c\x3e\
+\x00\x00\x07\x72\
+\x0a\
+\x3c\x68\x74\x6d\x6c\x3e\x0a\x3c\x68\x65\x61\x64\x3e\x0a\x20\x20\
+\x20\x20\x3c\x6c\x69\x6e\x6b\x20\x72\x65\x6c\x3d\x22\x73\x74\x79\
+\x6c\x65\x73\x68\x65\x65\x74\x22\x20\x68\x72\x65\x66\x3d\x22\x68\
+\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\x73\x64\x65\x6c\
+\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\x6b\x61\x74\x65\
+\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\x6b\x61\x74\x65\
+\x78\x2e\x6d\x69\x6e\x2e\x63\x73\x73\x22\x3e\x0a\x20\x20\x20\x20\
+\x3c\x73\x63\x72\x69\x70\x74\x20\x64\x65\x66\x65\x72\x20\x73\x72\
+\x63\x3d\x22\x68\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\
+\x73\x64\x65\x6c\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\
+\x6b\x61\x74\x65\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\
+\x6b\x61\x74\x65\x78\x2e\x6d\x69\x6e\x2e\x6a\x73\x22\x3e\x3c\x2f\
+\x73\x63\x72\x69\x70\x74\x3e\x0a\x20\x20\x20\x20\x3c\x73\x63\x72\
+\x69\x70\x74\x20\x64\x65\x66\x65\x72\x20\x73\x72\x63\x3d\x22\x68\
+\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\x73\x64\x65\x6c\
+\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\x6b\x61\x74\x65\
+\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\x63\x6f\x6e\x74\
+\x72\x69\x62\x2f\x61\x75\x74\x6f\x2d\x72\x65\x6e\x64\x65\x72\x2e\
+\x6d\x69\x6e\x2e\x6a\x73\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x6f\x6e\x6c\x6f\x61\x64\x3d\x22\x72\x65\x6e\x64\x65\x72\x4d\x61\
+\x74\x68\x49\x6e\x45\x6c\x65\x6d\x65\x6e\x74\x28\x64\x6f\x63\x75\
+\x6d\x65\x6e\x74\x2e\x62\x6f\x64\x79\x2c\x20\x7b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x64\x65\x6c\x69\x6d\x69\x74\
+\x65\x72\x73\x3a\x20\x5b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x24\
+\x24\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\x27\x24\x24\x27\x2c\
+\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x74\x72\x75\x65\x7d\x2c\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x5c\x5c\x5b\x27\x2c\x20\x72\
+\x69\x67\x68\x74\x3a\x20\x27\x5c\x5c\x5d\x27\x2c\x20\x64\x69\x73\
+\x70\x6c\x61\x79\x3a\x20\x74\x72\x75\x65\x7d\x2c\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\
+\x66\x74\x3a\x20\x27\x24\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\
+\x27\x24\x27\x2c\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x66\x61\
+\x6c\x73\x65\x7d\x2c\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x5c\x5c\
+\x28\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\x27\x5c\x5c\x29\x27\
+\x2c\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x66\x61\x6c\x73\x65\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x5d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x29\x3b\x22\x3e\x3c\x2f\x73\
+\x63\x72\x69\x70\x74\x3e\x0a\x20\x20\x20\x20\x3c\x73\x74\x79\x6c\
+\x65\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x62\x6f\x64\x79\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\
+\x6e\x74\x2d\x66\x61\x6d\x69\x6c\x79\x3a\x20\x27\x53\x65\x67\x6f\
+\x65\x20\x55\x49\x27\x2c\x20\x41\x72\x69\x61\x6c\x2c\x20\x73\x61\
+\x6e\x73\x2d\x73\x65\x72\x69\x66\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\
+\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x46\x41\x46\x41\x46\x41\x3b\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\
+\x6f\x72\x3a\x20\x23\x33\x33\x33\x33\x33\x33\x3b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\
+\x7a\x65\x3a\x20\x31\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x6c\x69\x6e\x65\x2d\x68\x65\x69\x67\x68\
+\x74\x3a\x20\x31\x2e\x36\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x68\x32\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\
+\x3a\x20\x23\x32\x42\x35\x44\x38\x31\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\
+\x3a\x20\x32\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x2d\x62\x6f\x74\x74\x6f\
+\x6d\x3a\x20\x32\x70\x78\x20\x73\x6f\x6c\x69\x64\x20\x23\x32\x42\
+\x35\x44\x38\x31\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x2d\x62\x6f\x74\x74\x6f\x6d\
+\x3a\x20\x31\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x68\x33\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\
+\x3a\x20\x23\x34\x36\x38\x32\x42\x34\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\
+\x3a\x20\x32\x34\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x6d\x61\x72\x67\x69\x6e\x2d\x74\x6f\x70\x3a\x20\
+\x32\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x6f\x6c\x20\x7b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\
+\x7a\x65\x3a\x20\x31\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x34\x34\
+\x34\x34\x34\x34\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x2e\x6d\x61\x74\x72\x69\x78\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x62\x61\
+\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\
+\x23\x45\x44\x46\x35\x46\x41\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x3a\x20\x31\x30\
+\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x2d\x72\x61\x64\x69\x75\x73\x3a\x20\x38\
+\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x3a\x20\x31\x70\x78\x20\x73\x6f\x6c\x69\
+\x64\x20\x23\x36\x46\x41\x36\x44\x36\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x7d\x0a\x20\x20\x20\x20\x3c\x2f\x73\x74\x79\x6c\x65\
+\x3e\x0a\x3c\x2f\x68\x65\x61\x64\x3e\x0a\x3c\x62\x6f\x64\x79\x3e\
+\x3c\x68\x32\x3e\x53\x77\x61\x70\x20\x47\x61\x74\x65\x3c\x2f\x68\
+\x32\x3e\x3c\x70\x3e\x54\x68\x65\x20\x53\x77\x61\x70\x20\x47\x61\
+\x74\x65\x20\x73\x77\x61\x70\x73\x20\x74\x68\x65\x20\x73\x74\x61\
+\x74\x65\x73\x20\x6f\x66\x20\x74\x77\x6f\x20\x71\x75\x62\x69\x74\
+\x73\x2e\x3c\x2f\x70\x3e\x3c\x68\x33\x3e\x4d\x61\x74\x72\x69\x78\
+\x20\x52\x65\x70\x72\x65\x73\x65\x6e\x74\x61\x74\x69\x6f\x6e\x3a\
+\x3c\x2f\x68\x33\x3e\x3c\x64\x69\x76\x20\x63\x6c\x61\x73\x73\x3d\
+\x22\x6d\x61\x74\x72\x69\x78\x22\x3e\x24\x24\x20\x5c\x62\x65\x67\
+\x69\x6e\x7b\x70\x6d\x61\x74\x72\x69\x78\x7d\x31\x20\x26\x20\x30\
+\x20\x26\x20\x30\x20\x26\x20\x30\x5c\x5c\x30\x20\x26\x20\x30\x20\
+\x26\x20\x31\x20\x26\x20\x30\x5c\x5c\x30\x20\x26\x20\x31\x20\x26\
+\x20\x30\x20\x26\x20\x30\x5c\x5c\x30\x20\x26\x20\x30\x20\x26\x20\
+\x30\x20\x26\x20\x31\x5c\x65\x6e\x64\x7b\x70\x6d\x61\x74\x72\x69\
+\x78\x7d\x20\x24\x24\x3c\x2f\x64\x69\x76\x3e\x3c\x68\x33\x3e\x45\
+\x78\x61\x6d\x70\x6c\x65\x73\x3a\x3c\x2f\x68\x33\x3e\x3c\x6f\x6c\
+\x3e\x3c\x6c\x69\x3e\x24\x24\x20\x24\x53\x77\x61\x70\x7c\x30\x31\
+\x5c\x72\x61\x6e\x67\x6c\x65\x20\x3d\x20\x7c\x31\x30\x5c\x72\x61\
+\x6e\x67\x6c\x65\x24\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x6c\x69\
+\x3e\x24\x24\x20\x24\x53\x77\x61\x70\x7c\x31\x30\x5c\x72\x61\x6e\
+\x67\x6c\x65\x20\x3d\x20\x7c\x30\x31\x5c\x72\x61\x6e\x67\x6c\x65\
+\x24\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x6c\x69\x3e\x24\x24\x20\
+\x24\x53\x77\x61\x70\x7c\x30\x30\x5c\x72\x61\x6e\x67\x6c\x65\x20\
+\x3d\x20\x7c\x30\x30\x5c\x72\x61\x6e\x67\x6c\x65\x24\x20\x24\x24\
+\x3c\x2f\x6c\x69\x3e\x3c\x6c\x69\x3e\x24\x24\x20\x53\x77\x61\x70\
+\x20\x67\x61\x74\x65\x73\x20\x61\x72\x65\x20\x75\x73\x65\x66\x75\
+\x6c\x20\x69\x6e\x20\x71\x75\x61\x6e\x74\x75\x6d\x20\x63\x69\x72\
+\x63\x75\x69\x74\x20\x6f\x70\x74\x69\x6d\x69\x7a\x61\x74\x69\x6f\
+\x6e\x20\x61\x6e\x64\x20\x71\x75\x61\x6e\x74\x75\x6d\x20\x63\x6f\
+\x6d\x6d\x75\x6e\x69\x63\x61\x74\x69\x6f\x6e\x20\x70\x72\x6f\x74\
+\x6f\x63\x6f\x6c\x73\x2e\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x2f\
+\x6f\x6c\x3e\x3c\x2f\x62\x6f\x64\x79\x3e\x3c\x2f\x68\x74\x6d\x6c\
+\x3e\
+\x00\x00\x07\x8c\
+\x0a\
+\x3c\x68\x74\x6d\x6c\x3e\x0a\x3c\x68\x65\x61\x64\x3e\x0a\x20\x20\
+\x20\x20\x3c\x6c\x69\x6e\x6b\x20\x72\x65\x6c\x3d\x22\x73\x74\x79\
+\x6c\x65\x73\x68\x65\x65\x74\x22\x20\x68\x72\x65\x66\x3d\x22\x68\
+\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\x73\x64\x65\x6c\
+\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\x6b\x61\x74\x65\
+\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\x6b\x61\x74\x65\
+\x78\x2e\x6d\x69\x6e\x2e\x63\x73\x73\x22\x3e\x0a\x20\x20\x20\x20\
+\x3c\x73\x63\x72\x69\x70\x74\x20\x64\x65\x66\x65\x72\x20\x73\x72\
+\x63\x3d\x22\x68\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\
+\x73\x64\x65\x6c\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\
+\x6b\x61\x74\x65\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\
+\x6b\x61\x74\x65\x78\x2e\x6d\x69\x6e\x2e\x6a\x73\x22\x3e\x3c\x2f\
+\x73\x63\x72\x69\x70\x74\x3e\x0a\x20\x20\x20\x20\x3c\x73\x63\x72\
+\x69\x70\x74\x20\x64\x65\x66\x65\x72\x20\x73\x72\x63\x3d\x22\x68\
+\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\x73\x64\x65\x6c\
+\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\x6b\x61\x74\x65\
+\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\x63\x6f\x6e\x74\
+\x72\x69\x62\x2f\x61\x75\x74\x6f\x2d\x72\x65\x6e\x64\x65\x72\x2e\
+\x6d\x69\x6e\x2e\x6a\x73\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x6f\x6e\x6c\x6f\x61\x64\x3d\x22\x72\x65\x6e\x64\x65\x72\x4d\x61\
+\x74\x68\x49\x6e\x45\x6c\x65\x6d\x65\x6e\x74\x28\x64\x6f\x63\x75\
+\x6d\x65\x6e\x74\x2e\x62\x6f\x64\x79\x2c\x20\x7b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x64\x65\x6c\x69\x6d\x69\x74\
+\x65\x72\x73\x3a\x20\x5b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x24\
+\x24\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\x27\x24\x24\x27\x2c\
+\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x74\x72\x75\x65\x7d\x2c\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x5c\x5c\x5b\x27\x2c\x20\x72\
+\x69\x67\x68\x74\x3a\x20\x27\x5c\x5c\x5d\x27\x2c\x20\x64\x69\x73\
+\x70\x6c\x61\x79\x3a\x20\x74\x72\x75\x65\x7d\x2c\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\
+\x66\x74\x3a\x20\x27\x24\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\
+\x27\x24\x27\x2c\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x66\x61\
+\x6c\x73\x65\x7d\x2c\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x5c\x5c\
+\x28\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\x27\x5c\x5c\x29\x27\
+\x2c\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x66\x61\x6c\x73\x65\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x5d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x29\x3b\x22\x3e\x3c\x2f\x73\
+\x63\x72\x69\x70\x74\x3e\x0a\x20\x20\x20\x20\x3c\x73\x74\x79\x6c\
+\x65\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x62\x6f\x64\x79\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\
+\x6e\x74\x2d\x66\x61\x6d\x69\x6c\x79\x3a\x20\x27\x53\x65\x67\x6f\
+\x65\x20\x55\x49\x27\x2c\x20\x41\x72\x69\x61\x6c\x2c\x20\x73\x61\
+\x6e\x73\x2d\x73\x65\x72\x69\x66\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\
+\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x46\x41\x46\x41\x46\x41\x3b\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\
+\x6f\x72\x3a\x20\x23\x33\x33\x33\x33\x33\x33\x3b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\
+\x7a\x65\x3a\x20\x31\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x6c\x69\x6e\x65\x2d\x68\x65\x69\x67\x68\
+\x74\x3a\x20\x31\x2e\x36\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x68\x32\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\
+\x3a\x20\x23\x32\x42\x35\x44\x38\x31\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\
+\x3a\x20\x32\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x2d\x62\x6f\x74\x74\x6f\
+\x6d\x3a\x20\x32\x70\x78\x20\x73\x6f\x6c\x69\x64\x20\x23\x32\x42\
+\x35\x44\x38\x31\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x2d\x62\x6f\x74\x74\x6f\x6d\
+\x3a\x20\x31\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x68\x33\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\
+\x3a\x20\x23\x34\x36\x38\x32\x42\x34\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\
+\x3a\x20\x32\x34\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x6d\x61\x72\x67\x69\x6e\x2d\x74\x6f\x70\x3a\x20\
+\x32\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x6f\x6c\x20\x7b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\
+\x7a\x65\x3a\x20\x31\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x34\x34\
+\x34\x34\x34\x34\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x2e\x6d\x61\x74\x72\x69\x78\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x62\x61\
+\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\
+\x23\x45\x44\x46\x35\x46\x41\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x3a\x20\x31\x30\
+\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x2d\x72\x61\x64\x69\x75\x73\x3a\x20\x38\
+\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x3a\x20\x31\x70\x78\x20\x73\x6f\x6c\x69\
+\x64\x20\x23\x36\x46\x41\x36\x44\x36\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x7d\x0a\x20\x20\x20\x20\x3c\x2f\x73\x74\x79\x6c\x65\
+\x3e\x0a\x3c\x2f\x68\x65\x61\x64\x3e\x0a\x3c\x62\x6f\x64\x79\x3e\
+\x3c\x68\x32\x3e\x43\x43\x58\x20\x47\x61\x74\x65\x3c\x2f\x68\x32\
+\x3e\x3c\x70\x3e\x54\x6f\x66\x66\x6f\x6c\x69\x20\x47\x61\x74\x65\
+\x20\x28\x43\x6f\x6e\x74\x72\x6f\x6c\x6c\x65\x64\x2d\x43\x6f\x6e\
+\x74\x72\x6f\x6c\x6c\x65\x64\x2d\x58\x29\x20\x61\x70\x70\x6c\x69\
+\x65\x73\x20\x74\x68\x65\x20\x58\x20\x67\x61\x74\x65\x20\x6f\x6e\
+\x6c\x79\x20\x77\x68\x65\x6e\x20\x62\x6f\x74\x68\x20\x63\x6f\x6e\
+\x74\x72\x6f\x6c\x20\x71\x75\x62\x69\x74\x73\x20\x61\x72\x65\x20\
+\x31\x2e\x3c\x2f\x70\x3e\x3c\x68\x33\x3e\x4d\x61\x74\x72\x69\x78\
+\x20\x52\x65\x70\x72\x65\x73\x65\x6e\x74\x61\x74\x69\x6f\x6e\x3a\
+\x3c\x2f\x68\x33\x3e\x3c\x64\x69\x76\x20\x63\x6c\x61\x73\x73\x3d\
+\x22\x6d\x61\x74\x72\x69\x78\x22\x3e\x24\x24\x20\x38\x78\x38\x20\
+\x6d\x61\x74\x72\x69\x78\x20\x77\x69\x74\x68\x20\x58\x20\x6f\x6e\
+\x20\x74\x61\x72\x67\x65\x74\x20\x77\x68\x65\x6e\x20\x62\x6f\x74\
+\x68\x20\x63\x6f\x6e\x74\x72\x6f\x6c\x73\x20\x61\x72\x65\x20\x31\
+\x2e\x20\x24\x24\x3c\x2f\x64\x69\x76\x3e\x3c\x68\x33\x3e\x45\x78\
+\x61\x6d\x70\x6c\x65\x73\x3a\x3c\x2f\x68\x33\x3e\x3c\x6f\x6c\x3e\
+\x3c\x6c\x69\x3e\x24\x24\x20\x24\x43\x43\x58\x7c\x31\x31\x30\x5c\
+\x72\x61\x6e\x67\x6c\x65\x20\x3d\x20\x7c\x31\x31\x31\x5c\x72\x61\
+\x6e\x67\x6c\x65\x24\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x6c\x69\
+\x3e\x24\x24\x20\x24\x43\x43\x58\x7c\x31\x30\x31\x5c\x72\x61\x6e\
+\x67\x6c\x65\x20\x3d\x20\x7c\x31\x30\x31\x5c\x72\x61\x6e\x67\x6c\
+\x65\x24\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x6c\x69\x3e\x24\x24\
+\x20\x24\x43\x43\x58\x7c\x31\x31\x31\x5c\x72\x61\x6e\x67\x6c\x65\
+\x20\x3d\x20\x7c\x31\x31\x30\x5c\x72\x61\x6e\x67\x6c\x65\x24\x20\
+\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x6c\x69\x3e\x24\x24\x20\x43\x43\
+\x58\x20\x28\x54\x6f\x66\x66\x6f\x6c\x69\x29\x20\x67\x61\x74\x65\
+\x20\x69\x73\x20\x75\x6e\x69\x76\x65\x72\x73\x61\x6c\x20\x66\x6f\
+\x72\x20\x63\x6c\x61\x73\x73\x69\x63\x61\x6c\x20\x72\x65\x76\x65\
+\x72\x73\x69\x62\x6c\x65\x20\x63\x6f\x6d\x70\x75\x74\x61\x74\x69\
+\x6f\x6e\x20\x61\x6e\x64\x20\x71\x75\x61\x6e\x74\x75\x6d\x20\x65\
+\x72\x72\x6f\x72\x20\x63\x6f\x72\x72\x65\x63\x74\x69\x6f\x6e\x2e\
+\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x2f\x6f\x6c\x3e\x3c\x2f\x62\
+\x6f\x64\x79\x3e\x3c\x2f\x68\x74\x6d\x6c\x3e\
+\x00\x00\x07\x73\
+\x0a\
+\x3c\x68\x74\x6d\x6c\x3e\x0a\x3c\x68\x65\x61\x64\x3e\x0a\x20\x20\
+\x20\x20\x3c\x6c\x69\x6e\x6b\x20\x72\x65\x6c\x3d\x22\x73\x74\x79\
+\x6c\x65\x73\x68\x65\x65\x74\x22\x20\x68\x72\x65\x66\x3d\x22\x68\
+\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\x73\x64\x65\x6c\
+\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\x6b\x61\x74\x65\
+\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\x6b\x61\x74\x65\
+\x78\x2e\x6d\x69\x6e\x2e\x63\x73\x73\x22\x3e\x0a\x20\x20\x20\x20\
+\x3c\x73\x63\x72\x69\x70\x74\x20\x64\x65\x66\x65\x72\x20\x73\x72\
+\x63\x3d\x22\x68\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\
+\x73\x64\x65\x6c\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\
+\x6b\x61\x74\x65\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\
+\x6b\x61\x74\x65\x78\x2e\x6d\x69\x6e\x2e\x6a\x73\x22\x3e\x3c\x2f\
+\x73\x63\x72\x69\x70\x74\x3e\x0a\x20\x20\x20\x20\x3c\x73\x63\x72\
+\x69\x70\x74\x20\x64\x65\x66\x65\x72\x20\x73\x72\x63\x3d\x22\x68\
+\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\x73\x64\x65\x6c\
+\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\x6b\x61\x74\x65\
+\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\x63\x6f\x6e\x74\
+\x72\x69\x62\x2f\x61\x75\x74\x6f\x2d\x72\x65\x6e\x64\x65\x72\x2e\
+\x6d\x69\x6e\x2e\x6a\x73\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x6f\x6e\x6c\x6f\x61\x64\x3d\x22\x72\x65\x6e\x64\x65\x72\x4d\x61\
+\x74\x68\x49\x6e\x45\x6c\x65\x6d\x65\x6e\x74\x28\x64\x6f\x63\x75\
+\x6d\x65\x6e\x74\x2e\x62\x6f\x64\x79\x2c\x20\x7b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x64\x65\x6c\x69\x6d\x69\x74\
+\x65\x72\x73\x3a\x20\x5b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x24\
+\x24\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\x27\x24\x24\x27\x2c\
+\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x74\x72\x75\x65\x7d\x2c\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x5c\x5c\x5b\x27\x2c\x20\x72\
+\x69\x67\x68\x74\x3a\x20\x27\x5c\x5c\x5d\x27\x2c\x20\x64\x69\x73\
+\x70\x6c\x61\x79\x3a\x20\x74\x72\x75\x65\x7d\x2c\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\
+\x66\x74\x3a\x20\x27\x24\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\
+\x27\x24\x27\x2c\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x66\x61\
+\x6c\x73\x65\x7d\x2c\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x5c\x5c\
+\x28\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\x27\x5c\x5c\x29\x27\
+\x2c\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x66\x61\x6c\x73\x65\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x5d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x29\x3b\x22\x3e\x3c\x2f\x73\
+\x63\x72\x69\x70\x74\x3e\x0a\x20\x20\x20\x20\x3c\x73\x74\x79\x6c\
+\x65\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x62\x6f\x64\x79\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\
+\x6e\x74\x2d\x66\x61\x6d\x69\x6c\x79\x3a\x20\x27\x53\x65\x67\x6f\
+\x65\x20\x55\x49\x27\x2c\x20\x41\x72\x69\x61\x6c\x2c\x20\x73\x61\
+\x6e\x73\x2d\x73\x65\x72\x69\x66\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\
+\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x46\x41\x46\x41\x46\x41\x3b\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\
+\x6f\x72\x3a\x20\x23\x33\x33\x33\x33\x33\x33\x3b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\
+\x7a\x65\x3a\x20\x31\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x6c\x69\x6e\x65\x2d\x68\x65\x69\x67\x68\
+\x74\x3a\x20\x31\x2e\x36\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x68\x32\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\
+\x3a\x20\x23\x32\x42\x35\x44\x38\x31\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\
+\x3a\x20\x32\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x2d\x62\x6f\x74\x74\x6f\
+\x6d\x3a\x20\x32\x70\x78\x20\x73\x6f\x6c\x69\x64\x20\x23\x32\x42\
+\x35\x44\x38\x31\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x2d\x62\x6f\x74\x74\x6f\x6d\
+\x3a\x20\x31\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x68\x33\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\
+\x3a\x20\x23\x34\x36\x38\x32\x42\x34\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\
+\x3a\x20\x32\x34\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x6d\x61\x72\x67\x69\x6e\x2d\x74\x6f\x70\x3a\x20\
+\x32\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x6f\x6c\x20\x7b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\
+\x7a\x65\x3a\x20\x31\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x34\x34\
+\x34\x34\x34\x34\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x2e\x6d\x61\x74\x72\x69\x78\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x62\x61\
+\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\
+\x23\x45\x44\x46\x35\x46\x41\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x3a\x20\x31\x30\
+\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x2d\x72\x61\x64\x69\x75\x73\x3a\x20\x38\
+\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x3a\x20\x31\x70\x78\x20\x73\x6f\x6c\x69\
+\x64\x20\x23\x36\x46\x41\x36\x44\x36\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x7d\x0a\x20\x20\x20\x20\x3c\x2f\x73\x74\x79\x6c\x65\
+\x3e\x0a\x3c\x2f\x68\x65\x61\x64\x3e\x0a\x3c\x62\x6f\x64\x79\x3e\
+\x3c\x68\x32\x3e\x43\x58\x20\x47\x61\x74\x65\x3c\x2f\x68\x32\x3e\
+\x3c\x70\x3e\x43\x6f\x6e\x74\x72\x6f\x6c\x6c\x65\x64\x2d\x4e\x4f\
+\x54\x20\x47\x61\x74\x65\x20\x66\x6c\x69\x70\x73\x20\x74\x68\x65\
+\x20\x73\x65\x63\x6f\x6e\x64\x20\x71\x75\x62\x69\x74\x20\x6f\x6e\
+\x6c\x79\x20\x69\x66\x20\x74\x68\x65\x20\x66\x69\x72\x73\x74\x20\
+\x69\x73\x20\x31\x2e\x3c\x2f\x70\x3e\x3c\x68\x33\x3e\x4d\x61\x74\
+\x72\x69\x78\x20\x52\x65\x70\x72\x65\x73\x65\x6e\x74\x61\x74\x69\
+\x6f\x6e\x3a\x3c\x2f\x68\x33\x3e\x3c\x64\x69\x76\x20\x63\x6c\x61\
+\x73\x73\x3d\x22\x6d\x61\x74\x72\x69\x78\x22\x3e\x24\x24\x20\x5c\
+\x62\x65\x67\x69\x6e\x7b\x70\x6d\x61\x74\x72\x69\x78\x7d\x31\x20\
+\x26\x20\x30\x20\x26\x20\x30\x20\x26\x20\x30\x5c\x5c\x30\x20\x26\
+\x20\x31\x20\x26\x20\x30\x20\x26\x20\x30\x5c\x5c\x30\x20\x26\x20\
+\x30\x20\x26\x20\x30\x20\x26\x20\x31\x5c\x5c\x30\x20\x26\x20\x30\
+\x20\x26\x20\x31\x20\x26\x20\x30\x5c\x65\x6e\x64\x7b\x70\x6d\x61\
+\x74\x72\x69\x78\x7d\x20\x24\x24\x3c\x2f\x64\x69\x76\x3e\x3c\x68\
+\x33\x3e\x45\x78\x61\x6d\x70\x6c\x65\x73\x3a\x3c\x2f\x68\x33\x3e\
+\x3c\x6f\x6c\x3e\x3c\x6c\x69\x3e\x24\x24\x20\x24\x43\x58\x7c\x30\
+\x30\x5c\x72\x61\x6e\x67\x6c\x65\x20\x3d\x20\x7c\x30\x30\x5c\x72\
+\x61\x6e\x67\x6c\x65\x24\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x6c\
+\x69\x3e\x24\x24\x20\x24\x43\x58\x7c\x30\x31\x5c\x72\x61\x6e\x67\
+\x6c\x65\x20\x3d\x20\x7c\x30\x31\x5c\x72\x61\x6e\x67\x6c\x65\x24\
+\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x6c\x69\x3e\x24\x24\x20\x24\
+\x43\x58\x7c\x31\x30\x5c\x72\x61\x6e\x67\x6c\x65\x20\x3d\x20\x7c\
+\x31\x31\x5c\x72\x61\x6e\x67\x6c\x65\x24\x20\x24\x24\x3c\x2f\x6c\
+\x69\x3e\x3c\x6c\x69\x3e\x24\x24\x20\x43\x58\x20\x28\x43\x4e\x4f\
+\x54\x29\x20\x69\x73\x20\x66\x75\x6e\x64\x61\x6d\x65\x6e\x74\x61\
+\x6c\x20\x66\x6f\x72\x20\x65\x6e\x74\x61\x6e\x67\x6c\x65\x6d\x65\
+\x6e\x74\x20\x63\x72\x65\x61\x74\x69\x6f\x6e\x20\x61\x6e\x64\x20\
+\x6d\x75\x6c\x74\x69\x2d\x71\x75\x62\x69\x74\x20\x6f\x70\x65\x72\
+\x61\x74\x69\x6f\x6e\x73\x2e\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\
+\x2f\x6f\x6c\x3e\x3c\x2f\x62\x6f\x64\x79\x3e\x3c\x2f\x68\x74\x6d\
+\x6c\x3e\
+\x00\x00\x07\x6c\
+\x0a\
+\x3c\x68\x74\x6d\x6c\x3e\x0a\x3c\x68\x65\x61\x64\x3e\x0a\x20\x20\
+\x20\x20\x3c\x6c\x69\x6e\x6b\x20\x72\x65\x6c\x3d\x22\x73\x74\x79\
+\x6c\x65\x73\x68\x65\x65\x74\x22\x20\x68\x72\x65\x66\x3d\x22\x68\
+\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\x73\x64\x65\x6c\
+\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\x6b\x61\x74\x65\
+\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\x6b\x61\x74\x65\
+\x78\x2e\x6d\x69\x6e\x2e\x63\x73\x73\x22\x3e\x0a\x20\x20\x20\x20\
+\x3c\x73\x63\x72\x69\x70\x74\x20\x64\x65\x66\x65\x72\x20\x73\x72\
+\x63\x3d\x22\x68\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\
+\x73\x64\x65\x6c\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\
+\x6b\x61\x74\x65\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\
+\x6b\x61\x74\x65\x78\x2e\x6d\x69\x6e\x2e\x6a\x73\x22\x3e\x3c\x2f\
+\x73\x63\x72\x69\x70\x74\x3e\x0a\x20\x20\x20\x20\x3c\x73\x63\x72\
+\x69\x70\x74\x20\x64\x65\x66\x65\x72\x20\x73\x72\x63\x3d\x22\x68\
+\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\x73\x64\x65\x6c\
+\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\x6b\x61\x74\x65\
+\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\x63\x6f\x6e\x74\
+\x72\x69\x62\x2f\x61\x75\x74\x6f\x2d\x72\x65\x6e\x64\x65\x72\x2e\
+\x6d\x69\x6e\x2e\x6a\x73\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x6f\x6e\x6c\x6f\x61\x64\x3d\x22\x72\x65\x6e\x64\x65\x72\x4d\x61\
+\x74\x68\x49\x6e\x45\x6c\x65\x6d\x65\x6e\x74\x28\x64\x6f\x63\x75\
+\x6d\x65\x6e\x74\x2e\x62\x6f\x64\x79\x2c\x20\x7b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x64\x65\x6c\x69\x6d\x69\x74\
+\x65\x72\x73\x3a\x20\x5b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x24\
+\x24\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\x27\x24\x24\x27\x2c\
+\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x74\x72\x75\x65\x7d\x2c\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x5c\x5c\x5b\x27\x2c\x20\x72\
+\x69\x67\x68\x74\x3a\x20\x27\x5c\x5c\x5d\x27\x2c\x20\x64\x69\x73\
+\x70\x6c\x61\x79\x3a\x20\x74\x72\x75\x65\x7d\x2c\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\
+\x66\x74\x3a\x20\x27\x24\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\
+\x27\x24\x27\x2c\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x66\x61\
+\x6c\x73\x65\x7d\x2c\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x5c\x5c\
+\x28\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\x27\x5c\x5c\x29\x27\
+\x2c\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x66\x61\x6c\x73\x65\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x5d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x29\x3b\x22\x3e\x3c\x2f\x73\
+\x63\x72\x69\x70\x74\x3e\x0a\x20\x20\x20\x20\x3c\x73\x74\x79\x6c\
+\x65\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x62\x6f\x64\x79\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\
+\x6e\x74\x2d\x66\x61\x6d\x69\x6c\x79\x3a\x20\x27\x53\x65\x67\x6f\
+\x65\x20\x55\x49\x27\x2c\x20\x41\x72\x69\x61\x6c\x2c\x20\x73\x61\
+\x6e\x73\x2d\x73\x65\x72\x69\x66\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\
+\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x46\x41\x46\x41\x46\x41\x3b\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\
+\x6f\x72\x3a\x20\x23\x33\x33\x33\x33\x33\x33\x3b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\
+\x7a\x65\x3a\x20\x31\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x6c\x69\x6e\x65\x2d\x68\x65\x69\x67\x68\
+\x74\x3a\x20\x31\x2e\x36\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x68\x32\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\
+\x3a\x20\x23\x32\x42\x35\x44\x38\x31\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\
+\x3a\x20\x32\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x2d\x62\x6f\x74\x74\x6f\
+\x6d\x3a\x20\x32\x70\x78\x20\x73\x6f\x6c\x69\x64\x20\x23\x32\x42\
+\x35\x44\x38\x31\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x2d\x62\x6f\x74\x74\x6f\x6d\
+\x3a\x20\x31\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x68\x33\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\
+\x3a\x20\x23\x34\x36\x38\x32\x42\x34\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\
+\x3a\x20\x32\x34\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x6d\x61\x72\x67\x69\x6e\x2d\x74\x6f\x70\x3a\x20\
+\x32\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x6f\x6c\x20\x7b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\
+\x7a\x65\x3a\x20\x31\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x34\x34\
+\x34\x34\x34\x34\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x2e\x6d\x61\x74\x72\x69\x78\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x62\x61\
+\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\
+\x23\x45\x44\x46\x35\x46\x41\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x3a\x20\x31\x30\
+\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x2d\x72\x61\x64\x69\x75\x73\x3a\x20\x38\
+\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x3a\x20\x31\x70\x78\x20\x73\x6f\x6c\x69\
+\x64\x20\x23\x36\x46\x41\x36\x44\x36\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x7d\x0a\x20\x20\x20\x20\x3c\x2f\x73\x74\x79\x6c\x65\
+\x3e\x0a\x3c\x2f\x68\x65\x61\x64\x3e\x0a\x3c\x62\x6f\x64\x79\x3e\
+\x3c\x68\x32\x3e\x43\x59\x20\x47\x61\x74\x65\x3c\x2f\x68\x32\x3e\
+\x3c\x70\x3e\x43\x6f\x6e\x74\x72\x6f\x6c\x6c\x65\x64\x2d\x59\x20\
+\x47\x61\x74\x65\x20\x61\x70\x70\x6c\x69\x65\x73\x20\x59\x20\x69\
+\x66\x20\x74\x68\x65\x20\x66\x69\x72\x73\x74\x20\x71\x75\x62\x69\
+\x74\x20\x69\x73\x20\x31\x2e\x3c\x2f\x70\x3e\x3c\x68\x33\x3e\x4d\
+\x61\x74\x72\x69\x78\x20\x52\x65\x70\x72\x65\x73\x65\x6e\x74\x61\
+\x74\x69\x6f\x6e\x3a\x3c\x2f\x68\x33\x3e\x3c\x64\x69\x76\x20\x63\
+\x6c\x61\x73\x73\x3d\x22\x6d\x61\x74\x72\x69\x78\x22\x3e\x24\x24\
+\x20\x5c\x62\x65\x67\x69\x6e\x7b\x70\x6d\x61\x74\x72\x69\x78\x7d\
+\x31\x20\x26\x20\x30\x20\x26\x20\x30\x20\x26\x20\x30\x5c\x5c\x30\
+\x20\x26\x20\x31\x20\x26\x20\x30\x20\x26\x20\x30\x5c\x5c\x30\x20\
+\x26\x20\x30\x20\x26\x20\x30\x20\x26\x20\x2d\x69\x5c\x5c\x30\x20\
+\x26\x20\x30\x20\x26\x20\x69\x20\x26\x20\x30\x5c\x65\x6e\x64\x7b\
+\x70\x6d\x61\x74\x72\x69\x78\x7d\x20\x24\x24\x3c\x2f\x64\x69\x76\
+\x3e\x3c\x68\x33\x3e\x45\x78\x61\x6d\x70\x6c\x65\x73\x3a\x3c\x2f\
+\x68\x33\x3e\x3c\x6f\x6c\x3e\x3c\x6c\x69\x3e\x24\x24\x20\x24\x43\
+\x59\x7c\x30\x30\x5c\x72\x61\x6e\x67\x6c\x65\x20\x3d\x20\x7c\x30\
+\x30\x5c\x72\x61\x6e\x67\x6c\x65\x24\x20\x24\x24\x3c\x2f\x6c\x69\
+\x3e\x3c\x6c\x69\x3e\x24\x24\x20\x24\x43\x59\x7c\x30\x31\x5c\x72\
+\x61\x6e\x67\x6c\x65\x20\x3d\x20\x7c\x30\x31\x5c\x72\x61\x6e\x67\
+\x6c\x65\x24\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x6c\x69\x3e\x24\
+\x24\x20\x24\x43\x59\x7c\x31\x30\x5c\x72\x61\x6e\x67\x6c\x65\x20\
+\x3d\x20\x2d\x69\x7c\x31\x31\x5c\x72\x61\x6e\x67\x6c\x65\x24\x20\
+\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x6c\x69\x3e\x24\x24\x20\x43\x59\
+\x20\x67\x61\x74\x65\x73\x20\x61\x72\x65\x20\x75\x73\x65\x64\x20\
+\x69\x6e\x20\x63\x65\x72\x74\x61\x69\x6e\x20\x71\x75\x61\x6e\x74\
+\x75\x6d\x20\x65\x72\x72\x6f\x72\x20\x63\x6f\x72\x72\x65\x63\x74\
+\x69\x6f\x6e\x20\x63\x6f\x64\x65\x73\x20\x61\x6e\x64\x20\x73\x74\
+\x61\x74\x65\x20\x70\x72\x65\x70\x61\x72\x61\x74\x69\x6f\x6e\x2e\
+\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x2f\x6f\x6c\x3e\x3c\x2f\x62\
+\x6f\x64\x79\x3e\x3c\x2f\x68\x74\x6d\x6c\x3e\
+\x00\x00\x07\x7f\
+\x0a\
+\x3c\x68\x74\x6d\x6c\x3e\x0a\x3c\x68\x65\x61\x64\x3e\x0a\x20\x20\
+\x20\x20\x3c\x6c\x69\x6e\x6b\x20\x72\x65\x6c\x3d\x22\x73\x74\x79\
+\x6c\x65\x73\x68\x65\x65\x74\x22\x20\x68\x72\x65\x66\x3d\x22\x68\
+\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\x73\x64\x65\x6c\
+\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\x6b\x61\x74\x65\
+\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\x6b\x61\x74\x65\
+\x78\x2e\x6d\x69\x6e\x2e\x63\x73\x73\x22\x3e\x0a\x20\x20\x20\x20\
+\x3c\x73\x63\x72\x69\x70\x74\x20\x64\x65\x66\x65\x72\x20\x73\x72\
+\x63\x3d\x22\x68\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\
+\x73\x64\x65\x6c\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\
+\x6b\x61\x74\x65\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\
+\x6b\x61\x74\x65\x78\x2e\x6d\x69\x6e\x2e\x6a\x73\x22\x3e\x3c\x2f\
+\x73\x63\x72\x69\x70\x74\x3e\x0a\x20\x20\x20\x20\x3c\x73\x63\x72\
+\x69\x70\x74\x20\x64\x65\x66\x65\x72\x20\x73\x72\x63\x3d\x22\x68\
+\x74\x74\x70\x73\x3a\x2f\x2f\x63\x64\x6e\x2e\x6a\x73\x64\x65\x6c\
+\x69\x76\x72\x2e\x6e\x65\x74\x2f\x6e\x70\x6d\x2f\x6b\x61\x74\x65\
+\x78\x40\x30\x2e\x31\x36\x2f\x64\x69\x73\x74\x2f\x63\x6f\x6e\x74\
+\x72\x69\x62\x2f\x61\x75\x74\x6f\x2d\x72\x65\x6e\x64\x65\x72\x2e\
+\x6d\x69\x6e\x2e\x6a\x73\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x6f\x6e\x6c\x6f\x61\x64\x3d\x22\x72\x65\x6e\x64\x65\x72\x4d\x61\
+\x74\x68\x49\x6e\x45\x6c\x65\x6d\x65\x6e\x74\x28\x64\x6f\x63\x75\
+\x6d\x65\x6e\x74\x2e\x62\x6f\x64\x79\x2c\x20\x7b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x64\x65\x6c\x69\x6d\x69\x74\
+\x65\x72\x73\x3a\x20\x5b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x24\
+\x24\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\x27\x24\x24\x27\x2c\
+\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x74\x72\x75\x65\x7d\x2c\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x5c\x5c\x5b\x27\x2c\x20\x72\
+\x69\x67\x68\x74\x3a\x20\x27\x5c\x5c\x5d\x27\x2c\x20\x64\x69\x73\
+\x70\x6c\x61\x79\x3a\x20\x74\x72\x75\x65\x7d\x2c\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\
+\x66\x74\x3a\x20\x27\x24\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\
+\x27\x24\x27\x2c\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x66\x61\
+\x6c\x73\x65\x7d\x2c\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x7b\x6c\x65\x66\x74\x3a\x20\x27\x5c\x5c\
+\x28\x27\x2c\x20\x72\x69\x67\x68\x74\x3a\x20\x27\x5c\x5c\x29\x27\
+\x2c\x20\x64\x69\x73\x70\x6c\x61\x79\x3a\x20\x66\x61\x6c\x73\x65\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x5d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x29\x3b\x22\x3e\x3c\x2f\x73\
+\x63\x72\x69\x70\x74\x3e\x0a\x20\x20\x20\x20\x3c\x73\x74\x79\x6c\
+\x65\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x62\x6f\x64\x79\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\
+\x6e\x74\x2d\x66\x61\x6d\x69\x6c\x79\x3a\x20\x27\x53\x65\x67\x6f\
+\x65\x20\x55\x49\x27\x2c\x20\x41\x72\x69\x61\x6c\x2c\x20\x73\x61\
+\x6e\x73\x2d\x73\x65\x72\x69\x66\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\
+\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x46\x41\x46\x41\x46\x41\x3b\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\
+\x6f\x72\x3a\x20\x23\x33\x33\x33\x33\x33\x33\x3b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\
+\x7a\x65\x3a\x20\x31\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x6c\x69\x6e\x65\x2d\x68\x65\x69\x67\x68\
+\x74\x3a\x20\x31\x2e\x36\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x68\x32\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\
+\x3a\x20\x23\x32\x42\x35\x44\x38\x31\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\
+\x3a\x20\x32\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x2d\x62\x6f\x74\x74\x6f\
+\x6d\x3a\x20\x32\x70\x78\x20\x73\x6f\x6c\x69\x64\x20\x23\x32\x42\
+\x35\x44\x38\x31\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x2d\x62\x6f\x74\x74\x6f\x6d\
+\x3a\x20\x31\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x68\x33\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\
+\x3a\x20\x23\x34\x36\x38\x32\x42\x34\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\
+\x3a\x20\x32\x34\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x6d\x61\x72\x67\x69\x6e\x2d\x74\x6f\x70\x3a\x20\
+\x32\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x6f\x6c\x20\x7b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\
+\x7a\x65\x3a\x20\x31\x38\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\x3a\x20\x23\x34\x34\
+\x34\x34\x34\x34\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x2e\x6d\x61\x74\x72\x69\x78\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x62\x61\
+\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\
+\x23\x45\x44\x46\x35\x46\x41\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x3a\x20\x31\x30\
+\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x2d\x72\x61\x64\x69\x75\x73\x3a\x20\x38\
+\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x3a\x20\x31\x70\x78\x20\x73\x6f\x6c\x69\
+\x64\x20\x23\x36\x46\x41\x36\x44\x36\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x7d\x0a\x20\x20\x20\x20\x3c\x2f\x73\x74\x79\x6c\x65\
+\x3e\x0a\x3c\x2f\x68\x65\x61\x64\x3e\x0a\x3c\x62\x6f\x64\x79\x3e\
+\x3c\x68\x32\x3e\x43\x5a\x20\x47\x61\x74\x65\x3c\x2f\x68\x32\x3e\
+\x3c\x70\x3e\x43\x6f\x6e\x74\x72\x6f\x6c\x6c\x65\x64\x2d\x5a\x20\
+\x47\x61\x74\x65\x20\x66\x6c\x69\x70\x73\x20\x74\x68\x65\x20\x70\
+\x68\x61\x73\x65\x20\x6f\x66\x20\x74\x68\x65\x20\x73\x65\x63\x6f\
+\x6e\x64\x20\x71\x75\x62\x69\x74\x20\x69\x66\x20\x74\x68\x65\x20\
+\x66\x69\x72\x73\x74\x20\x69\x73\x20\x31\x2e\x3c\x2f\x70\x3e\x3c\
+\x68\x33\x3e\x4d\x61\x74\x72\x69\x78\x20\x52\x65\x70\x72\x65\x73\
+\x65\x6e\x74\x61\x74\x69\x6f\x6e\x3a\x3c\x2f\x68\x33\x3e\x3c\x64\
+\x69\x76\x20\x63\x6c\x61\x73\x73\x3d\x22\x6d\x61\x74\x72\x69\x78\
+\x22\x3e\x24\x24\x20\x5c\x62\x65\x67\x69\x6e\x7b\x70\x6d\x61\x74\
+\x72\x69\x78\x7d\x31\x20\x26\x20\x30\x20\x26\x20\x30\x20\x26\x20\
+\x30\x5c\x5c\x30\x20\x26\x20\x31\x20\x26\x20\x30\x20\x26\x20\x30\
+\x5c\x5c\x30\x20\x26\x20\x30\x20\x26\x20\x31\x20\x26\x20\x30\x5c\
+\x5c\x30\x20\x26\x20\x30\x20\x26\x20\x30\x20\x26\x20\x2d\x31\x5c\
+\x65\x6e\x64\x7b\x70\x6d\x61\x74\x72\x69\x78\x7d\x20\x24\x24\x3c\
+\x2f\x64\x69\x76\x3e\x3c\x68\x33\x3e\x45\x78\x61\x6d\x70\x6c\x65\
+\x73\x3a\x3c\x2f\x68\x33\x3e\x3c\x6f\x6c\x3e\x3c\x6c\x69\x3e\x24\
+\x24\x20\x24\x43\x5a\x7c\x30\x30\x5c\x72\x61\x6e\x67\x6c\x65\x20\
+\x3d\x20\x7c\x30\x30\x5c\x72\x61\x6e\x67\x6c\x65\x24\x20\x24\x24\
+\x3c\x2f\x6c\x69\x3e\x3c\x6c\x69\x3e\x24\x24\x20\x24\x43\x5a\x7c\
+\x30\x31\x5c\x72\x61\x6e\x67\x6c\x65\x20\x3d\x20\x7c\x30\x31\x5c\
+\x72\x61\x6e\x67\x6c\x65\x24\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\
+\x6c\x69\x3e\x24\x24\x20\x24\x43\x5a\x7c\x31\x31\x5c\x72\x61\x6e\
+\x67\x6c\x65\x20\x3d\x20\x2d\x7c\x31\x31\x5c\x72\x61\x6e\x67\x6c\
+\x65\x24\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x6c\x69\x3e\x24\x24\
+\x20\x43\x5a\x20\x67\x61\x74\x65\x73\x20\x61\x72\x65\x20\x73\x79\
+\x6d\x6d\x65\x74\x72\x69\x63\x20\x61\x6e\x64\x20\x6f\x66\x74\x65\
+\x6e\x20\x70\x72\x65\x66\x65\x72\x72\x65\x64\x20\x69\x6e\x20\x73\
+\x75\x70\x65\x72\x63\x6f\x6e\x64\x75\x63\x74\x69\x6e\x67\x20\x71\
+\x75\x62\x69\x74\x20\x61\x72\x63\x68\x69\x74\x65\x63\x74\x75\x72\
+\x65\x73\x2e\x20\x24\x24\x3c\x2f\x6c\x69\x3e\x3c\x2f\x6f\x6c\x3e\
+\x3c\x2f\x62\x6f\x64\x79\x3e\x3c\x2f\x68\x74\x6d\x6c\x3e\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00\x6d\x8a\xc3\
+\x00\x67\
+\x00\x61\x00\x74\x00\x65\x00\x73\
+\x00\x06\
+\x04\xb4\xfb\x3c\
+\x00\x48\
+\x00\x2e\x00\x68\x00\x74\x00\x6d\x00\x6c\
+\x00\x06\
+\x05\x64\xfb\x3c\
+\x00\x53\
+\x00\x2e\x00\x68\x00\x74\x00\x6d\x00\x6c\
+\x00\x06\
+\x05\x74\xfb\x3c\
+\x00\x54\
+\x00\x2e\x00\x68\x00\x74\x00\x6d\x00\x6c\
+\x00\x06\
+\x05\xb4\xfb\x3c\
+\x00\x58\
+\x00\x2e\x00\x68\x00\x74\x00\x6d\x00\x6c\
+\x00\x06\
+\x05\xc4\xfb\x3c\
+\x00\x59\
+\x00\x2e\x00\x68\x00\x74\x00\x6d\x00\x6c\
+\x00\x06\
+\x05\xd4\xfb\x3c\
+\x00\x5a\
+\x00\x2e\x00\x68\x00\x74\x00\x6d\x00\x6c\
+\x00\x07\
+\x07\xb4\xfb\x9c\
+\x00\x52\
+\x00\x58\x00\x2e\x00\x68\x00\x74\x00\x6d\x00\x6c\
+\x00\x07\
+\x07\xc4\xfb\x9c\
+\x00\x52\
+\x00\x59\x00\x2e\x00\x68\x00\x74\x00\x6d\x00\x6c\
+\x00\x07\
+\x07\xd4\xfb\x9c\
+\x00\x52\
+\x00\x5a\x00\x2e\x00\x68\x00\x74\x00\x6d\x00\x6c\
+\x00\x09\
+\x08\x34\x4e\x9c\
+\x00\x53\
+\x00\x77\x00\x61\x00\x70\x00\x2e\x00\x68\x00\x74\x00\x6d\x00\x6c\
+\x00\x08\
+\x08\xb4\xf3\xdc\
+\x00\x43\
+\x00\x43\x00\x58\x00\x2e\x00\x68\x00\x74\x00\x6d\x00\x6c\
+\x00\x07\
+\x08\xb4\xfb\xbc\
+\x00\x43\
+\x00\x58\x00\x2e\x00\x68\x00\x74\x00\x6d\x00\x6c\
+\x00\x07\
+\x08\xc4\xfb\xbc\
+\x00\x43\
+\x00\x59\x00\x2e\x00\x68\x00\x74\x00\x6d\x00\x6c\
+\x00\x07\
+\x08\xd4\xfb\xbc\
+\x00\x43\
+\x00\x5a\x00\x2e\x00\x68\x00\x74\x00\x6d\x00\x6c\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0e\x00\x00\x00\x02\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x22\x00\x00\x00\x00\x00\x01\x00\x00\x07\xcd\
+\x00\x00\x00\x34\x00\x00\x00\x00\x00\x01\x00\x00\x0f\x17\
+\x00\x00\x00\x46\x00\x00\x00\x00\x00\x01\x00\x00\x16\xcc\
+\x00\x00\x00\x58\x00\x00\x00\x00\x00\x01\x00\x00\x1e\x15\
+\x00\x00\x00\x6a\x00\x00\x00\x00\x00\x01\x00\x00\x25\x6e\
+\x00\x00\x00\x7c\x00\x00\x00\x00\x00\x01\x00\x00\x2c\xd9\
+\x00\x00\x00\x90\x00\x00\x00\x00\x00\x01\x00\x00\x34\x45\
+\x00\x00\x00\xa4\x00\x00\x00\x00\x00\x01\x00\x00\x3b\xa8\
+\x00\x00\x00\xb8\x00\x00\x00\x00\x00\x01\x00\x00\x43\x2f\
+\x00\x00\x00\xd0\x00\x00\x00\x00\x00\x01\x00\x00\x4a\xa5\
+\x00\x00\x00\xe6\x00\x00\x00\x00\x00\x01\x00\x00\x52\x35\
+\x00\x00\x00\xfa\x00\x00\x00\x00\x00\x01\x00\x00\x59\xac\
+\x00\x00\x01\x0e\x00\x00\x00\x00\x00\x01\x00\x00\x61\x1c\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0e\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1\x3e\x1d\x77\xa3\
+\x00\x00\x00\x22\x00\x00\x00\x00\x00\x01\x00\x00\x07\xcd\
+\x00\x00\x01\xa1\x3e\x1d\x77\xa4\
+\x00\x00\x00\x34\x00\x00\x00\x00\x00\x01\x00\x00\x0f\x17\
+\x00\x00\x01\xa1\x3e\x1d\x77\xa4\
+\x00\x00\x00\x46\x00\x00\x00\x00\x00\x01\x00\x00\x16\xcc\
+\x00\x00\x01\xa1\x3e\x1d\x77\xa3\
+\x00\x00\x00\x58\x00\x00\x00\x00\x00\x01\x00\x00\x1e\x15\
+\x00\x00\x01\xa1\x3e\x1d\x77\xa4\
+\x00\x00\x00\x6a\x00\x00\x00\x00\x00\x01\x00\x00\x25\x6e\
+\x00\x00\x01\xa1\x3e\x1d\x77\xa4\
+\x00\x00\x00\x7c\x00\x00\x00\x00\x00\x01\x00\x00\x2c\xd9\
+\x00\x00\x01\xa1\x3e\x1d\x77\xa4\
+\x00\x00\x00\x90\x00\x00\x00\x00\x00\x01\x00\x00\x34\x45\
+\x00\x00\x01\xa1\x3e\x1d\x77\xa4\
+\x00\x00\x00\xa4\x00\x00\x00\x00\x00\x01\x00\x00\x3b\xa8\
+\x00\x00\x01\xa1\x3e\x1d\x77\xa4\
+\x00\x00\x00\xb8\x00\x00\x00\x00\x00\x01\x00\x00\x43\x2f\
+\x00\x00\x01\xa1\x3e\x1d\x77\xa5\
+\x00\x00\x00\xd0\x00\x00\x00\x00\x00\x01\x00\x00\x4a\xa5\
+\x00\x00\x01\xa1\x3e\x1d\x77\xa5\
+\x00\x00\x00\xe6\x00\x00\x00\x00\x00\x01\x00\x00\x52\x35\
+\x00\x00\x01\xa1\x3e\x1d\x77\xa4\
+\x00\x00\x00\xfa\x00\x00\x00\x00\x00\x01\x00\x00\x59\xac\
+\x00\x00\x01\xa1\x3e\x1d\x77\xa5\
+\x00\x00\x01\x0e\x00\x00\x00\x00\x00\x01\x00\x00\x61\x1c\
+\x00\x00\x01\xa1\x3e\x1d\x77\xa5\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
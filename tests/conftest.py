@@ -0,0 +1,25 @@
+# tests/conftest.py
+
+"""
+Shared test setup: widgets render offscreen and every test gets an empty,
+private result store.
+"""
+
+import os
+import pytest
+
+# Widgets are created without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from utils import unitary_cache
+from utils.qiskit_helpers import clear_result_caches
+
+@pytest.fixture(autouse=True)
+def isolated_results(tmp_path, monkeypatch):
+    """Keeps memoized and persisted results from leaking between tests or into ~."""
+    unitary_cache.close_store()
+    monkeypatch.setattr(unitary_cache, "CACHE_PATH", str(tmp_path / "cache"))
+    clear_result_caches()
+    yield
+    unitary_cache.close_store()
+    clear_result_caches()
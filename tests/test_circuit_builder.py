@@ -0,0 +1,149 @@
+# tests/test_circuit_builder.py
+
+"""
+Tests that CircuitBuilder's tracked statevector and unitary stay in sync with
+its circuit across undo, redo and rebuilds.
+"""
+
+import numpy as np
+import pytest
+from PyQt5.QtCore import QCoreApplication, QThreadPool
+from PyQt5.QtWidgets import QApplication
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import Operator, Statevector
+
+from gui.circuit_builder import CircuitBuilder
+from utils.qiskit_helpers import MAX_UNITARY_QUBITS
+
+# Tracking runs in complex64, which keeps about seven significant digits
+ATOL = 1e-5
+
+# Actions replayed onto the builder, in the format of CircuitBuilder.apply_record
+RECORDS = [
+    ('qubit',),
+    ('qubit',),
+    ('gate', 'H', (0,)),
+    ('multi', 'CX', (0,), (1,)),
+    ('rot', 'RY', (2,), 0.3),
+    ('gate', 'T', (1,)),
+    ('qubit',),
+    ('multi', 'CZ', (3,), (2,)),
+    ('rot', 'RX', (3,), -1.1),
+]
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+@pytest.fixture
+def builder(qapp):
+    builder = CircuitBuilder()
+    yield builder
+    settle()
+    builder.deleteLater()
+
+def settle():
+    """Waits for the builder's workers and delivers their results."""
+    QThreadPool.globalInstance().waitForDone()
+    QCoreApplication.processEvents()
+
+def record_all(builder, records):
+    for record in records:
+        builder.apply_record(record)
+        builder.push_history(record)
+
+def assert_in_sync(builder):
+    settle()
+    assert builder._state is not None, "the statevector was never recomputed"
+    np.testing.assert_allclose(builder._state, Statevector(builder.circuit).data, atol=ATOL)
+    np.testing.assert_allclose(builder._unitary, Operator(builder.circuit).data, atol=ATOL)
+
+def test_tracking_follows_appended_gates(builder):
+    record_all(builder, RECORDS)
+    assert_in_sync(builder)
+
+def test_undo_and_redo_every_action(builder):
+    record_all(builder, RECORDS)
+    for _ in RECORDS[:-1]:
+        builder.undo_action()
+        assert_in_sync(builder)
+    for _ in RECORDS[:-1]:
+        builder.redo_action()
+        assert_in_sync(builder)
+    assert len(builder.circuit.data) == sum(record[0] != 'qubit' for record in RECORDS)
+
+def test_undo_after_measurement_resumes_tracking(builder):
+    record_all(builder, RECORDS[:4] + [('measure', 'Measure')])
+    settle()
+    assert not builder._tracking
+    builder.undo_action()
+    assert_in_sync(builder)
+    assert builder._tracking
+    builder.apply_record(('gate', 'X', (1,)))
+    assert_in_sync(builder)
+
+def test_rebuild_restores_the_same_state(builder):
+    record_all(builder, RECORDS)
+    settle()
+    state, unitary = builder._state.copy(), builder._unitary.copy()
+    builder.rebuild_circuit()
+    settle()
+    np.testing.assert_allclose(builder._state, state, atol=ATOL)
+    np.testing.assert_allclose(builder._unitary, unitary, atol=ATOL)
+
+def test_undo_keeps_a_large_measured_circuit_frozen(builder):
+    # Above MAX_UNITARY_QUBITS there is no unitary, so the cached statevector
+    # alone has to say that the circuit was measured
+    num_qubits = MAX_UNITARY_QUBITS + 1
+    record_all(builder, [('qubit',)] * (num_qubits - 1) + [('gate', 'H', (0,)), ('measure', 'Measure')])
+    settle()
+    builder.update_math_display()
+    record_all(builder, [('gate', 'X', (1,))])
+    builder.update_math_display()
+
+    expected = QuantumCircuit(num_qubits)
+    expected.h(0)
+    builder.undo_action()
+    settle()
+    assert not builder._tracking
+    builder.redo_action()
+    settle()
+    assert not builder._tracking
+    np.testing.assert_allclose(builder._state, Statevector(expected).data, atol=ATOL)
+
+def test_diagram_is_sized_to_the_circuit(builder):
+    short, long = QuantumCircuit(3), QuantumCircuit(3)
+    short.h(0)
+    for layer in range(40):
+        long.cx(layer % 3, (layer + 1) % 3)
+    short_image = builder.render_circuit(short)
+    long_image = builder.render_circuit(long)
+    # Same wires at the same scale, just more of them along the width
+    assert long_image.height() == short_image.height()
+    assert long_image.width() > 5 * short_image.width()
+
+def test_simulation_labels_use_the_simulated_circuit(builder):
+    record_all(builder, [('qubit',), ('gate', 'X', (1,)), ('measure', 'Measure')])
+    num_bits = builder.circuit.num_clbits
+    builder.run_simulation()
+    # Edited before the worker's result is delivered
+    builder.apply_record(('qubit',))
+    settle()
+    # The math refresh for the edit may already have cleared the probabilities,
+    # so read the bitstrings off the histogram's axis
+    ticks = builder.results_view.getAxis('bottom')._tickLevels
+    labels = [label for _, label in ticks[0]] if ticks else []
+    assert labels and all(len(label) == num_bits for label in labels)
+
+def test_tracked_state_is_withheld_when_not_tracking(builder):
+    record_all(builder, RECORDS[:4])
+    assert builder.tracks_state()
+    np.testing.assert_allclose(builder.get_tracked_state(), Statevector(builder.circuit).data, atol=ATOL)
+    # A rebuild recomputes the statevector in a worker
+    builder.rebuild_circuit()
+    assert builder.tracks_state() == (builder._state is not None)
+    settle()
+    assert builder.tracks_state()
+    record_all(builder, [('measure', 'Measure')])
+    assert not builder.tracks_state()
+    assert builder.get_tracked_state() is None
@@ -0,0 +1,191 @@
+# tests/test_qiskit_helpers.py
+
+"""
+Tests for the statevector and unitary helpers in utils.qiskit_helpers,
+checked against qiskit.quantum_info.
+"""
+
+import numpy as np
+import pytest
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import Operator, Statevector
+from qiskit_aer.library import SaveStatevector
+
+from utils import qiskit_helpers, sv_kernels
+from utils.qiskit_helpers import (
+    evolve_instructions, simulate_circuit, get_full_unitary, get_state_vector,
+    circuit_key, canonical_circuit_key
+)
+
+# Tracking runs in complex64, which keeps about seven significant digits
+ATOL = 1e-5
+
+# Gates drawn by random_circuit, by number of qubits
+SINGLE_QUBIT_GATES = ('h', 'x', 'y', 'z', 's', 't')
+ROTATION_GATES = ('rx', 'ry', 'rz', 'p')
+TWO_QUBIT_GATES = ('cx', 'cy', 'cz', 'swap')
+
+def random_circuit(num_qubits, num_gates, seed):
+    """Builds a circuit of random builder gates on random qubits."""
+    rng = np.random.default_rng(seed)
+    circuit = QuantumCircuit(num_qubits)
+    for _ in range(num_gates):
+        qubits = [int(q) for q in rng.permutation(num_qubits)]
+        kind = rng.integers(4 if num_qubits >= 3 else 3 if num_qubits >= 2 else 2)
+        if kind == 0:
+            getattr(circuit, rng.choice(SINGLE_QUBIT_GATES))(qubits[0])
+        elif kind == 1:
+            getattr(circuit, rng.choice(ROTATION_GATES))(float(rng.uniform(-np.pi, np.pi)), qubits[0])
+        elif kind == 2:
+            getattr(circuit, rng.choice(TWO_QUBIT_GATES))(qubits[0], qubits[1])
+        else:
+            circuit.ccx(qubits[0], qubits[1], qubits[2])
+    return circuit
+
+@pytest.fixture(params=["numpy", "numba"])
+def kernels(request, monkeypatch):
+    """Runs a test with the NumPy contraction and again with the Numba kernels."""
+    if request.param == "numba":
+        if not sv_kernels.HAVE_NUMBA:
+            pytest.skip("Numba is not installed")
+        sv_kernels.warm_kernels()
+    else:
+        monkeypatch.setattr(qiskit_helpers, "kernels_ready", lambda: False)
+    return request.param
+
+@pytest.mark.parametrize("num_qubits", [1, 2, 3, 5])
+@pytest.mark.parametrize("seed", range(3))
+def test_simulate_circuit_matches_quantum_info(kernels, num_qubits, seed):
+    circuit = random_circuit(num_qubits, 20, seed)
+    state, unitary, complete = simulate_circuit(circuit)
+    assert complete
+    assert state.dtype == unitary.dtype == qiskit_helpers.TRACKING_DTYPE
+    np.testing.assert_allclose(state, Statevector(circuit).data, atol=ATOL)
+    np.testing.assert_allclose(unitary, Operator(circuit).data, atol=ATOL)
+
+def test_simulate_circuit_without_unitary(kernels):
+    circuit = random_circuit(3, 12, seed=7)
+    state, unitary, complete = simulate_circuit(circuit, with_unitary=False)
+    assert complete and unitary is None
+    np.testing.assert_allclose(state, Statevector(circuit).data, atol=ATOL)
+
+def test_evolve_instructions_continues_from_start(kernels):
+    circuit = random_circuit(4, 24, seed=11)
+    head = circuit.copy_empty_like()
+    for instr in circuit.data[:10]:
+        head.append(instr)
+    state, unitary, _ = simulate_circuit(head)
+    state, unitary, complete = evolve_instructions(circuit, state, unitary, start=10)
+    assert complete
+    np.testing.assert_allclose(state, Statevector(circuit).data, atol=ATOL)
+    np.testing.assert_allclose(unitary, Operator(circuit).data, atol=ATOL)
+
+def test_evolve_instructions_leaves_its_inputs_alone(kernels):
+    circuit = random_circuit(3, 12, seed=3)
+    state, unitary, _ = simulate_circuit(QuantumCircuit(3))
+    # Cached arrays are read-only; evolving from them must not write to them
+    state.flags.writeable = False
+    unitary.flags.writeable = False
+    before = state.copy(), unitary.copy()
+    evolve_instructions(circuit, state, unitary)
+    np.testing.assert_array_equal(state, before[0])
+    np.testing.assert_array_equal(unitary, before[1])
+
+def test_evolution_stops_at_measurement(kernels):
+    circuit = QuantumCircuit(2)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    expected = Statevector(circuit).data
+    circuit.append(SaveStatevector(2), circuit.qubits)
+    circuit.measure_all()
+    circuit.x(0)
+    state, unitary, complete = simulate_circuit(circuit)
+    assert not complete
+    assert unitary is None
+    np.testing.assert_allclose(state, expected, atol=ATOL)
+
+def test_memoized_results_match_quantum_info():
+    circuit = random_circuit(3, 10, seed=5)
+    np.testing.assert_allclose(get_state_vector(circuit), Statevector(circuit).data, atol=1e-10)
+    np.testing.assert_allclose(get_full_unitary(circuit), Operator(circuit).data, atol=1e-10)
+    # Appending gates continues from the memoized prefix
+    circuit.ry(0.4, 2)
+    circuit.cz(1, 2)
+    np.testing.assert_allclose(get_state_vector(circuit), Statevector(circuit).data, atol=1e-10)
+    assert not get_state_vector(circuit).flags.writeable
+
+def test_circuits_with_measurements_have_no_unitary():
+    circuit = QuantumCircuit(1, 1)
+    circuit.h(0)
+    circuit.measure(0, 0)
+    assert get_full_unitary(circuit) is None
+    assert get_state_vector(circuit) is None
+
+def reorder_commuting(circuit, seed):
+    """Returns a copy with the gates in another order that keeps every wire's order."""
+    rng = np.random.default_rng(seed)
+    pending = list(circuit.data)
+    reordered = circuit.copy_empty_like()
+    while pending:
+        # Gates that no earlier pending gate shares a qubit with may go next
+        ready = []
+        busy = set()
+        for index, instr in enumerate(pending):
+            if not busy.intersection(instr.qubits):
+                ready.append(index)
+            busy.update(instr.qubits)
+        reordered.append(pending.pop(ready[rng.integers(len(ready))]))
+    return reordered
+
+@pytest.mark.parametrize("seed", range(5))
+def test_canonical_key_ignores_the_order_of_commuting_gates(seed):
+    circuit = random_circuit(5, 30, seed)
+    reordered = reorder_commuting(circuit, seed)
+    assert canonical_circuit_key(reordered) == canonical_circuit_key(circuit)
+
+def test_canonical_key_tells_different_circuits_apart():
+    def build(*gates, num_qubits=2):
+        circuit = QuantumCircuit(num_qubits)
+        for name, *args in gates:
+            getattr(circuit, name)(*args)
+        return canonical_circuit_key(circuit)
+
+    assert build(('h', 0), ('x', 1)) == build(('x', 1), ('h', 0))
+    different = [
+        build(('h', 0), ('x', 0)),
+        build(('x', 0), ('h', 0)),
+        build(('h', 0), ('cx', 0, 1)),
+        build(('cx', 0, 1), ('h', 0)),
+        build(('cx', 1, 0), ('h', 0)),
+        build(('rz', 0.1, 0)),
+        build(('rz', 0.2, 0)),
+        build(('rz', 0.1, 1)),
+        build(('rz', 0.1, 0), num_qubits=3),
+    ]
+    assert len(set(different)) == len(different)
+
+def test_circuits_sharing_a_canonical_key_share_a_unitary():
+    # A small alphabet on three qubits, so that many distinct gate sequences
+    # share a key
+    alphabet = [('h', 0), ('x', 1), ('t', 2), ('h', 2), ('cx', 0, 1), ('cz', 1, 2), ('swap', 0, 2)]
+    rng = np.random.default_rng(0)
+    by_key = {}
+    for _ in range(500):
+        circuit = QuantumCircuit(3)
+        for index in rng.integers(len(alphabet), size=4):
+            name, *qubits = alphabet[index]
+            getattr(circuit, name)(*qubits)
+        by_key.setdefault(canonical_circuit_key(circuit), []).append(circuit)
+    # Some keys must stand for several different gate orders
+    assert any(len({circuit_key(c) for c in circuits}) > 1 for circuits in by_key.values())
+    for circuits in by_key.values():
+        expected = Operator(circuits[0])
+        for circuit in circuits[1:]:
+            assert Operator(circuit).equiv(expected)
+
+def test_reordered_circuit_reuses_the_memoized_unitary():
+    circuit = random_circuit(4, 16, seed=2)
+    reordered = reorder_commuting(circuit, seed=2)
+    unitary = get_full_unitary(circuit)
+    assert get_full_unitary(reordered) is unitary
+    np.testing.assert_allclose(unitary, Operator(reordered).data, atol=1e-10)
@@ -0,0 +1,73 @@
+# tests/test_unitary_cache.py
+
+"""
+Tests for the persistent result store in utils.unitary_cache.
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("lmdb")
+
+from utils import unitary_cache
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """Points the store at a temporary directory and closes it afterwards."""
+    unitary_cache.close_store()
+    monkeypatch.setattr(unitary_cache, "CACHE_PATH", str(tmp_path / "cache"))
+    monkeypatch.setattr(unitary_cache, "HAVE_LMDB", True)
+    yield unitary_cache
+    unitary_cache.close_store()
+
+def test_round_trip(store):
+    key = (("h", (0,), ()), ("cx", (0, 1), ()))
+    unitary = np.eye(4, dtype=np.complex128) * 1j
+    state = np.array([1, 0, 0, 0], dtype=np.complex64)
+    store.store_result(b'U', key, unitary)
+    store.store_result(b'S', key, state)
+
+    loaded = store.load_result(b'U', key)
+    assert loaded.dtype == unitary.dtype
+    assert np.array_equal(loaded, unitary)
+    assert np.array_equal(store.load_result(b'S', key), state)
+    assert store.load_result(b'U', (("x", (0,), ()),)) is None
+
+def test_results_survive_reopening(store):
+    key = (("x", (0,), ()),)
+    store.store_result(b'S', key, np.array([0, 1], dtype=np.complex128))
+    store.close_store()
+    assert np.array_equal(store.load_result(b'S', key), [0, 1])
+
+def test_corrupt_entry_is_a_miss_and_is_deleted(store):
+    key = (("h", (0,), ()),)
+    store.store_result(b'U', key, np.eye(2))
+    env = store._environment()
+    db_key = store._db_key(b'U', key)
+    with env.begin(write=True) as txn:
+        txn.put(db_key, b"\x93NUMPY truncated")
+
+    assert store.load_result(b'U', key) is None
+    with env.begin() as txn:
+        assert txn.get(db_key) is None
+
+    # The slot is usable again afterwards
+    store.store_result(b'U', key, np.eye(2))
+    assert np.array_equal(store.load_result(b'U', key), np.eye(2))
+
+def test_full_store_is_cleared_instead_of_rejecting_writes(store, monkeypatch):
+    monkeypatch.setattr(store, "CACHE_MAP_SIZE", 1 << 20)
+    # 128 KiB each, so the 1 MiB store fills after a handful of entries
+    block = np.zeros(1 << 13, dtype=np.complex128)
+    for i in range(32):
+        store.store_result(b'S', (("rz", (0,), (float(i),)),), block + i)
+    last = (("rz", (0,), (31.0,)),)
+    assert np.array_equal(store.load_result(b'S', last), block + 31)
+    # The earliest entries were dropped to make room
+    assert store.load_result(b'S', (("rz", (0,), (0.0,)),)) is None
+
+def test_oversized_result_is_not_stored(store, monkeypatch):
+    monkeypatch.setattr(store, "CACHE_MAP_SIZE", 1 << 20)
+    key = (("h", (0,), ()),)
+    store.store_result(b'U', key, np.zeros(1 << 18, dtype=np.complex128))
+    assert store.load_result(b'U', key) is None
@@ -0,0 +1,63 @@
+# tools/build_gate_pages.py
+
+"""
+Pre-renders the Gate Info pages into Qt resources.
+
+Writes one HTML file per gate to resources/gates/, lists them in
+resources/gates.qrc and compiles that into resources/gates_rc.py with pyrcc5.
+Run it from the repository root after editing gui/gate_info_data.py:
+
+    python -m tools.build_gate_pages
+"""
+
+import os
+import subprocess
+from xml.sax.saxutils import escape
+from gui.gate_info_data import GATE_ORDER
+from gui.gate_pages import build_gate_html
+
+RESOURCES_DIR = "resources"
+PAGES_DIR = os.path.join(RESOURCES_DIR, "gates")
+QRC_PATH = os.path.join(RESOURCES_DIR, "gates.qrc")
+RC_MODULE_PATH = os.path.join(RESOURCES_DIR, "gates_rc.py")
+
+def write_pages():
+    """
+    Writes the HTML page of every gate.
+
+    Returns:
+        list: The page file names, relative to the resources directory.
+    """
+    os.makedirs(PAGES_DIR, exist_ok=True)
+    files = []
+    for gate in GATE_ORDER:
+        name = f"gates/{gate}.html"
+        with open(os.path.join(RESOURCES_DIR, name), 'w', encoding='utf-8') as f:
+            f.write(build_gate_html(gate))
+        files.append(name)
+    return files
+
+def write_qrc(files):
+    """
+    Writes the Qt resource collection served under qrc:/gates/.
+
+    Args:
+        files (list): The page file names, relative to the resources directory.
+    """
+    entries = "".join(
+        f'        <file alias="{escape(os.path.basename(name))}">{escape(name)}</file>\n'
+        for name in files
+    )
+    with open(QRC_PATH, 'w', encoding='utf-8') as f:
+        f.write(f'<RCC>\n    <qresource prefix="/gates">\n{entries}    </qresource>\n</RCC>\n')
+
+def main():
+    """
+    Builds the pages and compiles them into a Python resource module.
+    """
+    write_qrc(write_pages())
+    subprocess.run(["pyrcc5", QRC_PATH, "-o", RC_MODULE_PATH], check=True)
+    print(f"Wrote {len(GATE_ORDER)} gate pages to {RC_MODULE_PATH}")
+
+if __name__ == "__main__":
+    main()
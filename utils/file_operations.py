@@ -2,21 +2,51 @@
 
 """
 Provides utility functions for file operations.
+
+JSON is encoded with orjson when it is installed, which is several times
+faster than the standard library and serializes numpy arrays directly.
 """
 
 import os
 import json
 
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+# Indentation of saved JSON files (the only width orjson supports)
+JSON_INDENT = 2
+
+def _to_builtin(value):
+    """
+    Converts numpy arrays and scalars for the standard json encoder.
+
+    Args:
+        value: An object json cannot serialize natively.
+
+    Returns:
+        The equivalent list or Python scalar.
+    """
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
 def save_json(data, file_path):
     """
     Saves data to a JSON file.
 
     Args:
-        data (dict): The data to save.
+        data (dict): The data to save; may contain numpy arrays.
         file_path (str): The path to the JSON file.
     """
+    if HAVE_ORJSON:
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        return
     with open(file_path, 'w') as f:
-        json.dump(data, f, indent=4)
+        json.dump(data, f, indent=JSON_INDENT, default=_to_builtin)
 
 def load_json(file_path):
     """
@@ -28,6 +58,9 @@ def load_json(file_path):
     Returns:
         dict: The loaded data.
     """
+    if HAVE_ORJSON:
+        with open(file_path, 'rb') as f:
+            return orjson.loads(f.read())
     with open(file_path, 'r') as f:
         data = json.load(f)
     return data
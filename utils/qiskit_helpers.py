@@ -4,10 +4,70 @@
 Provides helper functions for Qiskit operations.
 """
 
+from collections import OrderedDict
+import threading
+from functools import lru_cache
 from qiskit import QuantumCircuit
-import matplotlib.pyplot as plt
+from qiskit.circuit import Gate
+from qiskit.exceptions import QiskitError
+from qiskit.circuit.library import get_standard_gate_name_mapping
 import numpy as np
 from qiskit.quantum_info import Operator, Statevector
+from utils.sv_kernels import (
+    kernels_ready, apply_single_qubit_gate, split_state, merge_state,
+    use_gpu, array_module, to_device, to_host
+)
+from utils.unitary_cache import load_result, store_result
+
+# Precision of the statevector and unitary tracked for display; two decimals are
+# shown, so single precision halves memory traffic without visible difference
+TRACKING_DTYPE = np.complex64
+
+# Instructions without a matrix; circuits containing them have no unitary, so
+# they are rejected before Qiskit does any work
+NON_UNITARY_OPERATIONS = frozenset(('measure', 'reset'))
+
+# Simulator directives that only Aer's statevector method understands; they are
+# not part of the circuit itself (see strip_simulator_directives)
+SIMULATOR_DIRECTIVES = frozenset(('save_statevector',))
+
+# Number of circuits whose full unitary and statevector are memoized
+RESULT_CACHE_SIZE = 64
+
+# Size limits, all derived from MAX_UNITARY_QUBITS so that they stay ordered:
+# computed >= rendered on the math tab >= printed in full >= typeset in full
+
+# Unitaries of larger circuits are not computed at all (2^n x 2^n memory)
+MAX_UNITARY_QUBITS = 10
+
+# Circuits with more qubits are only rendered on the math tab (or exported as
+# LaTeX) on request, since their unitary is costly to compute
+MATH_MAX_QUBITS = MAX_UNITARY_QUBITS - 4
+
+# Unitaries of larger circuits only print their corners unless requested in full
+MAX_DISPLAY_UNITARY_QUBITS = MATH_MAX_QUBITS - 2
+
+# Matrices and vectors longer than this are written (as LaTeX or HTML) with
+# only their corners; layout cost grows with every rendered cell
+MATH_MAX_DIM = 2 ** (MAX_DISPLAY_UNITARY_QUBITS - 1)
+
+# Rows/columns kept from each edge of a truncated matrix or vector
+MATH_EDGE_ITEMS = 2
+
+# Opening tag of the tables written by matrix_to_html/statevector_to_html
+_HTML_TABLE_OPEN = (
+    '<table border="1" cellspacing="0" cellpadding="6" '
+    'style="border-collapse: collapse; border-color: #c0c0c0; font-family: monospace;">'
+)
+
+# Results of get_full_unitary/get_state_vector, oldest first. Unitaries are keyed
+# by canonical_circuit_key; state vectors by circuit_key, whose execution order
+# get_state_vector_incremental relies on when extending a cached prefix
+_unitary_cache = OrderedDict()
+_state_cache = OrderedDict()
+
+# Guards the result caches, which worker threads and the GUI thread share
+_cache_lock = threading.Lock()
 
 def visualize_circuit(circuit: QuantumCircuit, filename: str = "circuit.png"):
     """
@@ -17,6 +77,8 @@ def visualize_circuit(circuit: QuantumCircuit, filename: str = "circuit.png"):
         circuit (QuantumCircuit): The quantum circuit to visualize.
         filename (str): The filename to save the image.
     """
+    # pyplot is slow to import and only needed here, so it is loaded on first use
+    import matplotlib.pyplot as plt
     figure = circuit.draw(output='mpl', fold=90)
     figure.savefig(filename)
     plt.close(figure)
@@ -32,72 +94,579 @@ def get_gate_matrix(circuit: QuantumCircuit, gate_label: str):
     Returns:
         numpy.ndarray or None: The matrix representation if found, else None.
     """
-    for instr, qargs, cargs in circuit.data:
-        if instr.name.upper() == gate_label.upper():
-            return instr.to_matrix()
+    name = gate_label.upper()
+    for instr in circuit.data:
+        operation = instr.operation
+        if operation.name.upper() == name and isinstance(operation, Gate):
+            return operation.to_matrix()
     return None
 
-def get_full_unitary(circuit: QuantumCircuit):
+# Rotation gates split as R(theta) = cos(theta/2) * A + (-i sin(theta/2)) * B
+_ROTATION_PARTIALS = {
+    'rx': (np.eye(2, dtype=complex), np.array([[0, 1], [1, 0]], dtype=complex)),
+    'ry': (np.eye(2, dtype=complex), np.array([[0, -1j], [1j, 0]], dtype=complex)),
+    'rz': (np.eye(2, dtype=complex), np.array([[1, 0], [0, -1]], dtype=complex)),
+}
+
+def _frozen_gate_matrix(name: str):
     """
-    Computes the full unitary matrix of the circuit.
+    Builds the read-only matrix of a parameter-free standard gate.
+
+    Args:
+        name (str): The Qiskit gate name (e.g., 'h', 'cx').
+
+    Returns:
+        numpy.ndarray: Read-only matrix representation of the gate.
+    """
+    matrix = get_standard_gate_name_mapping()[name].to_matrix()
+    # Cached arrays are shared between callers
+    matrix.flags.writeable = False
+    return matrix
+
+# Parameter-free gates offered by the circuit builder, built once at import
+_FIXED_GATE_MATRICES = {
+    name: _frozen_gate_matrix(name)
+    for name in ('h', 'x', 'y', 'z', 's', 't', 'cx', 'cy', 'cz', 'swap', 'ccx')
+}
+
+@lru_cache(maxsize=1024)
+def standard_gate_matrix(name: str, params: tuple = ()):
+    """
+    Returns the (cached) matrix of a standard gate.
+
+    Args:
+        name (str): The Qiskit gate name (e.g., 'h', 'rx', 'cx').
+        params (tuple): The gate parameters, e.g. the rotation angle.
+
+    Returns:
+        numpy.ndarray: Read-only matrix representation of the gate.
+
+    Raises:
+        KeyError: If the name is not a standard gate.
+        Exception: If the instruction has no matrix (e.g., 'measure').
+    """
+    if not params and name in _FIXED_GATE_MATRICES:
+        return _FIXED_GATE_MATRICES[name]
+    if name in _ROTATION_PARTIALS:
+        partial_a, partial_b = _ROTATION_PARTIALS[name]
+        half_angle = float(params[0]) / 2
+        matrix = np.cos(half_angle) * partial_a + (-1j * np.sin(half_angle)) * partial_b
+        matrix.flags.writeable = False
+        return matrix
+    if not params:
+        return _frozen_gate_matrix(name)
+    gate = type(get_standard_gate_name_mapping()[name])(*params)
+    matrix = gate.to_matrix()
+    # Cached arrays are shared between callers
+    matrix.flags.writeable = False
+    return matrix
+
+@lru_cache(maxsize=32)
+def basis_labels(num_qubits: int):
+    """
+    Returns the computational basis state labels for a number of qubits.
+
+    Args:
+        num_qubits (int): The number of qubits.
+
+    Returns:
+        numpy.ndarray: Read-only string array of labels such as '|00>', '|01>', ... in index order.
+    """
+    labels = np.array([f"|{i:0{num_qubits}b}>" for i in range(2**num_qubits)])
+    # Cached arrays are shared between callers
+    labels.flags.writeable = False
+    return labels
+
+def apply_gate_tensor(psi, matrix, qubits, num_qubits):
+    """
+    Applies a gate matrix to a statevector or unitary kept in tensor form.
+
+    Only the axes of the target qubits are contracted, so a k-qubit gate costs
+    O(4^k * size) instead of building the full 2^n x 2^n operator. The result is
+    left as a (possibly non-contiguous) view, so a sequence of gates avoids an
+    intermediate copy per gate.
+
+    Args:
+        psi (numpy.ndarray): Array of shape (2,)*num_qubits + rest.
+        matrix (numpy.ndarray): The 2^k x 2^k gate matrix in Qiskit ordering.
+        qubits (list): Indices of the k qubits the gate acts on.
+        num_qubits (int): Total number of qubits.
+
+    Returns:
+        numpy.ndarray: The evolved array, with the same shape as `psi`.
+    """
+    k = len(qubits)
+    # The same code runs on NumPy (CPU) and CuPy (GPU) arrays
+    xp = array_module(psi)
+    # Match the gate to the array's precision so the result is not upcast
+    gate = xp.asarray(matrix, dtype=psi.dtype).reshape((2,) * (2 * k))
+    # Qiskit is little-endian: qubit q lives on axis n-1-q, and the first
+    # qubit of a gate is the least significant bit of its matrix index
+    axes = [num_qubits - 1 - q for q in reversed(qubits)]
+    psi = xp.tensordot(gate, psi, axes=(list(range(k, 2 * k)), axes))
+    return xp.moveaxis(psi, list(range(k)), axes)
+
+def apply_gate_matrix(tensor, matrix, qubits, num_qubits):
+    """
+    Applies a gate matrix to the given qubits of a statevector or unitary.
+
+    Args:
+        tensor (numpy.ndarray): Array whose leading axis has length 2**num_qubits
+            (a statevector, or a unitary whose columns are evolved).
+        matrix (numpy.ndarray): The 2^k x 2^k gate matrix in Qiskit ordering.
+        qubits (list): Indices of the k qubits the gate acts on.
+        num_qubits (int): Total number of qubits.
+
+    Returns:
+        numpy.ndarray: The evolved array, with the same shape as `tensor`.
+    """
+    psi = tensor.reshape((2,) * num_qubits + tensor.shape[1:])
+    return apply_gate_tensor(psi, matrix, qubits, num_qubits).reshape(tensor.shape)
+
+def evolve_instructions(circuit: QuantumCircuit, state, unitary, start: int = 0):
+    """
+    Applies the circuit's instructions from `start` onwards to a statevector and unitary.
+
+    Evolution stops at the first non-unitary instruction (e.g. a measurement); the
+    statevector is then the one saved before it, as save_statevector() does. Both
+    arrays stay in tensor form while the instructions are applied and are only
+    flattened back at the end. With Numba installed (and its kernels compiled),
+    single-qubit gates update real/imaginary copies of the statevector in place,
+    and with a CuPy GPU large statevectors are evolved on the device (see utils.sv_kernels).
+
+    Args:
+        circuit (QuantumCircuit): The quantum circuit.
+        state (numpy.ndarray): The statevector before instruction `start`.
+        unitary (numpy.ndarray or None): The unitary before instruction `start`, or
+            None if it is not tracked.
+        start (int): Index of the first instruction to apply.
+
+    Returns:
+        tuple: (state, unitary, complete), where `complete` is False if a non-unitary
+            instruction was reached (the unitary is then None).
+    """
+    num_qubits = circuit.num_qubits
+    dim = 2**num_qubits
+    psi = state.reshape((2,) * num_qubits)
+    u = unitary.reshape((2,) * num_qubits + (dim,)) if unitary is not None else None
+    # Large statevectors are evolved on the GPU and copied back once at the end
+    on_gpu = use_gpu(num_qubits) and len(circuit.data) > start
+    if on_gpu:
+        psi = to_device(psi)
+    # Real/imaginary copies of psi while single-qubit gates run through the kernel
+    planes = None
+    complete = True
+    for instr in circuit.data[start:]:
+        operation = instr.operation
+        if operation.name in ('barrier', 'save_statevector'):
+            continue
+        try:
+            matrix = standard_gate_matrix(operation.name, tuple(operation.params))
+        except Exception:
+            complete = False
+            u = None
+            break
+        qubits = [circuit.find_bit(q).index for q in instr.qubits]
+        if not on_gpu and len(qubits) == 1 and kernels_ready():
+            if planes is None:
+                # Split copies, so the caller's (possibly cached) state is untouched
+                planes = split_state(psi)
+            apply_single_qubit_gate(*planes, matrix, qubits[0], num_qubits, operation.name)
+        else:
+            if planes is not None:
+                psi = merge_state(*planes).reshape((2,) * num_qubits)
+                planes = None
+            psi = apply_gate_tensor(psi, matrix, qubits, num_qubits)
+        if u is not None:
+            u = apply_gate_tensor(u, matrix, qubits, num_qubits)
+    if planes is not None:
+        psi = merge_state(*planes)
+    if on_gpu:
+        psi = to_host(psi)
+    state = psi.reshape(dim)
+    unitary = u.reshape(dim, dim) if u is not None else None
+    return state, unitary, complete
+
+def strip_simulator_directives(circuit: QuantumCircuit):
+    """
+    Copies a circuit without its Aer simulator directives (e.g. save_statevector).
+
+    The density-matrix simulator and QPY both reject these instructions.
+
+    Args:
+        circuit (QuantumCircuit): The quantum circuit.
+
+    Returns:
+        QuantumCircuit: A copy containing only the circuit's own instructions.
+    """
+    stripped = circuit.copy_empty_like()
+    for instr in circuit.data:
+        if instr.operation.name not in SIMULATOR_DIRECTIVES:
+            stripped.append(instr)
+    return stripped
+
+def simulate_circuit(circuit: QuantumCircuit, with_unitary: bool = True):
+    """
+    Computes the statevector and unitary of a circuit from |0...0> by tensor contraction.
+
+    Args:
+        circuit (QuantumCircuit): The quantum circuit.
+        with_unitary (bool): Whether to compute the unitary as well.
+
+    Returns:
+        tuple: (state, unitary, complete) as returned by evolve_instructions.
+    """
+    dim = 2**circuit.num_qubits
+    state = np.zeros(dim, dtype=TRACKING_DTYPE)
+    state[0] = 1
+    unitary = np.eye(dim, dtype=TRACKING_DTYPE) if with_unitary else None
+    return evolve_instructions(circuit, state, unitary)
+
+def counts_to_arrays(counts: dict):
+    """
+    Converts measurement counts to integer outcomes and shot counts, sorted by outcome.
+
+    Args:
+        counts (dict): Measurement results keyed by bitstring (register separators allowed).
+
+    Returns:
+        tuple: (outcomes, shots) as int64 numpy arrays.
+    """
+    outcomes = np.fromiter(
+        (int(key.replace(' ', ''), 2) for key in counts), dtype=np.int64, count=len(counts)
+    )
+    shots = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+    order = np.argsort(outcomes)
+    return outcomes[order], shots[order]
+
+def circuit_key(circuit: QuantumCircuit):
+    """
+    Builds a hashable key describing a circuit's instructions.
+
+    Args:
+        circuit (QuantumCircuit): The quantum circuit.
+
+    Returns:
+        tuple: The qubit count followed by (name, qubits, params) for each instruction.
+    """
+    instructions = tuple(
+        (
+            instr.operation.name,
+            tuple(circuit.find_bit(q).index for q in instr.qubits),
+            tuple(getattr(instr.operation, 'params', ())),
+        )
+        for instr in circuit.data
+    )
+    return (circuit.num_qubits, instructions)
+
+def canonical_circuit_key(circuit: QuantumCircuit):
+    """
+    Builds a key that is the same for circuits differing only in the order of
+    gates on disjoint qubits (e.g. H on q0 then X on q1, or the reverse).
+
+    Instructions are grouped into ASAP layers of the circuit's wire-dependency
+    graph and sorted by qubits within each layer, so every ordering of the same
+    dependency graph yields the same sequence.
 
     Args:
         circuit (QuantumCircuit): The quantum circuit.
 
     Returns:
-        numpy.ndarray or None: The unitary matrix if computable, else None.
+        tuple: The qubit count followed by (name, qubits, params) for each
+            instruction, in canonical order.
+    """
+    depth = {}
+    layered = []
+    for instr in circuit.data:
+        wires = instr.qubits + instr.clbits
+        layer = 1 + max((depth.get(w, 0) for w in wires), default=0)
+        for w in wires:
+            depth[w] = layer
+        qubits = tuple(circuit.find_bit(q).index for q in instr.qubits)
+        name = instr.operation.name
+        layered.append((layer, qubits, name, tuple(getattr(instr.operation, 'params', ()))))
+    # Instructions of one layer act on disjoint wires, so (layer, qubits, name)
+    # orders them fully without comparing parameters
+    layered.sort(key=lambda entry: entry[:3])
+    return (circuit.num_qubits, tuple((name, qubits, params) for _, qubits, name, params in layered))
+
+def _memoized(cache, kind, circuit, compute, make_key=circuit_key):
     """
+    Returns compute(circuit), reusing the result stored for an identical circuit.
+
+    Results are looked up in the in-memory LRU, then in the persistent store
+    of utils.unitary_cache, and only computed when both miss.
+
+    Args:
+        cache (OrderedDict): The LRU cache to use.
+        kind (bytes): The kind of result in the persistent store (b'U' or b'S').
+        circuit (QuantumCircuit): The quantum circuit.
+        compute (callable): Computes the result (an array or None) from the
+            circuit and its key.
+        make_key (callable): Builds the cache key of a circuit.
+
+    Returns:
+        numpy.ndarray or None: The result, read-only since it is shared by all callers.
+    """
+    key = make_key(circuit)
+    with _cache_lock:
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+    # Loaded or computed without the lock, so a slow unitary does not block the
+    # GUI thread's lookups; two threads may both compute a missing result, and
+    # the later one simply replaces the first
+    result = load_result(kind, key)
+    if result is None:
+        result = compute(circuit, key)
+        if result is not None:
+            store_result(kind, key, result)
+    if result is not None:
+        result.flags.writeable = False
+    with _cache_lock:
+        cache[key] = result
+        cache.move_to_end(key)
+        if len(cache) > RESULT_CACHE_SIZE:
+            cache.popitem(last=False)
+    return result
+
+def clear_result_caches():
+    """
+    Drops the memoized unitaries and statevectors.
+    """
+    with _cache_lock:
+        _unitary_cache.clear()
+        _state_cache.clear()
+
+def _has_matrix(circuit):
+    """Returns whether the circuit is free of measurements, resets and unbound parameters."""
+    if circuit.num_parameters:
+        return False
+    return not any(instr.operation.name in NON_UNITARY_OPERATIONS for instr in circuit.data)
+
+def _compute_full_unitary(circuit, key):
+    """Builds the circuit's Operator and returns its matrix, or None."""
+    if not _has_matrix(circuit):
+        return None
     try:
         operator = Operator(circuit)
         return operator.data
-    except:
+    except QiskitError:
         return None
 
-def get_state_vector(circuit: QuantumCircuit):
+def _compute_state_vector(circuit, key):
+    """Simulates the circuit from |0...0> and returns the amplitudes, or None."""
+    if not _has_matrix(circuit):
+        return None
+    # The GUI passes its tracked state instead and only lands here for circuits
+    # it does not track. Circuits are usually edited by appending gates, so
+    # continue from the longest cached prefix of this circuit. The cache is copied under the lock
+    # since other threads may insert into it while it is scanned
+    with _cache_lock:
+        cached = [(k, state) for k, state in _state_cache.items() if state is not None]
+    best_key, best_state = None, None
+    for prev_key, prev_state in cached:
+        if _is_prefix(prev_key, key) and (best_key is None or len(prev_key[1]) > len(best_key[1])):
+            best_key, best_state = prev_key, prev_state
+    return get_state_vector_incremental(circuit, key, best_key, best_state)
+
+def get_state_vector_incremental(circuit, key, prev_key, prev_state):
     """
-    Computes the state vector of the circuit assuming it starts in |0...0>.
+    Computes the state vector of a circuit, reusing the state of one of its prefixes.
 
     Args:
         circuit (QuantumCircuit): The quantum circuit.
+        key (tuple): circuit_key(circuit).
+        prev_key (tuple or None): circuit_key of a previously simulated circuit.
+        prev_state (numpy.ndarray or None): The state vector of that circuit.
 
     Returns:
         numpy.ndarray or None: The state vector if computable, else None.
     """
     try:
-        state = Statevector.from_instruction(circuit)
-        return state.data
-    except:
+        if prev_key is not None and _is_prefix(prev_key, key):
+            # Apply only the instructions appended since prev_key
+            tail = circuit.copy_empty_like()
+            for instr in circuit.data[len(prev_key[1]):]:
+                tail.append(instr)
+            return Statevector(prev_state).evolve(tail).data
+        return Statevector.from_instruction(circuit).data
+    except QiskitError:
         return None
 
+def _is_prefix(prev_key, key):
+    """Returns whether the circuit of prev_key is the start of the circuit of key."""
+    num_qubits, instructions = key
+    prev_num_qubits, prev_instructions = prev_key
+    return (
+        prev_num_qubits == num_qubits
+        and len(prev_instructions) <= len(instructions)
+        and instructions[:len(prev_instructions)] == prev_instructions
+    )
+
+def get_full_unitary(circuit: QuantumCircuit):
+    """
+    Computes the full unitary matrix of the circuit.
+
+    Args:
+        circuit (QuantumCircuit): The quantum circuit.
+
+    Returns:
+        numpy.ndarray or None: The read-only unitary matrix if computable, else None.
+    """
+    return _memoized(
+        _unitary_cache, b'U', circuit, _compute_full_unitary, make_key=canonical_circuit_key
+    )
+
+def get_state_vector(circuit: QuantumCircuit):
+    """
+    Computes the state vector of the circuit assuming it starts in |0...0>.
+
+    Args:
+        circuit (QuantumCircuit): The quantum circuit.
+
+    Returns:
+        numpy.ndarray or None: The read-only state vector if computable, else None.
+    """
+    return _memoized(_state_cache, b'S', circuit, _compute_state_vector)
+
+def format_amplitudes(values):
+    """
+    Formats every element of an array to two decimals in one vectorized pass.
+
+    Complex values are written like Python's f"{z:.2f}" (e.g. '0.71-0.50j').
+
+    Args:
+        values (numpy.ndarray): The real or complex values.
+
+    Returns:
+        numpy.ndarray: String array of the same shape.
+    """
+    values = np.asarray(values)
+    if not np.iscomplexobj(values):
+        return np.char.mod("%.2f", values)
+    return np.char.add(np.char.mod("%.2f", values.real), np.char.mod("%+.2fj", values.imag))
+
+def _matrix_cells(matrix, hdots, vdots, ddots):
+    """
+    Formats a matrix into rows of cell strings, eliding the middle of large ones.
+
+    Args:
+        matrix (numpy.ndarray): The matrix to format.
+        hdots, vdots, ddots (str): Cells standing for elided columns, rows and both.
+
+    Returns:
+        list: The rows, each a list of cell strings.
+    """
+    if max(matrix.shape) <= MATH_MAX_DIM:
+        return format_amplitudes(matrix).tolist()
+    e = MATH_EDGE_ITEMS
+    corners = format_amplitudes(np.block([
+        [matrix[:e, :e], matrix[:e, -e:]],
+        [matrix[-e:, :e], matrix[-e:, -e:]],
+    ])).tolist()
+    return (
+        [row[:e] + [hdots] + row[e:] for row in corners[:e]]
+        + [[vdots] * e + [ddots] + [vdots] * e]
+        + [row[:e] + [hdots] + row[e:] for row in corners[e:]]
+    )
+
+def _vector_cells(vector, vdots):
+    """
+    Formats a vector into cell strings, eliding the middle of long ones.
+
+    Args:
+        vector (numpy.ndarray): The vector to format.
+        vdots (str): The cell standing for the elided entries.
+
+    Returns:
+        list: The cell strings.
+    """
+    if len(vector) <= MATH_MAX_DIM:
+        return format_amplitudes(vector).tolist()
+    e = MATH_EDGE_ITEMS
+    ends = format_amplitudes(np.concatenate((vector[:e], vector[-e:]))).tolist()
+    return ends[:e] + [vdots] + ends[e:]
+
 def matrix_to_latex(matrix):
     """
     Converts a numpy matrix to a LaTeX bmatrix format.
 
+    Matrices larger than MATH_MAX_DIM show only their corners, separated by
+    dots, followed by the full size.
+
     Args:
         matrix (numpy.ndarray): The matrix to convert.
 
     Returns:
         str: LaTeX-formatted matrix.
     """
-    latex_str = "\\begin{bmatrix}\n"
-    for row in matrix:
-        row_str = " & ".join([f"{elem:.2f}" for elem in row])
-        latex_str += f"{row_str} \\\\\n"
-    latex_str += "\\end{bmatrix}"
-    return latex_str
+    table = _matrix_cells(matrix, "\\cdots", "\\vdots", "\\ddots")
+    rows = "".join(f"{' & '.join(row)} \\\\\n" for row in table)
+    latex = f"\\begin{{bmatrix}}\n{rows}\\end{{bmatrix}}"
+    if max(matrix.shape) > MATH_MAX_DIM:
+        num_rows, num_cols = matrix.shape
+        latex += f"\\quad ({num_rows} \\times {num_cols},\\ \\text{{corners shown}})"
+    return latex
 
 def statevector_to_latex(state_vector):
     """
     Converts a state vector to a LaTeX column vector format.
 
+    Vectors longer than MATH_MAX_DIM show only their first and last entries.
+
     Args:
         state_vector (numpy.ndarray): The state vector to convert.
 
     Returns:
         str: LaTeX-formatted state vector.
     """
-    latex_str = "\\begin{bmatrix}\n"
-    for elem in state_vector:
-        latex_str += f"{elem:.2f} \\\\\n"
-    latex_str += "\\end{bmatrix}"
-    return latex_str
+    rows = "".join(f"{elem} \\\\\n" for elem in _vector_cells(state_vector, "\\vdots"))
+    latex = f"\\begin{{bmatrix}}\n{rows}\\end{{bmatrix}}"
+    if len(state_vector) > MATH_MAX_DIM:
+        latex += f"\\quad ({len(state_vector)}\\ \\text{{entries, ends shown}})"
+    return latex
+
+def matrix_to_html(matrix):
+    """
+    Converts a numpy matrix to a Qt rich-text table.
+
+    Matrices larger than MATH_MAX_DIM show only their corners, like matrix_to_latex.
+
+    Args:
+        matrix (numpy.ndarray): The matrix to convert.
+
+    Returns:
+        str: HTML table of the matrix.
+    """
+    table = _matrix_cells(matrix, "\u22ef", "\u22ee", "\u22f1")
+    rows = "".join(
+        "<tr>" + "".join(f"<td align=\"right\">{cell}</td>" for cell in row) + "</tr>"
+        for row in table
+    )
+    html = f"{_HTML_TABLE_OPEN}{rows}</table>"
+    if max(matrix.shape) > MATH_MAX_DIM:
+        num_rows, num_cols = matrix.shape
+        html += f"<p>({num_rows} \u00d7 {num_cols}, corners shown)</p>"
+    return html
+
+def statevector_to_html(state_vector):
+    """
+    Converts a state vector to a single-column Qt rich-text table.
+
+    Vectors longer than MATH_MAX_DIM show only their first and last entries.
+
+    Args:
+        state_vector (numpy.ndarray): The state vector to convert.
+
+    Returns:
+        str: HTML table of the state vector.
+    """
+    rows = "".join(
+        f"<tr><td align=\"right\">{cell}</td></tr>"
+        for cell in _vector_cells(state_vector, "\u22ee")
+    )
+    html = f"{_HTML_TABLE_OPEN}{rows}</table>"
+    if len(state_vector) > MATH_MAX_DIM:
+        html += f"<p>({len(state_vector)} entries, ends shown)</p>"
+    return html
@@ -0,0 +1,284 @@
+# utils/sv_kernels.py
+
+"""
+Provides compiled kernels that apply gates to a statevector in place.
+
+The kernels work on the statevector split into separate contiguous real and
+imaginary arrays (structure of arrays) rather than interleaved complex numbers,
+so the amplitude loops vectorize with plain float SIMD loads.
+
+Large statevectors can instead be evolved on a GPU through CuPy, whose arrays
+support the same tensordot contraction as NumPy.
+
+Numba and CuPy are optional. Without them HAVE_NUMBA/HAVE_GPU are False and
+callers fall back to the NumPy tensor contraction in utils.qiskit_helpers.
+Compiling the kernels takes around a second, so callers also use NumPy until
+warm_kernels() has finished (see kernels_ready()).
+"""
+
+import threading
+import numpy as np
+
+try:
+    from numba import njit, prange, get_num_threads
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+try:
+    import cupy
+    HAVE_GPU = cupy.cuda.runtime.getDeviceCount() > 0
+except Exception:
+    # Not installed, or installed without a usable CUDA device/driver
+    HAVE_GPU = False
+
+# Smaller statevectors stay on the CPU, where kernel launch and transfer
+# overhead would outweigh the GPU's memory bandwidth
+GPU_MIN_QUBITS = 18
+
+if HAVE_NUMBA:
+    @njit(parallel=True, fastmath=True, boundscheck=False, cache=True)
+    def apply_1q(re, im, g00r, g00i, g01r, g01i, g10r, g10i, g11r, g11i, q, n):
+        """
+        Applies the 2x2 gate [[g00, g01], [g10, g11]] to qubit `q` in place.
+
+        Each iteration updates one pair of amplitudes whose indices differ only in
+        bit `q` (Qiskit is little-endian, so qubit q is bit q of the index).
+
+        Args:
+            re, im (numpy.ndarray): Real and imaginary parts of the statevector,
+                contiguous arrays of length 2**n.
+            g00r, g00i, ... (float): Real and imaginary parts of the gate elements.
+            q (int): Index of the target qubit.
+            n (int): Total number of qubits.
+        """
+        stride = 1 << q
+        for i in prange(1 << (n - 1)):
+            s = ((i >> q) << (q + 1)) | (i & (stride - 1))
+            t = s | stride
+            a_re, a_im = re[s], im[s]
+            b_re, b_im = re[t], im[t]
+            re[s] = g00r * a_re - g00i * a_im + g01r * b_re - g01i * b_im
+            im[s] = g00r * a_im + g00i * a_re + g01r * b_im + g01i * b_re
+            re[t] = g10r * a_re - g10i * a_im + g11r * b_re - g11i * b_im
+            im[t] = g10r * a_im + g10i * a_re + g11r * b_im + g11i * b_re
+
+    # Specialized kernels for the common gates, which need far fewer
+    # multiplications than the generic complex 2x2 update above
+
+    @njit(parallel=True, fastmath=True, boundscheck=False, cache=True)
+    def apply_x(re, im, q, n):
+        """Applies X to qubit `q` in place (swaps each amplitude pair)."""
+        stride = 1 << q
+        for i in prange(1 << (n - 1)):
+            s = ((i >> q) << (q + 1)) | (i & (stride - 1))
+            t = s | stride
+            re[s], re[t] = re[t], re[s]
+            im[s], im[t] = im[t], im[s]
+
+    @njit(parallel=True, fastmath=True, boundscheck=False, cache=True)
+    def apply_z(re, im, q, n):
+        """Applies Z to qubit `q` in place (negates the |1> amplitudes)."""
+        stride = 1 << q
+        for i in prange(1 << (n - 1)):
+            t = ((i >> q) << (q + 1)) | (i & (stride - 1)) | stride
+            re[t] = -re[t]
+            im[t] = -im[t]
+
+    @njit(parallel=True, fastmath=True, boundscheck=False, cache=True)
+    def apply_h(re, im, q, n):
+        """Applies H to qubit `q` in place (scaled sum and difference of each pair)."""
+        stride = 1 << q
+        scale = 0.7071067811865476
+        for i in prange(1 << (n - 1)):
+            s = ((i >> q) << (q + 1)) | (i & (stride - 1))
+            t = s | stride
+            a_re, a_im = re[s], im[s]
+            b_re, b_im = re[t], im[t]
+            re[s] = scale * (a_re + b_re)
+            im[s] = scale * (a_im + b_im)
+            re[t] = scale * (a_re - b_re)
+            im[t] = scale * (a_im - b_im)
+
+    @njit(parallel=True, fastmath=True, boundscheck=False, cache=True)
+    def apply_diagonal(re, im, d0r, d0i, d1r, d1i, q, n):
+        """Applies the diagonal gate diag(d0, d1) to qubit `q` in place."""
+        stride = 1 << q
+        for i in prange(1 << (n - 1)):
+            s = ((i >> q) << (q + 1)) | (i & (stride - 1))
+            t = s | stride
+            a_re, a_im = re[s], im[s]
+            b_re, b_im = re[t], im[t]
+            re[s] = d0r * a_re - d0i * a_im
+            im[s] = d0r * a_im + d0i * a_re
+            re[t] = d1r * b_re - d1i * b_im
+            im[t] = d1r * b_im + d1i * b_re
+
+    @njit(parallel=True, fastmath=True, boundscheck=False, cache=True)
+    def apply_phase(re, im, pr, pi, q, n):
+        """Applies diag(1, p) to qubit `q` in place (only the |1> amplitudes change)."""
+        stride = 1 << q
+        for i in prange(1 << (n - 1)):
+            t = ((i >> q) << (q + 1)) | (i & (stride - 1)) | stride
+            b_re, b_im = re[t], im[t]
+            re[t] = pr * b_re - pi * b_im
+            im[t] = pr * b_im + pi * b_re
+
+# Set once warm_kernels() has compiled every kernel
+_kernels_ready = threading.Event()
+
+# Gate names passed to apply_single_qubit_gate by warm_kernels, one per kernel
+_WARM_GATES = ('x', 'z', 'h', 's', 'rz', None)
+
+# Gates with a specialized kernel; anything else uses the generic apply_1q
+PHASE_GATES = frozenset(('s', 't', 'sdg', 'tdg', 'p'))
+DIAGONAL_GATES = frozenset(('rz',))
+
+def split_state(sv):
+    """
+    Copies a complex statevector into separate real and imaginary arrays.
+
+    Args:
+        sv (numpy.ndarray): The statevector (any shape).
+
+    Returns:
+        tuple: (re, im), contiguous flat arrays of the matching float precision.
+    """
+    return np.ascontiguousarray(sv.real).ravel(), np.ascontiguousarray(sv.imag).ravel()
+
+def merge_state(re, im):
+    """
+    Recombines real and imaginary arrays into a complex statevector.
+
+    Args:
+        re, im (numpy.ndarray): The real and imaginary parts.
+
+    Returns:
+        numpy.ndarray: The complex statevector (complex64 for float32 parts).
+    """
+    sv = np.empty(re.shape, dtype=np.result_type(re.dtype, np.complex64))
+    sv.real = re
+    sv.imag = im
+    return sv
+
+def apply_single_qubit_gate(re, im, matrix, qubit, num_qubits, name=None):
+    """
+    Applies a single-qubit gate matrix in place to a statevector split by split_state.
+
+    Args:
+        re, im (numpy.ndarray): Real and imaginary parts of the statevector.
+        matrix (numpy.ndarray): The 2x2 gate matrix.
+        qubit (int): Index of the target qubit.
+        num_qubits (int): Total number of qubits.
+        name (str): The Qiskit gate name, used to pick a specialized kernel.
+    """
+    if name == 'x':
+        apply_x(re, im, qubit, num_qubits)
+        return
+    if name == 'z':
+        apply_z(re, im, qubit, num_qubits)
+        return
+    if name == 'h':
+        apply_h(re, im, qubit, num_qubits)
+        return
+    # Match the gate to the statevector's precision so the kernel is not upcast
+    g = matrix.astype(np.result_type(re.dtype, np.complex64), copy=False)
+    if name in PHASE_GATES:
+        apply_phase(re, im, g[1, 1].real, g[1, 1].imag, qubit, num_qubits)
+        return
+    if name in DIAGONAL_GATES:
+        apply_diagonal(
+            re, im, g[0, 0].real, g[0, 0].imag, g[1, 1].real, g[1, 1].imag, qubit, num_qubits
+        )
+        return
+    apply_1q(
+        re, im,
+        g[0, 0].real, g[0, 0].imag, g[0, 1].real, g[0, 1].imag,
+        g[1, 0].real, g[1, 0].imag, g[1, 1].real, g[1, 1].imag,
+        qubit, num_qubits,
+    )
+
+def launch_kernel_threads():
+    """
+    Starts Numba's parallel thread pool; call it on the main thread.
+
+    The pool is started by whichever thread first needs it, and a TBB pool started
+    from a worker thread keeps the process from exiting, so this must run before
+    warm_kernels() is handed to a worker.
+    """
+    if HAVE_NUMBA:
+        get_num_threads()
+
+def warm_kernels():
+    """
+    Compiles every kernel for both statevector precisions.
+
+    This takes around a second (less with Numba's on-disk cache), so run it in a
+    worker thread after launch_kernel_threads(); kernels_ready() turns True once
+    it is done.
+    """
+    if not HAVE_NUMBA:
+        return
+    matrix = np.eye(2, dtype=complex)
+    for dtype in (np.complex64, np.complex128):
+        re, im = split_state(np.zeros(2, dtype=dtype))
+        for name in _WARM_GATES:
+            apply_single_qubit_gate(re, im, matrix, 0, 1, name)
+    _kernels_ready.set()
+
+def kernels_ready():
+    """
+    Returns whether the compiled kernels can be used without a JIT pause.
+
+    Returns:
+        bool: True if Numba is installed and warm_kernels() has finished.
+    """
+    return _kernels_ready.is_set()
+
+def use_gpu(num_qubits):
+    """
+    Returns whether a statevector of this size should be evolved on the GPU.
+
+    Args:
+        num_qubits (int): The number of qubits.
+
+    Returns:
+        bool: True if a GPU is available and the state is large enough to benefit.
+    """
+    return HAVE_GPU and num_qubits >= GPU_MIN_QUBITS
+
+def array_module(array):
+    """
+    Returns the array module (numpy or cupy) that owns an array.
+
+    Args:
+        array: A NumPy or CuPy array.
+
+    Returns:
+        module: numpy or cupy.
+    """
+    return cupy.get_array_module(array) if HAVE_GPU else np
+
+def to_device(array):
+    """
+    Copies a NumPy array to the GPU.
+
+    Args:
+        array (numpy.ndarray): The host array.
+
+    Returns:
+        cupy.ndarray: The device array.
+    """
+    return cupy.asarray(array)
+
+def to_host(array):
+    """
+    Copies a GPU array back to host memory.
+
+    Args:
+        array (cupy.ndarray): The device array.
+
+    Returns:
+        numpy.ndarray: The host array.
+    """
+    return cupy.asnumpy(array)
@@ -0,0 +1,156 @@
+# utils/unitary_cache.py
+
+"""
+Persists computed unitaries and state vectors across sessions in an LMDB store.
+
+Results are keyed by a SHA-256 digest of the circuit's circuit_key and stored
+in numpy's .npy format, so reopening a previously edited circuit does not
+recompute them.
+
+The store is bounded by CACHE_MAP_SIZE; when a write does not fit, every
+stored result is dropped and the write is retried, so the store keeps working
+with the most recent results. Entries that cannot be read back (e.g. written
+by an interrupted session) are deleted and treated as misses.
+
+LMDB is optional (`pip install lmdb`). Without it (or if the store cannot be
+opened) HAVE_LMDB is False and every lookup misses.
+"""
+
+import hashlib
+import io
+import os
+import threading
+import numpy as np
+
+try:
+    import lmdb
+    HAVE_LMDB = True
+except ImportError:
+    HAVE_LMDB = False
+
+# Location of the store and the largest size it may grow to (bytes); kept small
+# because on Windows LMDB allocates the whole map on disk up front
+CACHE_PATH = os.path.join(os.path.expanduser("~"), ".ezqubit_cache")
+CACHE_MAP_SIZE = 64 << 20
+
+# Opened on first use
+_env = None
+
+# Serializes opening the store; LMDB refuses to open it twice in one process
+_env_lock = threading.Lock()
+
+def _environment():
+    """
+    Opens the store on first use.
+
+    Returns:
+        lmdb.Environment or None: The store, or None if it is unavailable.
+    """
+    global _env, HAVE_LMDB
+    with _env_lock:
+        if _env is None and HAVE_LMDB:
+            try:
+                _env = lmdb.open(CACHE_PATH, map_size=CACHE_MAP_SIZE)
+            except lmdb.Error:
+                # e.g. the home directory is read-only; run without persistence
+                HAVE_LMDB = False
+        return _env
+
+def close_store():
+    """
+    Closes the store; the next lookup or write opens it again.
+    """
+    global _env
+    with _env_lock:
+        if _env is not None:
+            _env.close()
+            _env = None
+
+def _db_key(kind, key):
+    """
+    Builds the store key of a result.
+
+    Args:
+        kind (bytes): The kind of result (b'U' for unitaries, b'S' for state vectors).
+        key (tuple): The circuit_key of the circuit.
+
+    Returns:
+        bytes: The kind followed by the SHA-256 digest of the key.
+    """
+    return kind + hashlib.sha256(repr(key).encode()).digest()
+
+def load_result(kind, key):
+    """
+    Looks up a stored result.
+
+    Args:
+        kind (bytes): The kind of result (b'U' or b'S').
+        key (tuple): The circuit_key of the circuit.
+
+    Returns:
+        numpy.ndarray or None: The stored array, or None if it is not stored.
+    """
+    env = _environment()
+    if env is None:
+        return None
+    db_key = _db_key(kind, key)
+    try:
+        with env.begin() as txn:
+            data = txn.get(db_key)
+        if data is None:
+            return None
+        return np.load(io.BytesIO(data), allow_pickle=False)
+    except (ValueError, OSError, EOFError, lmdb.Error):
+        # Truncated or otherwise unreadable entry; drop it so it is recomputed
+        _discard(env, db_key)
+        return None
+
+def store_result(kind, key, array):
+    """
+    Stores a result for later sessions.
+
+    Args:
+        kind (bytes): The kind of result (b'U' or b'S').
+        key (tuple): The circuit_key of the circuit.
+        array (numpy.ndarray): The result.
+    """
+    env = _environment()
+    if env is None:
+        return
+    buffer = io.BytesIO()
+    np.save(buffer, array, allow_pickle=False)
+    db_key, data = _db_key(kind, key), buffer.getvalue()
+    if len(data) > CACHE_MAP_SIZE // 4:
+        # Would evict most of the store for one result; keep it in memory only
+        return
+    try:
+        with env.begin(write=True) as txn:
+            txn.put(db_key, data)
+    except lmdb.MapFullError:
+        # Start over rather than stop persisting. The pages are freed in their
+        # own transaction, since LMDB only reuses pages freed by committed ones
+        try:
+            with env.begin(write=True) as txn:
+                txn.drop(env.open_db(), delete=False)
+            with env.begin(write=True) as txn:
+                txn.put(db_key, data)
+        except lmdb.MapFullError:
+            # Larger than the whole store; the result is still cached in memory
+            pass
+    except lmdb.Error:
+        # e.g. the disk is full; the result is still cached in memory
+        pass
+
+def _discard(env, db_key):
+    """
+    Deletes a stored entry, ignoring errors.
+
+    Args:
+        env (lmdb.Environment): The store.
+        db_key (bytes): The store key of the entry.
+    """
+    try:
+        with env.begin(write=True) as txn:
+            txn.delete(db_key)
+    except lmdb.Error:
+        pass